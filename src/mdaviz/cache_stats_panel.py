@@ -0,0 +1,165 @@
+"""
+Dockable panel showing live data cache statistics.
+
+This module provides a dock widget that periodically polls
+:meth:`mdaviz.data_cache.DataCache.get_stats` and displays the counters and
+decode latencies, with an option to save a snapshot to JSON.
+
+.. autosummary::
+
+    ~CacheStatsPanel
+"""
+
+from pathlib import Path
+from typing import Optional
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtWidgets import (
+    QDockWidget,
+    QFileDialog,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+from mdaviz.data_cache import DataCache, get_global_cache
+from mdaviz.utils import human_readable_size
+from mdaviz.logger import get_logger
+
+# Get logger for this module
+logger = get_logger("cache_stats_panel")
+
+REFRESH_INTERVAL_MS = 1000
+LATENCY_HEADERS = ("Class", "Count", "p50 (ms)", "p95 (ms)", "max (ms)")
+
+
+class CacheStatsPanel(QDockWidget):
+    """
+    Dock widget displaying hit/miss/eviction counters, memory use and
+    decode-latency percentiles of a DataCache.
+
+    The display refreshes once per second while the panel is visible.
+    """
+
+    def __init__(
+        self, parent: Optional[QWidget] = None, cache: Optional[DataCache] = None
+    ):
+        """
+        Initialize the statistics panel.
+
+        Parameters:
+            parent (QWidget, optional): Parent widget (usually the MainWindow)
+            cache (DataCache, optional): Cache to monitor; defaults to the global cache
+        """
+        super().__init__("Cache Statistics", parent)
+        self.setObjectName("cacheStatsPanel")
+        self._cache = cache
+        self._setup_ui()
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(REFRESH_INTERVAL_MS)
+        self._timer.timeout.connect(self.refresh)
+        self.visibilityChanged.connect(self._on_visibility_changed)
+
+    def cache(self) -> DataCache:
+        """The monitored cache (the global cache unless one was given)."""
+        return self._cache if self._cache is not None else get_global_cache()
+
+    def _setup_ui(self) -> None:
+        """Set up the panel widgets."""
+        container = QWidget(self)
+        layout = QVBoxLayout(container)
+
+        self.summary_label = QLabel(container)
+        self.summary_label.setTextInteractionFlags(
+            Qt.TextInteractionFlag.TextSelectableByMouse
+        )
+        layout.addWidget(self.summary_label)
+
+        self.latency_table = QTableWidget(0, len(LATENCY_HEADERS), container)
+        self.latency_table.setHorizontalHeaderLabels(LATENCY_HEADERS)
+        self.latency_table.verticalHeader().setVisible(False)
+        self.latency_table.horizontalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.ResizeToContents
+        )
+        layout.addWidget(self.latency_table)
+
+        buttons = QHBoxLayout()
+        self.reset_button = QPushButton("Reset", container)
+        self.reset_button.setToolTip("Reset counters and latency samples")
+        self.reset_button.clicked.connect(self.onReset)
+        self.save_button = QPushButton("Save JSON ...", container)
+        self.save_button.setToolTip("Save a snapshot of the statistics to a JSON file")
+        self.save_button.clicked.connect(self.onSave)
+        buttons.addStretch()
+        buttons.addWidget(self.reset_button)
+        buttons.addWidget(self.save_button)
+        layout.addLayout(buttons)
+
+        self.setWidget(container)
+
+    def _on_visibility_changed(self, visible: bool) -> None:
+        """Only poll the cache while the panel is shown."""
+        if visible:
+            self.refresh()
+            self._timer.start()
+        else:
+            self._timer.stop()
+
+    def refresh(self) -> None:
+        """Re-read the cache statistics and update the display."""
+        stats = self.cache().get_stats()
+        self.summary_label.setText(
+            "\n".join(
+                [
+                    f"Entries: {stats['entry_count']} / {stats['max_entries']}",
+                    f"Size: {stats['current_size_mb']:.1f} / {stats['max_size_mb']:.0f} MB"
+                    f" ({stats['utilization_percent']:.0f}%)",
+                    f"Hits: {stats['hits']}   Misses: {stats['misses']}"
+                    f"   Hit rate: {stats['hit_rate_percent']:.1f}%",
+                    f"Pinned: {stats['pinned_count']} entries,"
+                    f" {stats['pinned_size_mb']:.1f} MB",
+                    f"Evictions: {stats['evictions']}",
+                    f"Loaded: {stats['files_loaded']} files,"
+                    f" {human_readable_size(stats['bytes_loaded'])}",
+                ]
+            )
+        )
+
+        latency = stats["decode_latency"]
+        self.latency_table.setRowCount(len(latency))
+        for row, (file_class, values) in enumerate(latency.items()):
+            cells = [
+                file_class,
+                str(values["count"]),
+                f"{values['p50_ms']:.1f}",
+                f"{values['p95_ms']:.1f}",
+                f"{values['max_ms']:.1f}",
+            ]
+            for column, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                if column > 0:
+                    item.setTextAlignment(
+                        Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+                    )
+                self.latency_table.setItem(row, column, item)
+
+    def onReset(self) -> None:
+        """Reset the cache counters and refresh the display."""
+        self.cache().reset_stats()
+        self.refresh()
+
+    def onSave(self) -> None:
+        """Ask for a file name and dump the statistics to JSON."""
+        file_name, _ = QFileDialog.getSaveFileName(
+            self,
+            "Save Cache Statistics",
+            str(Path.home() / "mdaviz_cache_stats.json"),
+            "JSON files (*.json)",
+        )
+        if file_name:
+            if not self.cache().dump_stats(Path(file_name)):
+                logger.warning(f"Could not save cache statistics to {file_name}")
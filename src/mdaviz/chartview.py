@@ -39,6 +39,7 @@ Usage:
 """
 
 import datetime
+from contextlib import contextmanager
 from functools import partial
 from itertools import cycle
 from typing import Optional
@@ -48,9 +49,12 @@ from PyQt6.QtCore import QTimer, Qt
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QSizePolicy, QApplication
 from mdaviz import utils
 from mdaviz.fit_manager import FitManager
+from mdaviz.lazy_loading_config import get_config
 from mdaviz.user_settings import settings
 from mdaviz.logger import get_logger
+from mdaviz.curve_decimation import DecimatedCurve
 from mdaviz.curve_manager import CurveManager
+from mdaviz.curve_statistics import CurveStatistics
 
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
@@ -131,12 +135,14 @@ class ChartView(QWidget):
 
     .. autosummary::
 
+        ~ChartView.batchUpdate
         ~ChartView.calculateCursors
         ~ChartView.clearAllFits
         ~ChartView.clearCursors
         ~ChartView.clearPlot
         ~ChartView.closeEvent
         ~ChartView.configPlot
+        ~ChartView.extendPlot
         ~ChartView.getCursorRange
         ~ChartView.getSelectedCurveID
         ~ChartView.performFit
@@ -232,6 +238,10 @@ class ChartView(QWidget):
         # Track curves and display in QComboBox:
         self.plotObjects = {}  # all the Line2D on the graph, key = curveID
         self.fitObjects = {}  # all the fit Line2D on the graph, key = curveID
+        self._liveYData = {}  # (offset, factor, buffer, y) of growing curves
+        self._liveStats = {}  # ((offset, factor, points), stats) of growing curves
+        self._batch = None  # updates deferred by batchUpdate()
+        self._lodCurves = {}  # DecimatedCurve of the large curves, key = curveID
         self.curveBox = self.mda_mvc.mda_file_viz.curveBox
         self.curveBox.currentIndexChanged.connect(self.onCurveSelected)
 
@@ -239,6 +249,7 @@ class ChartView(QWidget):
         self.curveManager = CurveManager(self)
         self.curveManager.curveAdded.connect(self.onCurveAdded)
         self.curveManager.curveUpdated.connect(self.onCurveUpdated)
+        self.curveManager.curveExtended.connect(self.onCurveExtended)
         self.curveManager.curveRemoved.connect(self.onCurveRemoved)
         self.curveManager.allCurvesRemoved.connect(self.onAllCurvesRemoved)
 
@@ -301,6 +312,9 @@ class ChartView(QWidget):
 
         # Connect the click event to a handler
         self.cid = self.figure.canvas.mpl_connect("button_press_event", self.onclick)
+        # Decimate large curves again when zoomed, panned or resized
+        self.main_axes.callbacks.connect("xlim_changed", self._updateLevelOfDetail)
+        self.figure.canvas.mpl_connect("resize_event", self._updateLevelOfDetail)
         self.alt_pressed = False
 
         # Set up a timer to check modifier key state
@@ -539,6 +553,7 @@ class ChartView(QWidget):
         try:
             plot_obj = self.main_axes.plot(*ds, **ds_options)[0]
             self.plotObjects[curveID] = plot_obj
+            self._setLineData(curveID, *ds)
         except Exception as exc:
             logger.error(str(exc))
 
@@ -554,6 +569,31 @@ class ChartView(QWidget):
         file_path = curveData.get("file_path", "No file path available")
         self.curveBox.setItemData(index, file_path, QtCore.Qt.ItemDataRole.ToolTipRole)
 
+        # Reset toolbar navigation history when the first curve from a new file is added,
+        # so 'home' always reflects the combined bounds of all currently plotted scans.
+        file_path = curveData.get("file_path", "")
+        curves_from_file = [
+            cid
+            for cid, cd in self.curveManager.curves().items()
+            if cd.get("file_path") == file_path
+        ]
+        reset_toolbar = len(curves_from_file) == 1
+
+        if self._batch is not None:
+            # Done once for all the curves added, at the end of batchUpdate()
+            self._batch["added"] = True
+            self._batch["reset_toolbar"] |= reset_toolbar
+            return
+        self._onCurvesAdded(reset_toolbar)
+
+    def _onCurvesAdded(self, reset_toolbar):
+        """
+        Update the plot and the curve selection after curves were added.
+
+        Parameters:
+            reset_toolbar (bool): Reset the toolbar navigation history (a
+                curve from a new file was added)
+        """
         # Only select the new curve if it's the first one
         if self.curveBox.count() == 1:
             self.curveBox.setCurrentIndex(0)
@@ -569,15 +609,7 @@ class ChartView(QWidget):
         # Refresh axis labels, legend, limits, and redraw the plot:
         self.updatePlot(update_title=True)
 
-        # Reset toolbar navigation history when the first curve from a new file is added,
-        # so 'home' always reflects the combined bounds of all currently plotted scans.
-        file_path = curveData.get("file_path", "")
-        curves_from_file = [
-            cid
-            for cid, cd in self.curveManager.curves().items()
-            if cd.get("file_path") == file_path
-        ]
-        if len(curves_from_file) == 1:
+        if reset_toolbar:
             self.toolbar.update()
 
         # Select the last plotted curve in the comboBox and syncs UI to the curve selected:
@@ -589,6 +621,40 @@ class ChartView(QWidget):
             self.curveBox.blockSignals(False)
             self.onCurveSelected(new_index)
 
+    @contextmanager
+    def batchUpdate(self):
+        """
+        Context manager adding or updating many curves with a single redraw.
+
+        Within the context, the plot is not updated after each curve: the
+        combo box, unscaled curves, axes limits, legend and selected curve
+        are updated once on exit, and the canvas is redrawn when the event
+        loop is idle. Contexts can be nested (the outermost one updates).
+
+        Example::
+
+            with chartview.batchUpdate():
+                for row, (ds, ds_options) in zip(rows, datasets):
+                    chartview.plot(row, *ds, **options)
+        """
+        if self._batch is not None:
+            yield self
+            return
+        self._batch = dict(
+            added=False, reset_toolbar=False, update_plot=False, update_title=False
+        )
+        try:
+            yield self
+        finally:
+            batch = self._batch
+            try:
+                if batch["added"]:
+                    self._onCurvesAdded(batch["reset_toolbar"])
+            finally:
+                self._batch = None
+            if batch["update_plot"]:
+                self.updatePlot(update_title=batch["update_title"], idle=True)
+
     def onCurveUpdated(self, curveID, recompute_y=False, update_x=False):
         """
         Handle updates to an existing curve on the plot.
@@ -602,6 +668,7 @@ class ChartView(QWidget):
             f"onCurveUpdated called for {curveID}, recompute_y={recompute_y}, update_x={update_x}"
         )
         curve_data = self.curveManager.getCurveData(curveID)
+        self._liveStats.pop(curveID, None)
 
         # Apply transformations
         if curve_data and recompute_y:
@@ -617,7 +684,7 @@ class ChartView(QWidget):
                     and y_transformed is not None
                     and curveID in self.plotObjects
                 ):
-                    self.plotObjects[curveID].set_ydata(y_transformed)
+                    self._setLineData(curveID, x_data, y_transformed)
 
         # Handle label changes (e.g., I0 normalization)
         # Only if we're not recreating the plot object (i.e. not update_x)
@@ -689,12 +756,82 @@ class ChartView(QWidget):
             try:
                 plot_obj = self.main_axes.plot(*ds, **ds_options)[0]
                 self.plotObjects[curveID] = plot_obj
+                self._setLineData(curveID, *ds)
             except Exception as exc:
                 logger.error(str(exc))
 
         # Refresh axis labels, legend, limits, and redraw the plot:
         self.updatePlot(update_title=False)
 
+    def onCurveExtended(self, curveID, first):
+        """
+        Draw the points appended to a growing curve (live acquisition).
+
+        Only the new points are transformed (offset and factor), added to
+        the axes data limits and to the curve statistics; the canvas is
+        redrawn when the event loop is idle. Derivative and unscaled curves
+        depend on all their points and are transformed again entirely.
+
+        Parameters:
+            curveID (str): The unique identifier of the extended curve.
+            first (int): Index of the first appended point.
+        """
+        curve_data = self.curveManager.getCurveData(curveID)
+        plot_obj = self.plotObjects.get(curveID)
+        if curve_data is None or plot_obj is None:
+            return
+        x_data, original_y = curve_data["ds"][0], curve_data["original_y"]
+        offset = curve_data.get("offset", 0)
+        factor = curve_data.get("factor", 1)
+        appended = first
+
+        if curve_data.get("derivative", False) or curve_data.get("unscale", False):
+            self._liveYData.pop(curveID, None)
+            self._liveStats.pop(curveID, None)
+            x_data, y_data = self.curveManager.getTransformedCurveXYData(curveID)
+            self._setLineData(curveID, x_data, y_data)
+            self.main_axes.relim()
+        else:
+            if offset == 0 and factor == 1:
+                self._liveYData.pop(curveID, None)
+                y_data = original_y
+            else:
+                # Transform the new points only, into a buffer as large as
+                # the curve buffer (the transformed points are kept while
+                # offset and factor do not change).
+                capacity = len(curve_data.get("live_buffers", (None, original_y))[1])
+                base = original_y.base
+                previous = self._liveYData.get(curveID)
+                if (
+                    previous is None
+                    or previous[:2] != (offset, factor)
+                    or previous[2] is not base
+                    or len(previous[3]) < len(original_y)
+                ):
+                    y_buffer = numpy.empty(capacity)
+                    first = 0
+                else:
+                    y_buffer = previous[3]
+                y_buffer[first : len(original_y)] = offset + factor * original_y[first:]
+                self._liveYData[curveID] = (offset, factor, base, y_buffer)
+                y_data = y_buffer[: len(original_y)]
+            self._setLineData(curveID, x_data, y_data, first)
+            tail = numpy.column_stack((x_data[first:], y_data[first:]))
+            self.main_axes.update_datalim(tail[numpy.isfinite(tail).all(axis=1)])
+
+            previous = self._liveStats.get(curveID)
+            if previous is None or previous[0] != (offset, factor, appended):
+                stats, appended = CurveStatistics(), 0
+            else:
+                stats = previous[1]
+            stats.append(x_data[appended:], y_data[appended:])
+            self._liveStats[curveID] = ((offset, factor, len(y_data)), stats)
+        self.main_axes.autoscale_view()
+
+        if curveID == self.getSelectedCurveID():
+            self.updateBasicMathInfo(curveID)
+        self.canvas.draw_idle()
+
     def onRemoveButtonClicked(self):
         """
         Handle the remove button click event.
@@ -739,6 +876,9 @@ class ChartView(QWidget):
         """
 
         curveID, curveData, count = arg
+        self._liveYData.pop(curveID, None)
+        self._liveStats.pop(curveID, None)
+        self._lodCurves.pop(curveID, None)
 
         # Remove curve from graph & plotObject dict
         if curveID in self.plotObjects:
@@ -859,9 +999,61 @@ class ChartView(QWidget):
             if curve_data.get("unscale", False) and cid in self.plotObjects:
                 x_data, y_transformed = self.curveManager.getTransformedCurveXYData(cid)
                 if y_transformed is not None:
-                    self.plotObjects[cid].set_ydata(y_transformed)
+                    self._setLineData(cid, x_data, y_transformed)
         self.updatePlot(update_title=False)
 
+    def _setLineData(self, curveID, x_data, y_data, first=None):
+        """
+        Set the (transformed) data of a curve's line.
+
+        Curves with at least plot_decimation_min_points points are drawn
+        decimated to the current view (see DecimatedCurve); cursors, fits and
+        statistics use the full data from the curve manager. The
+        DecimatedCurve of a curve is kept while its data do not change, and
+        extended with the new points of a growing curve.
+
+        Parameters:
+            curveID (str): The unique identifier of the curve.
+            x_data, y_data (array-like): Data of the curve.
+            first (int, optional): Index of the first point appended since
+                the last call (the points before are unchanged); None if any
+                point may have changed.
+        """
+        plot_obj = self.plotObjects.get(curveID)
+        if plot_obj is None:
+            return
+        min_points = get_config().plot_decimation_min_points
+        if min_points and len(x_data) >= min_points:
+            curve = self._lodCurves.get(curveID)
+            if curve is None:
+                curve = DecimatedCurve(x_data, y_data)
+            elif first is not None and first == len(curve):
+                curve.extend(x_data, y_data, first)
+            elif curve.x is not x_data or curve.y is not y_data:
+                curve = DecimatedCurve(x_data, y_data)
+            if curve.decimated:
+                self._lodCurves[curveID] = curve
+                plot_obj.set_data(*curve.view(*self._levelOfDetailView()))
+                return
+        self._lodCurves.pop(curveID, None)
+        plot_obj.set_data(x_data, y_data)
+
+    def _levelOfDetailView(self):
+        """(X range, width in pixels, log X) of the axes, to decimate curves."""
+        width = max(int(self.main_axes.bbox.width), 1)
+        log_x = self.main_axes.get_xscale() == "log"
+        return self.main_axes.get_xlim(), width, log_x
+
+    def _updateLevelOfDetail(self, *args):
+        """Decimate the large curves for the new view (X range or plot width)."""
+        if not self._lodCurves:
+            return
+        view = self._levelOfDetailView()
+        for curveID, curve in self._lodCurves.items():
+            plot_obj = self.plotObjects.get(curveID)
+            if plot_obj is not None:
+                plot_obj.set_data(*curve.view(*view))
+
     # ==========================================
     #   UI methods
     # ==========================================
@@ -871,8 +1063,20 @@ class ChartView(QWidget):
         self.main_axes.axis("on")
         self.curveManager.addCurve(row, *ds, **options)
 
-    def configPlot(self, grid=True):
-        """Apply axis labels, title, and grid; redraw canvas."""
+    def extendPlot(self, row, *ds, **options):
+        """
+        Append the new points of a curve being acquired (live plotting).
+
+        Same arguments as :meth:`plot`, with the whole curve acquired so far.
+
+        Returns:
+            bool: True if the plotted curve is up to date, False if the data
+            does not extend it (then use :meth:`plot`)
+        """
+        return self.curveManager.extendCurve(row, *ds, **options)
+
+    def configPlot(self, grid=True, draw=True):
+        """Apply axis labels, title, and grid; redraw canvas (unless draw is False)."""
         self.setLeftAxisText(self.ylabel())
         self.setBottomAxisText(self.xlabel())
         self.setPlotTitle(self.title())
@@ -880,10 +1084,18 @@ class ChartView(QWidget):
             self.main_axes.grid(True, color="#cccccc", linestyle="-", linewidth=0.5)
         else:
             self.main_axes.grid(False)
-        self.canvas.draw()
+        if draw:
+            self.canvas.draw()
 
-    def updatePlot(self, update_title=True):
-        """Refresh axis labels, legend, limits, selected curve stats and redraw the plot."""
+    def updatePlot(self, update_title=True, idle=False):
+        """Refresh axis labels, legend, limits, selected curve stats and redraw the plot.
+
+        Deferred to the end of batchUpdate() when called within it. The canvas
+        is redrawn when the event loop is idle if idle is True."""
+        if self._batch is not None:
+            self._batch["update_plot"] = True
+            self._batch["update_title"] |= update_title
+            return
 
         # Collect positioner PVs from all curves and update x label:
         x_label_set = set()
@@ -927,8 +1139,11 @@ class ChartView(QWidget):
         self.main_axes.relim()
         self.main_axes.autoscale_view()
         self.updateLegend()
-        self.configPlot()
-        self.canvas.draw()
+        self.configPlot(draw=False)
+        if idle:
+            self.canvas.draw_idle()
+        else:
+            self.canvas.draw()
 
     def updateLegend(self):
         """Refresh the axes legend from current curve labels (excluding internal ones)."""
@@ -950,7 +1165,10 @@ class ChartView(QWidget):
         self.clearAllFits()
         self.figure.canvas.draw()
         self.plotObjects = {}
+        self._lodCurves = {}
         self.curveBox.clear()
+        # Axes.clear() dropped the axes callbacks
+        self.main_axes.callbacks.connect("xlim_changed", self._updateLevelOfDetail)
 
     # ==========================================
     #   Interaction with UI elements
@@ -1130,16 +1348,21 @@ class ChartView(QWidget):
         self.updateBasicMathInfo(curveID)
 
     def updateBasicMathInfo(self, curveID):
-        """Update min/max/COM/mean labels from the curve's transformed data, or clear them if no valid curve."""
+        """Update min/max/COM/mean labels from the curve's transformed data, or clear them if no valid curve.
+
+        The statistics of growing curves are kept up to date by onCurveExtended
+        and are not computed again."""
         if curveID and curveID in self.curveManager.curves():
             try:
-                x, y = self.curveManager.getTransformedCurveXYData(curveID)
+                stats = self._liveStatistics(curveID)
+                if stats is None:
+                    x, y = self.curveManager.getTransformedCurveXYData(curveID)
 
-                if x is None or y is None:
-                    self.clearBasicMath()
-                    return
+                    if x is None or y is None:
+                        self.clearBasicMath()
+                        return
 
-                stats = self.calculateBasicMath(x, y)
+                    stats = self.calculateBasicMath(x, y)
                 for i, txt in zip(
                     stats, ["min_text", "max_text", "com_text", "mean_text"]
                 ):
@@ -1155,6 +1378,21 @@ class ChartView(QWidget):
         else:
             self.clearBasicMath()
 
+    def _liveStatistics(self, curveID):
+        """Statistics of a growing curve if up to date (see calculateBasicMath), else None."""
+        previous = self._liveStats.get(curveID)
+        curve_data = self.curveManager.getCurveData(curveID)
+        if previous is None or curve_data is None:
+            return None
+        if curve_data.get("derivative", False) or curve_data.get("unscale", False):
+            return None
+        key = (
+            curve_data.get("offset", 0),
+            curve_data.get("factor", 1),
+            len(curve_data["original_y"]),
+        )
+        return previous[1].result() if previous[0] == key else None
+
     def clearBasicMath(self):
         """Clear min/max/COM/mean labels (set to 'n/a')"""
         for txt in ["min_text", "max_text", "com_text", "mean_text"]:
@@ -1698,9 +1936,11 @@ class ChartView2D(ChartView):
         _plot_type: Current plot type ("heatmap" or "contour")
         _current_colorbar: Reference to the current colorbar object
         _log_y_2d: Boolean flag for logarithmic color scale
+        _live_heatmap: Image and color range of a 2D scan being acquired
 
     Key Features:
         - Heatmap visualization using imshow
+        - Live heatmap of scans in progress, filled in row by row
         - Contour plot visualization with customizable levels
         - Logarithmic color scale support
         - Automatic axis scaling and labeling
@@ -1721,6 +1961,8 @@ class ChartView2D(ChartView):
         ~ChartView2D.showMessage
         ~ChartView2D._plot_heatmap
         ~ChartView2D._plot_contour
+        ~ChartView2D._plot_live_heatmap
+        ~ChartView2D._updateLiveHeatmap
         ~ChartView2D._set_2d_labels
     """
 
@@ -1729,6 +1971,7 @@ class ChartView2D(ChartView):
         self._2d_data = None
         self._plot_type = "heatmap"  # "heatmap" or "contour"
         self._current_colorbar = None  # Store reference to current colorbar
+        self._live_heatmap = None  # live heatmap state, see _plot_live_heatmap
 
         # The parent ChartView wires curveBox.currentIndexChanged -> onCurveSelected
         # to manage 1D curve UI. That handler ends in updatePlot()->configPlot(),
@@ -1742,9 +1985,9 @@ class ChartView2D(ChartView):
         except TypeError:
             pass
 
-    def configPlot(self, grid=False):
+    def configPlot(self, grid=False, draw=True):
         """Apply axis labels and title; no grid for 2D plots."""
-        super().configPlot(grid=grid)
+        super().configPlot(grid=grid, draw=draw)
 
     def plot2D(self, y_data, x_data, x2_data, plot_options=None):
         """
@@ -1790,7 +2033,14 @@ class ChartView2D(ChartView):
         logger.debug(f"  Canvas exists: {self.canvas is not None}")
         logger.debug(f"  Main axes exists: {self.main_axes is not None}")
 
+        # Scan in progress: only write the new rows into the live heatmap
+        if self._plot_type == "heatmap" and self._updateLiveHeatmap(
+            y_data, x_data, x2_data, plot_options
+        ):
+            return
+
         # Clear the previous plot
+        self._live_heatmap = None
         self.figure.clear()
         self.main_axes = self.figure.add_subplot(111)
         # Reset to default subplot parameters
@@ -1837,6 +2087,13 @@ class ChartView2D(ChartView):
         Returns:
             None: Updates the main axes with the heatmap plot
         """
+        # Scan in progress: plot the whole scan, to be filled in row by row
+        if (plot_options.get("x2_points") or 0) > len(x2_data):
+            self._plot_live_heatmap(
+                y_data, x_data, x2_data, plot_options, color_palette
+            )
+            return
+
         # Check if X2 data is in descending order (reverse scan direction)
         # If so, flip the Y data vertically to match the expected orientation
         if len(x2_data) > 1 and x2_data[0] > x2_data[-1]:
@@ -1900,6 +2157,203 @@ class ChartView2D(ChartView):
             im, ax=self.main_axes, label=plot_options.get("y_unit", "")
         )
 
+    def _plot_live_heatmap(self, y_data, x_data, x2_data, plot_options, color_palette):
+        """Plot the heatmap of a 2D scan in progress.
+
+        The image covers the whole scan (``plot_options["x2_points"]`` rows):
+        the rows not acquired yet are NaN (not drawn) and the X2 extent is
+        extrapolated from the step of the acquired rows. The image, its color
+        range and the acquired rows are kept in ``_live_heatmap`` so that
+        :meth:`_updateLiveHeatmap` only writes the rows acquired since.
+
+        Parameters:
+            y_data: 2D array of detector data (acquired rows)
+            x_data: 1D array of X positioner data
+            x2_data: 1D array of X2 positioner data (acquired rows)
+            plot_options: Dictionary containing plot options and metadata
+            color_palette: Matplotlib colormap name for the heatmap
+
+        Returns:
+            None: Updates the main axes with the heatmap plot
+        """
+        total = plot_options["x2_points"]
+        live = {
+            "key": self._liveHeatmapKey(x_data, x2_data, plot_options),
+            "total": total,
+            "rows": 0,  # acquired rows written in the image
+            "flip_x": bool(x_data[0] > x_data[-1]),
+            "flip_x2": bool(x2_data[0] > x2_data[-1]),
+            # Color range of each acquired row: min, max, min > 0, max > 0
+            "row_min": numpy.full(total, numpy.inf),
+            "row_max": numpy.full(total, -numpy.inf),
+            "row_pos_min": numpy.full(total, numpy.inf),
+            "row_pos_max": numpy.full(total, -numpy.inf),
+        }
+        image_data = numpy.full((total, x_data.size), numpy.nan)
+        self._writeLiveRows(live, image_data, y_data)
+        color_range = self._liveColorRange(live, plot_options)
+        if color_range is None:
+            self.main_axes.text(
+                0.5,
+                0.5,
+                "Log scale requires positive data",
+                ha="center",
+                va="center",
+                transform=self.main_axes.transAxes,
+                fontsize=12,
+                color="red",
+            )
+            return
+        if getattr(self, "_log_y_2d", False):
+            from matplotlib.colors import LogNorm
+
+            norm = LogNorm(*color_range)
+        else:
+            from matplotlib.colors import Normalize
+
+            norm = Normalize(*color_range)
+
+        im = self.main_axes.imshow(
+            image_data,
+            extent=self._liveExtent(live, x_data, x2_data),
+            aspect="auto",
+            origin="lower",
+            cmap=color_palette,
+            norm=norm,
+        )
+        live["image"] = im
+        self._live_heatmap = live
+        self._current_colorbar = self.figure.colorbar(
+            im, ax=self.main_axes, label=plot_options.get("y_unit", "")
+        )
+
+    def _updateLiveHeatmap(self, y_data, x_data, x2_data, plot_options):
+        """Write the rows acquired since the last update into the live heatmap.
+
+        The last row already written is written again (it may have been
+        acquired partially). The color range is updated from the range of
+        each row, and the canvas is redrawn when the event loop is idle.
+
+        Parameters:
+            y_data: 2D array of detector data (acquired rows)
+            x_data: 1D array of X positioner data
+            x2_data: 1D array of X2 positioner data (acquired rows)
+            plot_options: Dictionary containing plot options and metadata
+
+        Returns:
+            bool: True if the live heatmap was updated, False if the data is
+            not the continuation of the live heatmap (then plot it again)
+        """
+        live = self._live_heatmap
+        if live is None or plot_options.get("x2_points") != live["total"]:
+            return False
+        if not live["rows"] <= len(x2_data) <= live["total"]:
+            return False
+        if live["key"] != self._liveHeatmapKey(x_data, x2_data, plot_options):
+            return False
+
+        image = live["image"]
+        # Written in place: the image keeps its (masked) array
+        self._writeLiveRows(live, image.get_array(), y_data, max(live["rows"] - 1, 0))
+        color_range = self._liveColorRange(live, plot_options)
+        if color_range is None:
+            return False
+        image.set_clim(*color_range)
+        image.changed()
+
+        extent = self._liveExtent(live, x_data, x2_data)
+        if list(image.get_extent()) != extent:
+            image.set_extent(extent)
+            self.main_axes.set_xlim(extent[:2])
+            self.main_axes.set_ylim(extent[2:])
+        self.canvas.draw_idle()
+        return True
+
+    def _liveHeatmapKey(self, x_data, x2_data, plot_options):
+        """What must not change for the live heatmap to be updated in place."""
+        return (
+            plot_options.get("filePath"),
+            plot_options.get("title"),
+            plot_options.get("y_unit"),
+            plot_options.get("color_palette"),
+            plot_options.get("vmin"),
+            plot_options.get("vmax"),
+            bool(getattr(self, "_log_y_2d", False)),
+            x_data.size,
+            float(x_data[0]),
+            float(x_data[-1]),
+            float(x2_data[0]) if len(x2_data) else None,
+            bool(len(x2_data) > 1 and x2_data[0] > x2_data[-1]),  # descending X2
+        )
+
+    def _writeLiveRows(self, live, image_data, y_data, first=0):
+        """Write the acquired rows from ``first`` on into the live image.
+
+        Rows and columns are placed as in :meth:`_plot_heatmap`: by increasing
+        X and X2 positions (rows of a descending X2 scan fill the image from
+        the top).
+        """
+        total, n_rows = live["total"], len(y_data)
+        rows = numpy.asarray(y_data[first:], dtype=float)
+        if live["flip_x"]:
+            rows = rows[:, ::-1]
+        if live["flip_x2"]:
+            image_data[total - n_rows : total - first] = rows[::-1]
+        else:
+            image_data[first:n_rows] = rows
+        positive = rows > 0
+        live["row_min"][first:n_rows] = rows.min(axis=1)
+        live["row_max"][first:n_rows] = rows.max(axis=1)
+        live["row_pos_min"][first:n_rows] = numpy.where(positive, rows, numpy.inf).min(
+            axis=1
+        )
+        live["row_pos_max"][first:n_rows] = numpy.where(positive, rows, -numpy.inf).max(
+            axis=1
+        )
+        live["rows"] = n_rows
+
+    def _liveColorRange(self, live, plot_options):
+        """(vmin, vmax) of the live heatmap, None if log scale and no data > 0."""
+        vmin = plot_options.get("vmin")
+        if vmin is None:
+            vmin = live["row_min"].min()
+        vmax = plot_options.get("vmax")
+        if vmax is None:
+            vmax = live["row_max"].max()
+        if vmin > vmax:
+            vmin, vmax = vmax, vmin
+        if getattr(self, "_log_y_2d", False):
+            if not numpy.isfinite(live["row_pos_min"].min()):
+                return None
+            if vmin <= 0:
+                vmin = live["row_pos_min"].min()
+            if vmax <= 0:
+                vmax = live["row_pos_max"].max()
+        return float(vmin), float(vmax)
+
+    def _liveExtent(self, live, x_data, x2_data):
+        """Extent of the live heatmap: X2 is extrapolated to the whole scan.
+
+        Until two rows with different X2 positions are acquired, the step of
+        X2 is not known: each row is one unit high.
+        """
+        n_rows = len(x2_data)
+        if n_rows >= live["total"]:
+            x2_min, x2_max = x2_data.min(), x2_data.max()
+        else:
+            x2_start = float(x2_data[0]) if n_rows else 0.0
+            step = (x2_data[-1] - x2_start) / (n_rows - 1) if n_rows > 1 else 0.0
+            if step == 0 or not numpy.isfinite(step):
+                step = 1.0
+            x2_end = x2_start + step * (live["total"] - 1)
+            x2_min, x2_max = sorted((x2_start, x2_end))
+        return [
+            float(x_data.min()),
+            float(x_data.max()),
+            float(x2_min),
+            float(x2_max),
+        ]
+
     def _plot_contour(self, y_data, x_data, x2_data, plot_options, color_palette):
         """Plot 2D data as contour plot.
 
@@ -2052,6 +2506,7 @@ class ChartView2D(ChartView):
             message (str): The message to display
         """
         # Clear the previous plot
+        self._live_heatmap = None
         self.figure.clear()
         self.main_axes = self.figure.add_subplot(111)
 
@@ -0,0 +1,203 @@
+"""
+Level of detail of large 1D curves.
+
+Time and fly scans can have 10^5 to 10^6 points per detector, many more
+than the pixels of the plot. :class:`DecimatedCurve` keeps the full data of
+a curve and gives, for a view (X range and width in pixels), the points to
+draw: in each pixel column, the points with the lowest and highest Y values,
+so that peaks are kept. Points out of the view are replaced by their
+neighbors of the view edges (the line still crosses the edges as it should)
+and the first, last, lowest and highest points of the curve (the data limits
+of the decimated line are those of the curve). The points of the last views
+are cached, so that zooming back and forth does not decimate again. A curve
+being acquired is extended with its new points only (see
+:meth:`DecimatedCurve.extend`).
+
+The full data are kept for cursors, fits and statistics.
+
+.. autosummary::
+
+    ~DecimatedCurve
+    ~decimation_indices
+"""
+
+from collections import OrderedDict
+from typing import Optional
+import numpy
+
+
+def decimation_indices(
+    x: numpy.ndarray,
+    y: numpy.ndarray,
+    x_range: tuple[float, float],
+    n_bins: int,
+    log: bool = False,
+    limits: Optional[tuple[int, int]] = None,
+) -> numpy.ndarray:
+    """
+    Indices of the points to draw in a view, by min/max per bin.
+
+    Parameters:
+        x (ndarray): Increasing X values (finite)
+        y (ndarray): Y values (finite, same length)
+        x_range (tuple): X range of the view
+        n_bins (int): Number of bins of the view (its width in pixels)
+        log (bool): Bins of equal width in log(x) (logarithmic X axis)
+        limits (tuple, optional): Indices of the lowest and highest Y values,
+            found in ``y`` if not given
+
+    Returns:
+        ndarray: Increasing indices of the points to draw
+    """
+    n_points = len(x)
+    x_min, x_max = sorted(x_range)
+    first = int(numpy.searchsorted(x, x_min, "left"))
+    last = int(numpy.searchsorted(x, x_max, "right"))
+    n_bins = max(int(n_bins), 1)
+
+    if last - first > 2 * n_bins:
+        if log and x_min > 0:
+            edges = numpy.geomspace(x_min, x_max, n_bins + 1)
+        else:
+            edges = numpy.linspace(x_min, x_max, n_bins + 1)
+        x_view, y_view = x[first:last], y[first:last]
+        starts = numpy.unique(numpy.searchsorted(x_view, edges[:-1], "left"))
+        starts = starts[starts < len(x_view)]
+        counts = numpy.diff(numpy.append(starts, len(x_view)))
+        visible = []
+        for reduce in (numpy.minimum, numpy.maximum):
+            extrema = numpy.repeat(reduce.reduceat(y_view, starts), counts)
+            positions = numpy.flatnonzero(y_view == extrema)
+            # First point of each bin with the bin's extremum
+            visible.append(positions[numpy.searchsorted(positions, starts)] + first)
+    else:
+        visible = [numpy.arange(first, last)]
+
+    if limits is None:
+        limits = int(numpy.argmin(y)), int(numpy.argmax(y))
+    edges_and_limits = [
+        max(first - 1, 0),
+        min(last, n_points - 1),
+        0,
+        n_points - 1,
+        *limits,
+    ]
+    return numpy.unique(numpy.concatenate([*visible, edges_and_limits]))
+
+
+class DecimatedCurve:
+    """
+    Full data of a curve, and the points to draw in a view.
+
+    Curves whose X values are not monotonic, or whose values are not all
+    finite, are drawn in full (:attr:`decimated` is False).
+    """
+
+    def __init__(self, x_data, y_data, cache_size: int = 8):
+        """
+        Initialize the curve.
+
+        Parameters:
+            x_data (array-like): X values
+            y_data (array-like): Y values (same length)
+            cache_size (int): Number of views whose points are cached
+        """
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple, tuple[numpy.ndarray, numpy.ndarray]] = (
+            OrderedDict()
+        )
+        self._order: Optional[slice] = None  # slice giving increasing X
+        self._limits = (0, 0)  # indices of the lowest and highest Y values
+        self.extend(x_data, y_data, 0)
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def extend(self, x_data, y_data, first: int) -> None:
+        """
+        Replace the data by the grown curve, whose first points are unchanged.
+
+        Only the new points are checked (finite values, X in the same order)
+        and searched for the lowest and highest Y values, so that a live
+        update does not go through the whole curve again.
+
+        Parameters:
+            x_data (array-like): X values of the whole curve
+            y_data (array-like): Y values (same length)
+            first (int): Index of the first new point (0: all points are new)
+        """
+        self.x = numpy.asarray(x_data, dtype=float)
+        self.y = numpy.asarray(y_data, dtype=float)
+        self._cache.clear()
+        if first < 2:
+            first = 0  # no direction known yet: check all the points
+        elif self._order is None:
+            return  # the old points cannot be decimated
+        if len(self.x) != len(self.y) or len(self.x) < 2:
+            self._order = None
+            return
+        x_new, y_new = self.x[first:], self.y[first:]
+        if not (numpy.isfinite(x_new).all() and numpy.isfinite(y_new).all()):
+            self._order = None
+            return
+
+        steps = numpy.diff(self.x[max(first - 1, 0) :])
+        if first and self.x[0] != self.x[first - 1]:
+            increasing = self._order == slice(None)
+            if not ((steps >= 0) if increasing else (steps <= 0)).all():
+                self._order = None
+                return
+        elif (steps >= 0).all():  # old X values all equal: any direction
+            self._order = slice(None)
+        elif (steps <= 0).all():
+            self._order = slice(None, None, -1)
+        else:
+            self._order = None
+            return
+
+        if len(y_new):
+            lowest, highest = self._limits
+            new_lowest = first + int(numpy.argmin(y_new))
+            new_highest = first + int(numpy.argmax(y_new))
+            if not first or self.y[new_lowest] < self.y[lowest]:
+                lowest = new_lowest
+            if not first or self.y[new_highest] > self.y[highest]:
+                highest = new_highest
+            self._limits = lowest, highest
+
+    @property
+    def decimated(self) -> bool:
+        """Whether the curve can be decimated."""
+        return self._order is not None
+
+    def view(
+        self, x_range: tuple[float, float], n_bins: int, log: bool = False
+    ) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Points to draw in a view (see :func:`decimation_indices`).
+
+        Parameters:
+            x_range (tuple): X range of the view
+            n_bins (int): Width of the view in pixels
+            log (bool): Logarithmic X axis
+
+        Returns:
+            tuple: (x, y) arrays to draw, the full data if not decimated
+        """
+        if self._order is None:
+            return self.x, self.y
+        key = (float(x_range[0]), float(x_range[1]), int(n_bins), bool(log))
+        points = self._cache.get(key)
+        if points is None:
+            x, y = self.x[self._order], self.y[self._order]
+            limits = self._limits
+            if self._order.step == -1:
+                limits = tuple(len(x) - 1 - index for index in limits)
+            indices = decimation_indices(x, y, x_range, n_bins, log, limits)
+            points = x[indices], y[indices]
+            self._cache[key] = points
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        return points
@@ -14,6 +14,7 @@ Signals:
     curveAdded: Emitted when a curve is added (curveID)
     curveRemoved: Emitted when a curve is removed (curveID, curveData, count)
     curveUpdated: Emitted when a curve is updated (curveID, recompute_y, update_x)
+    curveExtended: Emitted when points are appended to a curve (curveID, first new index)
     allCurvesRemoved: Emitted when all curves are removed (doNotClearCheckboxes)
 
 Key Features:
@@ -27,9 +28,11 @@ Key Features:
 
     ~CurveManager.addCurve
     ~CurveManager.curves
+    ~CurveManager.extendCurve
     ~CurveManager.findCurveID
     ~CurveManager.generateCurveID
     ~CurveManager.getCurveData
+    ~CurveManager.referenceRange
     ~CurveManager.removeAllCurves
     ~CurveManager.removeCurve
     ~CurveManager.updateCurve
@@ -39,6 +42,7 @@ Key Features:
 
 import numpy as np
 from PyQt6.QtCore import QObject, pyqtSignal
+from mdaviz.data_cache import get_global_cache
 from mdaviz.logger import get_logger
 
 # Initialize logger for this module
@@ -56,12 +60,14 @@ class CurveManager(QObject):
         curveAdded: Emitted when a curve is added (curveID)
         curveRemoved: Emitted when a curve is removed (curveID, curveData, count)
         curveUpdated: Emitted when a curve is updated (curveID, recompute_y, update_x)
+        curveExtended: Emitted when points are appended to a curve (curveID, first new index)
         allCurvesRemoved: Emitted when all curves are removed (doNotClearCheckboxes)
     """
 
     curveAdded = pyqtSignal(str)
     curveRemoved = pyqtSignal(str, dict, int)  # count = nb of curves left for this file
     curveUpdated = pyqtSignal(str, bool, bool)
+    curveExtended = pyqtSignal(str, int)  # first index of the appended points
     allCurvesRemoved = pyqtSignal(bool)
 
     def __init__(self, parent=None):
@@ -73,6 +79,19 @@ class CurveManager(QObject):
         # Persistent storage for curve properties across manager clears
         self._persistent_properties = {}  # key: curveID, value: {style}
 
+        # Reference range of unscaled curves (see unscaleCurve): (min, max) of
+        # the transformed y of each other curve, and of all of them (None
+        # when it must be computed again)
+        self._curveRanges = {}  # key: curveID
+        self._referenceRange = None
+
+        # Transformed data (see getTransformedCurveXYData), valid while the
+        # version of the curve (and of the reference range if unscaled) holds
+        self._transformed = {}  # key: curveID, value: (version, x, original_y, y)
+        self._curveVersions = {}  # key: curveID, bumped when the curve changes
+        self._referenceVersion = 0  # bumped when the reference range changes
+        self._lastVersion = 0
+
     def curves(self):
         """Returns a copy of the currently managed curves.
 
@@ -274,8 +293,79 @@ class CurveManager(QObject):
             "ds_options": ds_options,
             "x2_index": x2_index,  # Store X2 index for 2D data
         }
+        # Keep the plotted file's data in the cache while the curve exists
+        get_global_cache().pin(file_path, f"curve:{curveID}")
+        self._curveChanged(curveID)
         self.curveAdded.emit(curveID)
 
+    def extendCurve(self, row, *ds, **options):
+        """Append the new points of a growing curve (live acquisition).
+
+        During a scan, each reload of the file gives the whole curve acquired
+        so far. The new data is taken as an extension of the existing curve
+        when it is at least as long and has the same first and last old
+        points (a constant-time check: the points in between are not
+        compared). Only the new points (the tail) are then copied, into
+        buffers whose capacity doubles as needed, so each update costs time
+        proportional to the number of new points.
+
+        Parameters:
+            row: The row number in the file tableview associated with the curve
+            *ds: Dataset containing x_data and y_data arrays (whole curve)
+            **options: Same options as :meth:`addCurve`
+
+        Returns:
+            bool: True if the curve is up to date (points appended or no new
+                point), False if it must be added or updated with
+                :meth:`addCurve` (new curve, new label, or data that does not
+                extend the curve)
+        """
+        if len(ds) < 2:
+            return False
+        plot_options = options.get("plot_options", {})
+        ds_options = options.get("ds_options", {})
+        label = ds_options.get("label", "unknown label")
+        file_path = plot_options.get("filePath", "unknown path")
+        curveID = self.generateCurveID(label, file_path, row, options.get("x2_index"))
+        curve_data = self._curves.get(curveID)
+        if curve_data is None:
+            return False
+        if label != curve_data.get("ds_options", {}).get("label", ""):
+            return False
+
+        old_x, old_y = curve_data["ds"][0], curve_data["ds"][1]
+        n_old, n_new = len(old_x), len(ds[0])
+        if n_new < n_old or len(ds[1]) != n_new or len(old_y) != n_old:
+            return False
+        if n_old and not all(
+            np.array_equal(new[i : i + 1], old[i : i + 1], equal_nan=True)
+            for new, old in ((ds[0], old_x), (ds[1], old_y))
+            for i in (0, n_old - 1)  # head and tail of the old points
+        ):
+            return False  # not the same points: e.g. a new scan in the same file
+        if n_new == n_old:
+            return True
+
+        x_buffer, y_buffer = curve_data.get("live_buffers", (None, None))
+        if x_buffer is not None and getattr(old_x, "base", None) is not x_buffer.base:
+            x_buffer = y_buffer = None  # data replaced since (addCurve)
+        if x_buffer is None or len(x_buffer) < n_new:
+            capacity = max(n_new, 2 * (0 if x_buffer is None else len(x_buffer)), 64)
+            grown = np.empty((2, capacity), dtype=float)
+            grown[0, :n_old] = old_x
+            grown[1, :n_old] = old_y
+            x_buffer, y_buffer = grown[0], grown[1]
+        x_buffer[n_old:n_new] = ds[0][n_old:]
+        y_buffer[n_old:n_new] = ds[1][n_old:]
+
+        curve_data["live_buffers"] = (x_buffer, y_buffer)
+        curve_data["ds"] = [x_buffer[:n_new], y_buffer[:n_new]]
+        curve_data["original_y"] = y_buffer[:n_new]
+        curve_data["plot_options"] = plot_options
+        self._curveChanged(curveID, appended_y=y_buffer[n_old:n_new])
+        self.curveExtended.emit(curveID, n_old)
+        return True
+
     def updateCurve(self, curveID, curveData, recompute_y=False, update_x=False):
         """Update an existing curve.
 
@@ -296,6 +386,7 @@ class CurveManager(QObject):
         if "original_y" not in curveData and "original_y" in self._curves[curveID]:
             curveData["original_y"] = self._curves[curveID]["original_y"]
         self._curves[curveID] = curveData
+        self._curveChanged(curveID)
 
         self.curveUpdated.emit(curveID, recompute_y, update_x)
         logger.debug(f"Emits curveUpdated {curveID=}, {recompute_y=}, {update_x=}")
@@ -309,6 +400,9 @@ class CurveManager(QObject):
         """Get transformed (x, y) data for plotting.
 
         Returns the x_data and transformed y_data (with offset/factor/derivative/unscale applied).
+        The transformed data are cached until the curve changes (addCurve,
+        extendCurve, updateCurve and the updateCurve* methods) or, for
+        unscaled curves, the reference range changes; they are read-only.
 
         Parameters:
             curveID: The unique identifier of the curve
@@ -327,9 +421,35 @@ class CurveManager(QObject):
             logger.warning(f"Curve {curveID} missing original_y, cannot transform")
             return None, None
 
-        y_transformed = self.applyTransformations(curveID, x_data, original_y)
-
-        return x_data, y_transformed
+        version = (
+            self._curveVersions.get(curveID),
+            self._referenceVersion if curve_data.get("unscale", False) else None,
+        )
+        cached = self._transformed.get(curveID)
+        if (
+            cached is not None
+            and cached[0] == version
+            and cached[1] is x_data
+            and cached[2] is original_y
+        ):
+            return cached[3], cached[4]
+
+        y_transformed = np.asarray(
+            self.applyTransformations(curveID, x_data, original_y)
+        ).view()
+        y_transformed.flags.writeable = False
+        x_view = x_data
+        if isinstance(x_data, np.ndarray):
+            x_view = x_data.view()
+            x_view.flags.writeable = False
+        self._transformed[curveID] = (
+            version,
+            x_data,
+            original_y,
+            x_view,
+            y_transformed,
+        )
+        return x_view, y_transformed
 
     def applyTransformations(self, curveID, x_data, original_y):
         """
@@ -374,18 +494,8 @@ class CurveManager(QObject):
         Returns:
             np.ndarray: y_data rescaled into reference range, or unchanged if constant
         """
-        # Calculate global min/max for unscaling (from regular Y curves only)
-        global_min = float("inf")
-        global_max = float("-inf")
-        for curve in self.curves():
-            curve_data = self.getCurveData(curve)
-            if curve_data is None:
-                continue
-            if curve != curveID and not curve_data["unscale"]:
-                curve_x_data, curve_y_data = self.getTransformedCurveXYData(curve)
-                if curve_x_data is not None and curve_y_data is not None:
-                    global_min = min(global_min, np.min(curve_y_data))
-                    global_max = max(global_max, np.max(curve_y_data))
+        # Global min/max for unscaling (from regular Y curves only)
+        global_min, global_max = self.referenceRange(exclude=curveID)
         # If reference curve is a constant, use cst +/- 0.5
         if global_max == global_min:
             constant_value = global_min
@@ -404,6 +514,108 @@ class CurveManager(QObject):
             ) + global_min
         return y_data
 
+    def referenceRange(self, exclude=None):
+        """Min and max of the transformed y of the non-unscaled curves.
+
+        The range of each curve is cached until its data or transformations
+        change (see updateCurve); the range of all curves is cached too, so
+        unscaling many curves does not transform the reference curves again.
+
+        Parameters:
+            exclude: Curve identifier left out of the range (if not unscaled)
+
+        Returns:
+            tuple: (min, max), (inf, -inf) if there is no reference curve
+        """
+        excluded = self._curves.get(exclude)
+        if excluded is not None and not excluded.get("unscale", False):
+            return self._combineCurveRanges(
+                curveID for curveID in self._curves if curveID != exclude
+            )
+        if self._referenceRange is None:
+            self._referenceRange = self._combineCurveRanges(self._curves)
+        return self._referenceRange
+
+    def _combineCurveRanges(self, curveIDs):
+        """Min and max of the ranges of the non-unscaled curves among curveIDs."""
+        global_min = float("inf")
+        global_max = float("-inf")
+        for curveID in curveIDs:
+            curve_range = self._curveRange(curveID)
+            if curve_range is not None:
+                global_min = min(global_min, curve_range[0])
+                global_max = max(global_max, curve_range[1])
+        return global_min, global_max
+
+    def _curveRange(self, curveID):
+        """(min, max) of a non-unscaled curve's transformed y (cached), else None."""
+        curve_data = self._curves.get(curveID)
+        if curve_data is None or curve_data.get("unscale", False):
+            return None
+        if curveID not in self._curveRanges:
+            _, y_data = self.getTransformedCurveXYData(curveID)
+            curve_range = None
+            if y_data is not None and np.size(y_data):
+                curve_range = (np.min(y_data), np.max(y_data))
+            self._curveRanges[curveID] = curve_range
+        return self._curveRanges[curveID]
+
+    def _curveChanged(self, curveID, appended_y=None):
+        """
+        The data or transformations of a curve changed: forget its cached
+        transformed data, and its range (extended if points were appended).
+
+        Parameters:
+            curveID: Curve identifier
+            appended_y: Original y of the points appended by extendCurve, if any
+        """
+        self._lastVersion += 1
+        self._curveVersions[curveID] = self._lastVersion
+        self._transformed.pop(curveID, None)
+        if appended_y is None:
+            self._invalidateCurveRange(curveID)
+        else:
+            self._extendCurveRange(curveID, appended_y)
+
+    def _invalidateCurveRange(self, curveID=None):
+        """Forget the cached range of a curve (of all curves if None)."""
+        if curveID is None:
+            self._curveRanges.clear()
+        else:
+            was_reference = curveID in self._curveRanges
+            self._curveRanges.pop(curveID, None)
+            curve_data = self._curves.get(curveID)
+            is_reference = curve_data is not None and not curve_data.get(
+                "unscale", False
+            )
+            if not (was_reference or is_reference):
+                return  # an unscaled curve: the reference range is the same
+        self._referenceRange = None
+        self._referenceVersion += 1
+
+    def _extendCurveRange(self, curveID, new_y):
+        """Include points appended to a curve (original y) in its cached range."""
+        curve_data = self._curves[curveID]
+        curve_range = self._curveRanges.get(curveID)
+        if (
+            curve_range is None
+            or curve_data.get("derivative", False)
+            or curve_data.get("unscale", False)
+        ):
+            # Gradients change at the junction; empty or unknown ranges too
+            self._invalidateCurveRange(curveID)
+            return
+        new_y = curve_data.get("offset", 0) + curve_data.get("factor", 1) * new_y
+        new_min, new_max = np.min(new_y), np.max(new_y)
+        if np.isnan(new_min) or np.isnan(new_max):
+            self._invalidateCurveRange(curveID)  # as computed from all the points
+            return
+        extended = (min(curve_range[0], new_min), max(curve_range[1], new_max))
+        if extended != curve_range:
+            self._curveRanges[curveID] = extended
+            self._referenceRange = None
+            self._referenceVersion += 1
+
     def updateCurveOffsetFactor(self, curveID, offset=None, factor=None):
         """Update offset and/or factor for a curve.
 
@@ -511,8 +723,12 @@ class CurveManager(QObject):
             curveData = self._curves[curveID]
             file_path = curveData["file_path"]
             # Remove curve entry from self.curves & persistent props:
+            self._curveChanged(curveID)
             del self._curves[curveID]
             self._persistent_properties.pop(curveID, None)
+            self._transformed.pop(curveID, None)
+            self._curveVersions.pop(curveID, None)
+            get_global_cache().unpin(file_path, f"curve:{curveID}")
             # How many curves are left for this file:
             count = 0
             for curve_data in self._curves.values():
@@ -548,7 +764,13 @@ class CurveManager(QObject):
                     props["style"] = curve_data.get("style", "-")
             else:
                 self._persistent_properties.pop(curveID, None)
+            get_global_cache().unpin(
+                self._curves[curveID]["file_path"], f"curve:{curveID}"
+            )
         self._curves.clear()
+        self._invalidateCurveRange()
+        self._transformed.clear()
+        self._curveVersions.clear()
         self.allCurvesRemoved.emit(doNotClearCheckboxes)
 
     def clearPersistentProperties(self):
@@ -0,0 +1,80 @@
+"""
+Statistics of a curve, updated as points are appended.
+
+The chart view shows the min, max, center of mass and mean of the selected
+curve. During live acquisitions, curves only grow: :class:`CurveStatistics`
+keeps running sums and extrema so that appending points costs O(new points)
+instead of a pass over the whole curve.
+
+.. autosummary::
+
+    ~CurveStatistics
+"""
+
+from typing import Optional
+import numpy
+
+
+class CurveStatistics:
+    """
+    Running min, max, center of mass and mean of the points of a curve.
+
+    The results match :meth:`~mdaviz.chartview.ChartView.calculateBasicMath`
+    on all the points appended: the first point of the extrema wins, and
+    NaN values propagate to the extrema (as with ``numpy.min``) and the sums.
+    """
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.count = 0
+        self.sum_y = 0.0
+        self.sum_xy = 0.0
+        self.min_point: Optional[tuple[float, float]] = None  # (x, y)
+        self.max_point: Optional[tuple[float, float]] = None
+
+    def append(self, x_data, y_data) -> None:
+        """
+        Add points to the statistics.
+
+        Parameters:
+            x_data (array-like): X values of the new points
+            y_data (array-like): Y values of the new points (same length)
+        """
+        x_array = numpy.asarray(x_data, dtype=float)
+        y_array = numpy.asarray(y_data, dtype=float)
+        if len(y_array) == 0:
+            return
+        self.count += len(y_array)
+        self.sum_y += float(numpy.sum(y_array))
+        self.sum_xy += float(numpy.sum(x_array * y_array))
+
+        index = int(numpy.argmin(y_array))
+        point = (float(x_array[index]), float(y_array[index]))
+        if self.min_point is None or _replaces(point[1], self.min_point[1], less=True):
+            self.min_point = point
+        index = int(numpy.argmax(y_array))
+        point = (float(x_array[index]), float(y_array[index]))
+        if self.max_point is None or _replaces(point[1], self.max_point[1], less=False):
+            self.max_point = point
+
+    def result(self):
+        """
+        Statistics of the points appended so far.
+
+        Returns:
+            tuple: ((x_at_y_min, y_min), (x_at_y_max, y_max), x_com, y_mean),
+            with x_com None if the sum of y is 0; None if there are no points.
+        """
+        if self.count == 0:
+            return None
+        x_com = self.sum_xy / self.sum_y if self.sum_y != 0 else None
+        return self.min_point, self.max_point, x_com, self.sum_y / self.count
+
+
+def _replaces(new: float, current: float, less: bool) -> bool:
+    """Whether a new extremum replaces the current one (NaN once, then sticky)."""
+    if numpy.isnan(current):
+        return False
+    if numpy.isnan(new):
+        return True
+    return new < current if less else new > current
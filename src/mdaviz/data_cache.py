@@ -8,24 +8,47 @@ loading and processing MDA files.
 
     ~DataCache
     ~CachedFileData
+    ~CacheStatistics
     ~get_global_cache
 """
 
+import json
 import time
 import gc
 import psutil
+import numpy as np
 from pathlib import Path
 from typing import Any, Optional
 from dataclasses import dataclass, field
-from collections import OrderedDict
-from PyQt6.QtCore import QObject, pyqtSignal
+from collections import OrderedDict, deque
+from PyQt6.QtCore import (
+    QCoreApplication,
+    QFileSystemWatcher,
+    QObject,
+    QTimer,
+    pyqtSignal,
+)
 from mdaviz.synApps_mdalib.mda import readMDA
+from mdaviz.file_monitor import is_network_path
 from mdaviz.utils import get_scan, get_scan_2d
+from mdaviz.lazy_loading_config import get_config
 from mdaviz.logger import get_logger
 
 # Get logger for this module
 logger = get_logger("data_cache")
 
+# Number of decode-latency samples kept per file class (oldest samples are dropped)
+LATENCY_SAMPLE_SIZE = 1000
+
+# How cached entries are checked for staleness:
+#   "stat"   - stat the file on every get()
+#   "notify" - filesystem change notifications, plus a periodic batched stat of
+#              the files that cannot be watched (or are on network filesystems)
+VALIDATION_MODES = ("stat", "notify")
+
+# Minimum time between two psutil memory queries (seconds)
+MEMORY_SAMPLE_INTERVAL_S = 1.0
+
 
 @dataclass
 class CachedFileData:
@@ -42,6 +65,7 @@ class CachedFileData:
     access_time: float = field(default_factory=time.time)
     size_bytes: int = 0
     # New fields for 2D+ data support
+    # Detector entries of scan_dict_2d are the same objects as in scan_dict_inner
     scan_dict_2d: dict[str, Any] = field(default_factory=dict)
     scan_dict_inner: dict[str, Any] = field(
         default_factory=dict
@@ -61,6 +85,84 @@ class CachedFileData:
         """Get the size in megabytes."""
         return self.size_bytes / (1024 * 1024)
 
+    def get_file_class(self) -> str:
+        """Get the file class used for statistics: "1D", "2D" or "3D" (rank >= 3)."""
+        return file_class_for_rank(self.rank)
+
+
+def file_class_for_rank(rank: int) -> str:
+    """
+    Map an MDA scan rank to the file class used in cache statistics.
+
+    Parameters:
+        rank (int): Scan rank from the file metadata
+
+    Returns:
+        str: "1D", "2D" or "3D" (ranks above 3 are reported as "3D")
+    """
+    return f"{min(max(int(rank), 1), 3)}D"
+
+
+@dataclass
+class CacheStatistics:
+    """
+    Counters and decode-latency samples collected by a DataCache.
+
+    Latencies are kept per file class ("1D", "2D", "3D") in bounded deques
+    so long sessions do not grow memory; percentiles are computed on demand.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    bytes_loaded: int = 0
+    files_loaded: int = 0
+    decode_latencies: dict[str, deque] = field(default_factory=dict)
+
+    def record_decode(self, file_class: str, seconds: float, size_bytes: int) -> None:
+        """Record one file decode (readMDA + scan dict construction)."""
+        samples = self.decode_latencies.setdefault(
+            file_class, deque(maxlen=LATENCY_SAMPLE_SIZE)
+        )
+        samples.append(seconds)
+        self.bytes_loaded += size_bytes
+        self.files_loaded += 1
+
+    def hit_rate_percent(self) -> float:
+        """Percentage of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return (self.hits / lookups) * 100 if lookups > 0 else 0.0
+
+    def latency_summary(self) -> dict[str, dict[str, float]]:
+        """
+        Summarize decode latencies per file class.
+
+        Returns:
+            dict: {file_class: {"count", "p50_ms", "p95_ms", "max_ms"}}
+        """
+        summary = {}
+        for file_class, samples in sorted(self.decode_latencies.items()):
+            if not samples:
+                continue
+            values_ms = np.asarray(samples, dtype=float) * 1000.0
+            p50, p95 = np.percentile(values_ms, [50, 95])
+            summary[file_class] = {
+                "count": len(values_ms),
+                "p50_ms": float(p50),
+                "p95_ms": float(p95),
+                "max_ms": float(values_ms.max()),
+            }
+        return summary
+
+    def reset(self) -> None:
+        """Reset all counters and latency samples."""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes_loaded = 0
+        self.files_loaded = 0
+        self.decode_latencies.clear()
+
 
 class DataCache(QObject):
     """
@@ -74,6 +176,16 @@ class DataCache(QObject):
         max_entries (int): Maximum number of cached entries
         enable_compression (bool): Whether to compress cached data
         max_memory_mb (float): Maximum system memory usage in megabytes
+        validation_mode (str): How entries are checked for staleness, one of
+            VALIDATION_MODES
+
+    In "notify" mode the cache watches every cached file (and its folder) with a
+    QFileSystemWatcher and drops entries as soon as a change is reported, so
+    ``get()`` is a pure dictionary lookup. A periodic batched stat covers the
+    entries without notifications: files that could not be watched and files
+    on network filesystems (e.g. NFS), which do not deliver them.
+    Notifications need a running Qt application; without one the cache
+    falls back to "stat" behavior.
     """
 
     # Signals
@@ -89,6 +201,8 @@ class DataCache(QObject):
         max_entries: int = 100,
         enable_compression: bool = False,
         max_memory_mb: float = 1000.0,
+        validation_mode: str = "stat",
+        validation_interval_s: float = 5.0,
     ):
         """
         Initialize the data cache.
@@ -98,8 +212,16 @@ class DataCache(QObject):
             max_entries (int): Maximum number of cached entries
             enable_compression (bool): Whether to compress cached data
             max_memory_mb (float): Maximum system memory usage in megabytes
+            validation_mode (str): "stat" or "notify" (see class docstring)
+            validation_interval_s (float): Period of the batched stat fallback
+                in "notify" mode
         """
         super().__init__()
+        if validation_mode not in VALIDATION_MODES:
+            raise ValueError(
+                f"validation_mode must be one of {VALIDATION_MODES},"
+                f" not {validation_mode!r}"
+            )
         self.max_size_mb = max_size_mb
         self.max_entries = max_entries
         self.enable_compression = enable_compression
@@ -108,6 +230,41 @@ class DataCache(QObject):
         self._current_size_mb = 0.0
         self._last_memory_check = time.time()
         self._memory_check_interval = 60.0  # Check memory every 60 seconds
+        self._stats = CacheStatistics()
+        self._last_memory_sample = 0.0
+        self._last_memory_mb = 0.0
+
+        self.validation_mode = validation_mode
+        self.validation_interval_s = validation_interval_s
+        # Created on first use, only in "notify" mode with a running application
+        self._watcher: Optional[QFileSystemWatcher] = None
+        self._validation_timer: Optional[QTimer] = None
+        # Keys of the entries checked by the timer (no change notifications)
+        self._unwatched: set[str] = set()
+        # Resolved folders on network filesystems (see file_monitor.is_network_path)
+        self._network_folders: set[str] = set()
+
+        # Secondary index: resolved folder -> keys of its cached files
+        self._folder_index: dict[str, set[str]] = {}
+        self._key_folders: dict[str, str] = {}
+        self._resolved_parents: dict[str, str] = {}
+
+        # Pins: key -> owners (open tab, live watch, plotted curve, ...)
+        self._pins: dict[str, set[str]] = {}
+
+    def _sample_memory_usage(self) -> float:
+        """
+        Return the process memory usage, querying psutil at most once per
+        MEMORY_SAMPLE_INTERVAL_S.
+
+        Returns:
+            float: Current (or most recently sampled) memory usage in MB
+        """
+        now = time.monotonic()
+        if now - self._last_memory_sample >= MEMORY_SAMPLE_INTERVAL_S:
+            self._last_memory_mb = self._check_memory_usage()
+            self._last_memory_sample = now
+        return self._last_memory_mb
 
     def _check_memory_usage(self) -> float:
         """
@@ -174,39 +331,172 @@ class DataCache(QObject):
         Returns:
             CachedFileData or None: Cached data if available and not stale, None otherwise
         """
-        # Check memory usage periodically
-        self._check_memory_usage()
-
         if file_path in self._cache:
-            cached_data = self._cache.pop(file_path)
-
-            # Check if file has been modified since caching
-            try:
-                current_mtime = Path(file_path).stat().st_mtime
-                if current_mtime > cached_data.file_mtime:
-                    # File has been modified, cache is stale
-                    logger.info(
-                        f"⚠️ CACHE STALE: File {file_path} has been modified, invalidating cache"
-                    )
+            # With change notifications, stale entries have already been
+            # removed: no stat and no memory query on the lookup path.
+            if not self._notifications_active():
+                self._sample_memory_usage()
+                # Check if file has been modified since caching
+                if self._is_stale(file_path, self._cache[file_path]):
+                    self.remove(file_path)
+                    self._stats.misses += 1
                     self.cache_miss.emit(file_path)
                     return None
-            except (OSError, FileNotFoundError):
-                # File no longer exists or can't be accessed
-                logger.warning(
-                    f"❌ CACHE ERROR: File {file_path} no longer accessible, invalidating cache"
-                )
-                self.cache_miss.emit(file_path)
-                return None
 
             # File is still valid, move to end (most recently used)
-            self._cache[file_path] = cached_data
+            cached_data = self._cache[file_path]
+            self._cache.move_to_end(file_path)
             cached_data.update_access_time()
+            self._stats.hits += 1
             self.cache_hit.emit(file_path)
             return cached_data
         else:
+            self._stats.misses += 1
             self.cache_miss.emit(file_path)
             return None
 
+    def _is_stale(self, file_path: str, cached_data: CachedFileData) -> bool:
+        """
+        Stat a cached file and report whether its entry is out of date.
+
+        Parameters:
+            file_path (str): Path to the cached file
+            cached_data (CachedFileData): The cached entry
+
+        Returns:
+            bool: True if the file was modified or can no longer be accessed
+        """
+        try:
+            current_mtime = Path(file_path).stat().st_mtime
+        except (OSError, FileNotFoundError):
+            # File no longer exists or can't be accessed
+            logger.warning(
+                f"❌ CACHE ERROR: File {file_path} no longer accessible, invalidating cache"
+            )
+            return True
+        if current_mtime > cached_data.file_mtime:
+            # File has been modified, cache is stale
+            logger.info(
+                f"⚠️ CACHE STALE: File {file_path} has been modified, invalidating cache"
+            )
+            return True
+        return False
+
+    def validate_entries(self, file_paths: Optional[list[str]] = None) -> int:
+        """
+        Stat cached files in one batch and drop the entries that are stale.
+
+        This is the periodic fallback of the "notify" validation mode, and is
+        also run for a folder when its directory change notification arrives.
+
+        Parameters:
+            file_paths (list[str], optional): Entries to check; if not given,
+                the entries without change notifications in "notify" mode,
+                all entries otherwise
+
+        Returns:
+            int: Number of entries invalidated
+        """
+        if file_paths is None:
+            if self._watcher is not None:
+                file_paths = list(self._unwatched)
+            else:
+                file_paths = list(self._cache)
+        stale = [
+            file_path
+            for file_path in file_paths
+            if file_path in self._cache
+            and self._is_stale(file_path, self._cache[file_path])
+        ]
+        for file_path in stale:
+            self.remove(file_path)
+        return len(stale)
+
+    def _notifications_active(self) -> bool:
+        """Whether entries are validated by change notifications."""
+        return self.validation_mode == "notify" and self._ensure_watcher()
+
+    def _ensure_watcher(self) -> bool:
+        """
+        Create the file system watcher and fallback timer if needed.
+
+        Returns:
+            bool: True if notifications are available
+        """
+        if self._watcher is not None:
+            return True
+        if QCoreApplication.instance() is None:
+            return False
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_file_changed)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+
+        self._validation_timer = QTimer(self)
+        self._validation_timer.setInterval(int(self.validation_interval_s * 1000))
+        self._validation_timer.timeout.connect(self.validate_entries)
+        return True
+
+    def _resolve_folder(self, folder_path: str) -> str:
+        """
+        Resolve a folder path, remembering the result.
+
+        Only the first file cached from a folder pays for the resolve call.
+        """
+        resolved = self._resolved_parents.get(folder_path)
+        if resolved is None:
+            resolved = str(Path(folder_path).resolve())
+            self._resolved_parents[folder_path] = resolved
+        return resolved
+
+    def _index_add(self, file_path: str) -> None:
+        """Add a newly cached file to the folder index and watch it."""
+        folder = self._resolve_folder(str(Path(file_path).parent))
+        self._key_folders[file_path] = folder
+        members = self._folder_index.setdefault(folder, set())
+        members.add(file_path)
+
+        if not self._notifications_active():
+            return
+        if len(members) == 1:
+            if is_network_path(folder):
+                self._network_folders.add(folder)
+            self._watcher.addPath(folder)
+        # Directory watches do not report in-place writes, so watch the file too
+        if not self._watcher.addPath(file_path) or folder in self._network_folders:
+            self._unwatched.add(file_path)
+            if not self._validation_timer.isActive():
+                self._validation_timer.start()
+
+    def _index_discard(self, file_path: str) -> None:
+        """Remove a file that left the cache from the folder index and watcher."""
+        folder = self._key_folders.pop(file_path, None)
+        members = self._folder_index.get(folder, set())
+        members.discard(file_path)
+        if not members:
+            self._folder_index.pop(folder, None)
+
+        if self._watcher is None:
+            return
+        self._watcher.removePath(file_path)
+        if folder is not None and not members:
+            self._watcher.removePath(folder)
+            self._network_folders.discard(folder)
+        self._unwatched.discard(file_path)
+        if not self._unwatched:
+            self._validation_timer.stop()
+
+    def _on_file_changed(self, file_path: str) -> None:
+        """A watched file was modified, replaced or deleted: drop its entry."""
+        if self.remove(file_path):
+            logger.info(
+                f"⚠️ CACHE STALE: File {file_path} has been modified, invalidating cache"
+            )
+
+    def _on_directory_changed(self, folder_path: str) -> None:
+        """Files were added, removed or renamed in a watched folder."""
+        self.validate_entries(list(self._folder_index.get(folder_path, ())))
+
     def put(self, file_path: str, cached_data: CachedFileData) -> None:
         """
         Store data in the cache.
@@ -216,12 +506,10 @@ class DataCache(QObject):
             cached_data (CachedFileData): Data to cache
         """
         # Check memory usage before adding new data
-        current_memory = self._check_memory_usage()
+        current_memory = self._sample_memory_usage()
 
         # Remove existing entry if present
-        if file_path in self._cache:
-            old_data = self._cache.pop(file_path)
-            self._current_size_mb -= old_data.get_size_mb()
+        self.remove(file_path)
 
         # Check if we need to evict entries
         while (
@@ -237,6 +525,7 @@ class DataCache(QObject):
         # Add new entry
         self._cache[file_path] = cached_data
         self._current_size_mb += cached_data.get_size_mb()
+        self._index_add(file_path)
 
     def load_and_cache(self, file_path: str) -> Optional[CachedFileData]:
         """
@@ -255,7 +544,7 @@ class DataCache(QObject):
 
             # Check memory usage before loading large files
             file_size_mb = path_obj.stat().st_size / (1024 * 1024)
-            current_memory = self._check_memory_usage()
+            current_memory = self._sample_memory_usage()
 
             # If file is large and memory usage is high, skip caching
             if file_size_mb > 100 and current_memory > self.max_memory_mb * 0.8:
@@ -265,6 +554,7 @@ class DataCache(QObject):
                 return self._load_without_caching(path_obj)
 
             # Load the file data
+            decode_start = time.perf_counter()
             result = readMDA(str(path_obj))
             if result is None:
                 logger.error(f"Could not read file: {file_path}")
@@ -287,9 +577,12 @@ class DataCache(QObject):
             if rank >= 2 and len(result) > 2:
                 try:
                     file_data_dim2 = result[2]
-                    scan_dict_2d, _, _ = get_scan_2d(file_data_dim1, file_data_dim2)
-                    # Also store inner dimension data for 1D plotting
+                    # Inner dimension data for 1D plotting; the 2D dict shares
+                    # its detector entries
                     scan_dict_inner, _, first_det = get_scan(file_data_dim2)
+                    scan_dict_2d, _, _ = get_scan_2d(
+                        file_data_dim1, file_data_dim2, scan_dict_inner
+                    )
                 except Exception as e:
                     logger.warning(f"Warning: Could not process 2D data: {e}")
                     scan_dict_2d = {}
@@ -305,6 +598,11 @@ class DataCache(QObject):
 
             # Create cached data
             file_stat = path_obj.stat()
+            self._stats.record_decode(
+                file_class_for_rank(rank),
+                time.perf_counter() - decode_start,
+                file_stat.st_size,
+            )
             cached_data = CachedFileData(
                 file_path=str(path_obj),
                 metadata=file_metadata,
@@ -343,6 +641,7 @@ class DataCache(QObject):
             CachedFileData or None: Loaded data (not cached)
         """
         try:
+            decode_start = time.perf_counter()
             result = readMDA(str(path_obj))
             if result is None:
                 return None
@@ -364,15 +663,23 @@ class DataCache(QObject):
             if rank >= 2 and len(result) > 2:
                 try:
                     file_data_dim2 = result[2]
-                    scan_dict_2d, _, _ = get_scan_2d(file_data_dim1, file_data_dim2)
-                    # Also store inner dimension data for 1D plotting
+                    # Inner dimension data for 1D plotting; the 2D dict shares
+                    # its detector entries
                     scan_dict_inner, _, first_det = get_scan(file_data_dim2)
+                    scan_dict_2d, _, _ = get_scan_2d(
+                        file_data_dim1, file_data_dim2, scan_dict_inner
+                    )
                 except Exception as e:
                     logger.warning(f"Warning: Could not process 2D data: {e}")
                     scan_dict_2d = {}
                     scan_dict_inner = {}
 
             file_stat = path_obj.stat()
+            self._stats.record_decode(
+                file_class_for_rank(rank),
+                time.perf_counter() - decode_start,
+                file_stat.st_size,
+            )
             return CachedFileData(
                 file_path=str(path_obj),
                 metadata=file_metadata,
@@ -424,6 +731,7 @@ class DataCache(QObject):
         if file_path in self._cache:
             cached_data = self._cache.pop(file_path)
             self._current_size_mb -= cached_data.get_size_mb()
+            self._index_discard(file_path)
             return True
         return False
 
@@ -439,22 +747,30 @@ class DataCache(QObject):
         """
         return self.remove(file_path)
 
-    def invalidate_folder(self, folder_path: str) -> int:
+    def invalidate_folder(self, folder_path: str, changed_only: bool = False) -> int:
         """
         Invalidate cached data for all files in a specific folder.
 
+        The folder's files are found with the folder index, so the cost is
+        proportional to the number of cached files in that folder.
+
         Parameters:
             folder_path (str): Path to the folder
+            changed_only (bool): Only invalidate files whose size or
+                modification time differs from the cached entry (one stat
+                per cached file in the folder)
 
         Returns:
             int: Number of files invalidated
         """
-        folder_path = str(Path(folder_path).resolve())
-        files_to_remove = []
-
-        for file_path in self._cache.keys():
-            if str(Path(file_path).parent.resolve()) == folder_path:
-                files_to_remove.append(file_path)
+        folder_path = self._resolve_folder(folder_path)
+        files_to_remove = list(self._folder_index.get(folder_path, ()))
+        if changed_only:
+            files_to_remove = [
+                file_path
+                for file_path in files_to_remove
+                if self._has_changed(file_path, self._cache[file_path])
+            ]
 
         for file_path in files_to_remove:
             self.remove(file_path)
@@ -464,36 +780,149 @@ class DataCache(QObject):
         )
         return len(files_to_remove)
 
+    @staticmethod
+    def _has_changed(file_path: str, cached_data: CachedFileData) -> bool:
+        """
+        Report whether a file's size or modification time differs from the
+        cached entry.
+
+        Parameters:
+            file_path (str): Path to the cached file
+            cached_data (CachedFileData): The cached entry
+
+        Returns:
+            bool: True if the file changed or can no longer be accessed
+        """
+        try:
+            file_stat = Path(file_path).stat()
+        except OSError:
+            return True
+        return (
+            file_stat.st_mtime != cached_data.file_mtime
+            or file_stat.st_size != cached_data.size_bytes
+        )
+
+    def get_folder_stats(self, folder_path: str) -> dict[str, Any]:
+        """
+        Get statistics for the cached files of one folder.
+
+        Parameters:
+            folder_path (str): Path to the folder
+
+        Returns:
+            dict: Entry count, size in MB and bytes on disk of the folder's
+            cached files
+        """
+        folder_path = self._resolve_folder(folder_path)
+        entries = [self._cache[key] for key in self._folder_index.get(folder_path, ())]
+        return {
+            "folder": folder_path,
+            "entry_count": len(entries),
+            "size_mb": sum(entry.get_size_mb() for entry in entries),
+            "size_bytes": sum(entry.size_bytes for entry in entries),
+        }
+
     def clear(self) -> None:
         """Clear all cached data."""
         self._cache.clear()
         self._current_size_mb = 0.0
+        self._folder_index.clear()
+        self._key_folders.clear()
+        if self._watcher is not None:
+            watched = self._watcher.files() + self._watcher.directories()
+            if watched:
+                self._watcher.removePaths(watched)
+            self._unwatched.clear()
+            self._network_folders.clear()
+            self._validation_timer.stop()
 
     def _evict_lru(self) -> bool:
         """
         Evict the least recently used entry from the cache.
 
+        Pinned entries are never evicted.
+
         Returns:
-            bool: True if an entry was evicted, False if cache is empty
+            bool: True if an entry was evicted, False if there is no unpinned entry
         """
-        if not self._cache:
+        # Remove the least recently used entry that is not pinned
+        file_path = next((key for key in self._cache if key not in self._pins), None)
+        if file_path is None:
             return False
 
-        # Remove the first (least recently used) entry
-        file_path, cached_data = self._cache.popitem(last=False)
+        cached_data = self._cache.pop(file_path)
         self._current_size_mb -= cached_data.get_size_mb()
+        self._index_discard(file_path)
+        self._stats.evictions += 1
         self.cache_eviction.emit(file_path)
         return True
 
+    def pin(self, file_path: str, owner: str) -> None:
+        """
+        Protect a file's entry from eviction on behalf of an owner.
+
+        Pins are reference counted by owner: the entry stays pinned until
+        every owner has released it. A file may be pinned before it is cached.
+        Pinning does not prevent invalidation when the file changes on disk.
+
+        Parameters:
+            file_path (str): Path to the file (cache key)
+            owner (str): Identifier of the pin holder, e.g. "tab" or "live"
+        """
+        self._pins.setdefault(file_path, set()).add(owner)
+
+    def unpin(self, file_path: str, owner: str) -> bool:
+        """
+        Release an owner's pin on a file.
+
+        Parameters:
+            file_path (str): Path to the file (cache key)
+            owner (str): Identifier of the pin holder
+
+        Returns:
+            bool: True if the owner held a pin on the file, False otherwise
+        """
+        owners = self._pins.get(file_path)
+        if not owners or owner not in owners:
+            return False
+        owners.discard(owner)
+        if not owners:
+            del self._pins[file_path]
+        return True
+
+    def unpin_all(self, owner: str) -> int:
+        """
+        Release every pin held by an owner.
+
+        Parameters:
+            owner (str): Identifier of the pin holder
+
+        Returns:
+            int: Number of files unpinned by this owner
+        """
+        files = [key for key, owners in self._pins.items() if owner in owners]
+        for file_path in files:
+            self.unpin(file_path, owner)
+        return len(files)
+
+    def is_pinned(self, file_path: str) -> bool:
+        """Whether a file is pinned by at least one owner."""
+        return file_path in self._pins
+
     def get_stats(self) -> dict[str, Any]:
         """
         Get cache statistics.
 
         Returns:
-            dict: Cache statistics including size, entry count, hit rate, etc.
+            dict: Cache statistics including size, entry count, hit/miss/eviction
+            counters, bytes loaded and decode latencies (p50/p95/max in ms)
+            per file class ("1D", "2D", "3D"). Pinned entries are reported
+            separately in "pinned_count" and "pinned_size_mb".
         """
+        pinned = [self._cache[key] for key in self._pins if key in self._cache]
         return {
             "entry_count": len(self._cache),
+            "folder_count": len(self._folder_index),
             "current_size_mb": self._current_size_mb,
             "max_size_mb": self.max_size_mb,
             "max_entries": self.max_entries,
@@ -502,8 +931,41 @@ class DataCache(QObject):
                 if self.max_size_mb > 0
                 else 0
             ),
+            "pinned_count": len(pinned),
+            "pinned_size_mb": sum(entry.get_size_mb() for entry in pinned),
+            "hits": self._stats.hits,
+            "misses": self._stats.misses,
+            "evictions": self._stats.evictions,
+            "hit_rate_percent": self._stats.hit_rate_percent(),
+            "files_loaded": self._stats.files_loaded,
+            "bytes_loaded": self._stats.bytes_loaded,
+            "decode_latency": self._stats.latency_summary(),
         }
 
+    def reset_stats(self) -> None:
+        """Reset the hit/miss/eviction counters and decode-latency samples."""
+        self._stats.reset()
+
+    def dump_stats(self, file_path: Path) -> bool:
+        """
+        Write the current cache statistics to a JSON file.
+
+        Parameters:
+            file_path (Path): Path of the JSON file to write
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            stats = self.get_stats()
+            stats["timestamp"] = time.time()
+            with open(file_path, "w") as f:
+                json.dump(stats, f, indent=2)
+            return True
+        except Exception as e:
+            logger.error(f"Error saving cache statistics: {e}")
+            return False
+
     def set_max_size_mb(self, max_size_mb: float) -> None:
         """
         Set the maximum cache size.
@@ -539,12 +1001,30 @@ def get_global_cache() -> DataCache:
     """
     Get the global data cache instance.
 
+    The instance is created on first use from the lazy loading configuration
+    (an unknown validation mode is replaced by "notify").
+
     Returns:
         DataCache: Global cache instance
     """
     global _global_cache
     if _global_cache is None:
-        _global_cache = DataCache()
+        config = get_config()
+        validation_mode = config.data_cache_validation_mode
+        if validation_mode not in VALIDATION_MODES:
+            logger.warning(
+                f"Unknown data_cache_validation_mode {validation_mode!r},"
+                ' using "notify"'
+            )
+            validation_mode = "notify"
+        _global_cache = DataCache(
+            max_size_mb=config.data_cache_max_size_mb,
+            max_entries=config.data_cache_max_entries,
+            enable_compression=config.data_cache_enable_compression,
+            max_memory_mb=config.memory_warning_threshold_mb,
+            validation_mode=validation_mode,
+            validation_interval_s=config.data_cache_validation_interval_s,
+        )
     return _global_cache
 
 
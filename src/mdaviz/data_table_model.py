@@ -63,7 +63,7 @@ class DataTableModel(QAbstractTableModel):
         # Find the maximum length of any column's data
         max_length = 0
         for column_data in data.values():
-            if isinstance(column_data, list):
+            if isinstance(column_data, (list, range)):
                 max_length = max(max_length, len(column_data))
 
         return max_length
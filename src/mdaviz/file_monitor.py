@@ -0,0 +1,236 @@
+"""
+Change notifications for the files and folders followed during live acquisition.
+
+The folder view follows the data folder (new files), the live file (1D live
+plotting), the 2D scan being acquired and the rows of new files (Points
+column). :class:`FileMonitor` watches these paths with
+``QFileSystemWatcher`` (inotify on Linux) on local disks, so nothing runs
+while no file changes. Notifications of a burst of writes are coalesced
+into one ``changed`` signal after a short delay. Paths on network
+filesystems, which do not deliver notifications, are polled instead, at
+an interval that grows while nothing changes.
+
+.. autosummary::
+
+    ~FileMonitor
+    ~is_network_path
+"""
+
+import os
+from pathlib import Path
+from typing import Iterable, Optional, Union
+from PyQt6.QtCore import QFileSystemWatcher, QObject, QStorageInfo, QTimer, pyqtSignal
+from mdaviz.logger import get_logger
+
+# Get logger for this module
+logger = get_logger("file_monitor")
+
+# Filesystem types (as reported by QStorageInfo) that do not deliver change
+# notifications for writes made by other hosts
+NETWORK_FILESYSTEMS = frozenset(
+    (
+        "9p",
+        "afs",
+        "ceph",
+        "cifs",
+        "fuse.sshfs",
+        "glusterfs",
+        "gpfs",
+        "lustre",
+        "nfs",
+        "nfs4",
+        "smb3",
+        "smbfs",
+    )
+)
+
+# (mtime in ns, size) of a path, None if it does not exist
+Signature = Optional[tuple[int, int]]
+
+
+def is_network_path(path: Union[str, Path]) -> bool:
+    """
+    Whether a path is on a network filesystem.
+
+    Parameters:
+        path (str or Path): File or folder path
+
+    Returns:
+        bool: True if its filesystem type is one of NETWORK_FILESYSTEMS
+    """
+    storage = QStorageInfo(str(path))
+    if not storage.isValid():
+        return False
+    fs_type = bytes(storage.fileSystemType()).decode(errors="replace").lower()
+    return fs_type in NETWORK_FILESYSTEMS
+
+
+def _signature(path: str) -> Signature:
+    """(mtime in ns, size) of a path, None if it cannot be stat'ed."""
+    try:
+        file_stat = os.stat(path)
+    except OSError:
+        return None
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
+class FileMonitor(QObject):
+    """
+    Watch files and folders, reporting coalesced changes.
+
+    ``changed`` is emitted with the paths whose mtime or size changed (or
+    that were deleted), at most once per ``debounce_ms``: the first
+    notification starts the delay and the notifications received meanwhile
+    are reported with it. Paths are reported as they were given to
+    :meth:`watch`.
+
+    Paths on network filesystems (or that cannot be watched) are polled
+    every ``poll_min_ms`` after a change, then at an interval doubling up
+    to ``poll_max_ms`` while they do not change. Only polled paths are
+    stat'ed periodically; the poll timer stops when there are none.
+    """
+
+    changed = pyqtSignal(list)  # paths (str) that changed
+
+    def __init__(
+        self,
+        parent: Optional[QObject] = None,
+        debounce_ms: int = 50,
+        poll_min_ms: int = 250,
+        poll_max_ms: int = 4000,
+    ):
+        """
+        Initialize the monitor.
+
+        Parameters:
+            parent (QObject, optional): Parent object
+            debounce_ms (int): Delay between the first notification of a burst
+                and the changed signal
+            poll_min_ms (int): Polling interval of network paths after a change
+            poll_max_ms (int): Longest polling interval of network paths
+        """
+        super().__init__(parent)
+        self.poll_min_ms = poll_min_ms
+        self.poll_max_ms = max(poll_min_ms, poll_max_ms)
+        self._signatures: dict[str, Signature] = {}  # watched path -> last signature
+        self._polled: set[str] = set()  # watched paths that are polled
+        self._pending: set[str] = set()  # paths notified since the last report
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._onNotification)
+        self._watcher.directoryChanged.connect(self._onNotification)
+
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(debounce_ms)
+        self._debounce_timer.timeout.connect(self._report)
+
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setSingleShot(True)
+        self._poll_timer.setInterval(poll_min_ms)
+        self._poll_timer.timeout.connect(self._poll)
+
+    # ------------ watched paths
+
+    def watch(self, path: Union[str, Path], poll: Optional[bool] = None) -> None:
+        """
+        Start watching a file or folder.
+
+        Parameters:
+            path (str or Path): Path to watch (need not exist yet)
+            poll (bool, optional): Poll the path instead of relying on
+                notifications; by default, paths on network filesystems are polled
+        """
+        path = str(path)
+        if path in self._signatures:
+            return
+        self._signatures[path] = _signature(path)
+        if poll is None:
+            poll = is_network_path(path)
+        if poll or not self._watcher.addPath(path):
+            logger.debug(f"Polling {path}")
+            self._polled.add(path)
+            self._poll_timer.start(self.poll_min_ms)
+
+    def unwatch(self, path: Union[str, Path]) -> None:
+        """Stop watching a path."""
+        path = str(path)
+        self._signatures.pop(path, None)
+        if path in self._polled:
+            self._polled.discard(path)
+            if not self._polled:
+                self._poll_timer.stop()
+        elif path in self._watcher.files() or path in self._watcher.directories():
+            self._watcher.removePath(path)
+        self._pending.discard(path)
+
+    def setPaths(self, paths: Iterable[Union[str, Path]]) -> None:
+        """Watch exactly these paths (watching new ones, dropping the others)."""
+        wanted = dict.fromkeys(str(path) for path in paths if path)
+        for path in set(self._signatures).difference(wanted):
+            self.unwatch(path)
+        for path in wanted:
+            self.watch(path)
+
+    def paths(self) -> list[str]:
+        """Watched paths."""
+        return list(self._signatures)
+
+    def isPolled(self, path: Union[str, Path]) -> bool:
+        """Whether a watched path is polled (instead of notified)."""
+        return str(path) in self._polled
+
+    # ------------ changes
+
+    def _onNotification(self, path: str) -> None:
+        """A watched path changed: report it with the others of the burst."""
+        self._pending.add(path)
+        if not self._debounce_timer.isActive():
+            self._debounce_timer.start()
+
+    def _report(self) -> list[str]:
+        """
+        Stat the notified paths and emit those that really changed.
+
+        Files replaced (saved under a temporary name, then renamed) or deleted
+        are no longer watched by QFileSystemWatcher: they are watched again
+        as soon as they exist.
+
+        Returns:
+            list: Paths reported as changed
+        """
+        watched = set(self._watcher.files()) | set(self._watcher.directories())
+        lost = [
+            path
+            for path in self._signatures
+            if path not in watched and path not in self._polled
+        ]
+        pending = self._pending.union(lost)
+        self._pending = set()
+
+        changed = []
+        for path in sorted(pending):
+            if path not in self._signatures:
+                continue  # no longer watched
+            signature = _signature(path)
+            if path in lost and signature is not None:
+                self._watcher.addPath(path)
+            if signature != self._signatures[path]:
+                self._signatures[path] = signature
+                changed.append(path)
+        if changed:
+            self.changed.emit(changed)
+        return changed
+
+    def _poll(self) -> None:
+        """Stat the polled paths; poll sooner after a change, later otherwise."""
+        if not self._polled:
+            return
+        self._pending.update(self._polled)
+        changed = self._report()
+        if any(path in self._polled for path in changed):
+            interval = self.poll_min_ms
+        else:
+            interval = min(2 * self._poll_timer.interval(), self.poll_max_ms)
+        if self._polled:
+            self._poll_timer.start(interval)
@@ -0,0 +1,240 @@
+"""
+Persistent index of MDA file information across sessions.
+
+The folder scanner keeps, per file, the information shown in the folder table.
+This module stores it in a local SQLite database (keyed by resolved path,
+validated by size and mtime) so that reopening a folder only needs to read
+the files that are new or changed since the last visit. The metadata search
+terms of each file (see :mod:`~mdaviz.folder_search`) are stored with it.
+
+.. autosummary::
+
+    ~FolderIndex
+    ~get_folder_index
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterable, Optional
+from mdaviz.logger import get_logger
+
+# Get logger for this module
+logger = get_logger("folder_index")
+
+DEFAULT_INDEX_PATH = Path.home() / ".mdaviz" / "cache" / "folder_index.sqlite3"
+
+# Bump when the table layout changes; an index with another version is rebuilt.
+SCHEMA_VERSION = 3
+
+# file_info key -> (column name, type); the folder table HEADERS plus
+# Positioners, except Date and Size which are the mtime and size columns
+INFO_COLUMNS = {
+    "Prefix": ("prefix", "TEXT"),
+    "Scan #": ("scan_number", "INTEGER"),
+    "Points": ("points", "INTEGER"),
+    "Dim": ("rank", "INTEGER"),
+    "Positioners": ("positioners", "TEXT"),
+}
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    folder TEXT NOT NULL,
+    name TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    {", ".join(f"{column} {kind}" for column, kind in INFO_COLUMNS.values())},
+    dimensions TEXT,
+    terms TEXT,
+    full_read INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_folder ON files (folder);
+"""
+
+# (mtime, size, file_info) per resolved file path, as used by the folder scanner
+IndexEntry = tuple[float, int, dict[str, Any]]
+
+
+class FolderIndex:
+    """
+    SQLite-backed store of folder table rows.
+
+    Every method opens its own short-lived connection, so one instance can
+    be shared between the GUI thread and the scanner thread. Errors are
+    logged and treated as an empty index: the index is only an accelerator.
+    """
+
+    def __init__(self, db_path: Path = DEFAULT_INDEX_PATH):
+        """
+        Initialize the index.
+
+        Parameters:
+            db_path (Path): Location of the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating (or rebuilding) the schema if needed."""
+        if not self._initialized:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.db_path, timeout=5.0)
+        if not self._initialized:
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                connection.execute("DROP TABLE IF EXISTS files")
+            connection.executescript(SCHEMA)
+            connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            connection.commit()
+            self._initialized = True
+        return connection
+
+    def load_folder(
+        self,
+        folder: str,
+        require_positioners: bool = False,
+        require_terms: bool = False,
+    ) -> dict[str, IndexEntry]:
+        """
+        Read the stored rows of one folder (and its subfolders, for rows
+        stored by a recursive scan of the folder).
+
+        Parameters:
+            folder (str): Resolved folder path
+            require_positioners (bool): Only return rows read with the full
+                reader (which fills the Positioners column)
+            require_terms (bool): Only return rows stored with their metadata
+                search terms (see :mod:`~mdaviz.folder_search`)
+
+        Returns:
+            dict: resolved file path -> (mtime, size, file_info)
+        """
+        query = "SELECT * FROM files WHERE folder = ?"
+        if require_positioners:
+            query += " AND full_read = 1"
+        if require_terms:
+            query += " AND terms IS NOT NULL"
+        try:
+            connection = self._connect()
+            try:
+                connection.row_factory = sqlite3.Row
+                rows = connection.execute(query, (folder,)).fetchall()
+            finally:
+                connection.close()
+        except (sqlite3.Error, OSError) as e:
+            logger.error(f"Error reading folder index {self.db_path}: {e}")
+            return {}
+
+        entries = {}
+        for row in rows:
+            file_info: dict[str, Any] = {
+                "Name": row["name"],
+                "folderPath": str(Path(row["path"]).parent),
+            }
+            for key, (column, _) in INFO_COLUMNS.items():
+                file_info[key] = row[column]
+            file_info["Date"] = row["mtime"]
+            file_info["Size"] = row["size"]
+            file_info["Dimensions"] = json.loads(row["dimensions"] or "[]")
+            if row["terms"] is not None:
+                file_info["Terms"] = json.loads(row["terms"])
+            entries[row["path"]] = (row["mtime"], row["size"], file_info)
+        return entries
+
+    def update_folder(
+        self,
+        folder: str,
+        entries: dict[str, IndexEntry],
+        full_read: bool = False,
+        present: Optional[Iterable[str]] = None,
+    ) -> bool:
+        """
+        Store rows of one folder in a single transaction.
+
+        Parameters:
+            folder (str): Resolved folder path
+            entries (dict): resolved file path -> (mtime, size, file_info) to store
+            full_read (bool): Whether the entries were read with the full reader
+            present (iterable of str, optional): All file paths currently in the
+                folder; stored rows of other files are deleted
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        rows = [
+            (
+                path,
+                folder,
+                file_info.get("Name", Path(path).name),
+                size,
+                mtime,
+                *(file_info.get(key) for key in INFO_COLUMNS),
+                json.dumps(file_info.get("Dimensions", [])),
+                json.dumps(file_info["Terms"]) if "Terms" in file_info else None,
+                int(full_read),
+            )
+            for path, (mtime, size, file_info) in entries.items()
+        ]
+        placeholders = ", ".join("?" * (8 + len(INFO_COLUMNS)))
+        try:
+            connection = self._connect()
+            try:
+                with connection:
+                    if present is not None:
+                        stored = {
+                            path
+                            for (path,) in connection.execute(
+                                "SELECT path FROM files WHERE folder = ?", (folder,)
+                            )
+                        }
+                        gone = stored.difference(present)
+                        connection.executemany(
+                            "DELETE FROM files WHERE path = ?",
+                            [(path,) for path in gone],
+                        )
+                    connection.executemany(
+                        f"INSERT OR REPLACE INTO files VALUES ({placeholders})", rows
+                    )
+            finally:
+                connection.close()
+            return True
+        except (sqlite3.Error, OSError) as e:
+            logger.error(f"Error writing folder index {self.db_path}: {e}")
+            return False
+
+    def clear(self) -> bool:
+        """
+        Delete all stored rows.
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            connection = self._connect()
+            try:
+                with connection:
+                    connection.execute("DELETE FROM files")
+            finally:
+                connection.close()
+            return True
+        except (sqlite3.Error, OSError) as e:
+            logger.error(f"Error clearing folder index {self.db_path}: {e}")
+            return False
+
+
+# Global folder index instance
+_global_folder_index: Optional[FolderIndex] = None
+
+
+def get_folder_index() -> FolderIndex:
+    """
+    Get the global folder index instance.
+
+    Returns:
+        FolderIndex: Global folder index (in the user's ~/.mdaviz/cache folder)
+    """
+    global _global_folder_index
+    if _global_folder_index is None:
+        _global_folder_index = FolderIndex()
+    return _global_folder_index
@@ -0,0 +1,128 @@
+"""
+Metadata search across the files of a folder.
+
+While a folder is scanned, the header reader extracts the search terms of
+each file (:func:`metadata_terms`): positioner and detector PV names and
+descriptions, the scan number, and the values of selected environment PVs.
+The terms are stored with the rows in the folder index. The folder table
+builds a :class:`FolderSearchIndex` from them, an inverted index from
+terms to rows, and filters its rows with it.
+
+Queries are whitespace-separated tokens, all of which must match
+(case-insensitive):
+
+- ``m23``: a PV name, description or file name containing ``m23``
+- ``scan=12``: scan number 12
+- ``sample_name=X``: a term ``<key>=<value>`` whose key contains
+  ``sample_name`` and whose value is ``X`` (environment PVs)
+
+.. autosummary::
+
+    ~FolderSearchIndex
+    ~metadata_terms
+"""
+
+from typing import Any, Iterable, Optional
+import numpy as np
+
+
+def metadata_terms(header: dict[str, Any], environment: dict[str, str]) -> list[str]:
+    """
+    Search terms of one MDA file.
+
+    Parameters:
+        header (dict): File header, as returned by
+            :func:`~mdaviz.utils.read_mda_header`
+        environment (dict): Values of selected environment PVs
+            (PV name -> value), see :func:`~mdaviz.utils.read_mda_environment`
+
+    Returns:
+        list: Unique lowercase terms
+    """
+    terms = [f"scan={header['scan_number']}"]
+    for name, desc in header["positioners"] + header["detectors"]:
+        terms.extend((name, desc))
+    terms.extend(f"{name}={value}" for name, value in environment.items() if value)
+    return list(dict.fromkeys(term.lower() for term in terms if term))
+
+
+class FolderSearchIndex:
+    """
+    Inverted index from search terms to the rows of a folder table.
+
+    The postings (rows of each term) are held in one flat numpy array.
+    The vocabulary (unique terms) is scanned once per query token and the
+    rows of all matching terms are selected with a single numpy operation,
+    so a query takes milliseconds even for folders of thousands of files.
+    """
+
+    def __init__(self, rows: Iterable[tuple[int, Iterable[str]]], row_count: int):
+        """
+        Build the index.
+
+        Parameters:
+            rows (iterable): (row, terms) of the rows to index; rows that are
+                not given never match a query
+            row_count (int): Number of rows of the table
+        """
+        postings: dict[str, list[int]] = {}
+        for row, terms in rows:
+            for term in terms:
+                if term:
+                    postings.setdefault(term.lower(), []).append(row)
+        self.row_count = row_count
+        self._terms = list(postings)
+        lengths = [len(rows) for rows in postings.values()]
+        self._rows = np.fromiter(
+            (row for rows in postings.values() for row in rows),
+            dtype=np.int64,
+            count=sum(lengths),
+        )
+        self._row_terms = np.repeat(np.arange(len(lengths)), lengths)  # term of each
+        self._values: dict[str, list[int]] = {}  # value of key=value terms -> terms
+        for n, term in enumerate(self._terms):
+            key, sep, value = term.partition("=")
+            if sep:
+                self._values.setdefault(value, []).append(n)
+
+    def __len__(self) -> int:
+        """Number of unique terms."""
+        return len(self._terms)
+
+    def search(self, query: str) -> Optional[np.ndarray]:
+        """
+        Find the rows matching a query.
+
+        Parameters:
+            query (str): Whitespace-separated tokens (see the module documentation)
+
+        Returns:
+            numpy array or None: Boolean mask of the matching rows, or None
+            if the query is empty (no filter)
+        """
+        tokens = query.lower().split()
+        if not tokens:
+            return None
+        mask = np.ones(self.row_count, dtype=bool)
+        for token in tokens:
+            mask &= self._match(token)
+        return mask
+
+    def _match(self, token: str) -> np.ndarray:
+        """Boolean mask of the rows with a term matching one token."""
+        key, sep, value = token.partition("=")
+        if sep:
+            matches = [
+                n
+                for n in self._values.get(value, [])
+                if key in self._terms[n].partition("=")[0]
+            ]
+        else:
+            matches = [n for n, term in enumerate(self._terms) if token in term]
+        mask = np.zeros(self.row_count, dtype=bool)
+        if matches:
+            matched = np.zeros(len(self._terms), dtype=bool)
+            matched[matches] = True
+            rows = self._rows[matched[self._row_terms]]
+            mask[rows[rows < self.row_count]] = True
+        return mask
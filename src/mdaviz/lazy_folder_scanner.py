@@ -9,16 +9,36 @@ with support for batch processing and progress tracking.
     ~LazyFolderScanner
     ~FolderScanResult
     ~FolderScanWorker
+    ~ScanPriority
+    ~DirectoryListing
+    ~FolderDelta
+    ~FolderDeltaTracker
+    ~FolderDeltaWorker
+    ~FileRefreshWorker
+    ~list_mda_files
+    ~list_mda_directory
 """
 
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Optional, Callable
+from typing import Any, Optional, Callable, Iterable, Sequence
 from PyQt6.QtCore import QObject, QThread, pyqtSignal
-from mdaviz.utils import get_file_info_lightweight, get_file_info_full
-from dataclasses import dataclass
+from mdaviz.utils import (
+    get_file_info_full,
+    get_file_info_header,
+    get_file_info_lightweight,
+    get_file_info_placeholder,
+)
+from dataclasses import dataclass, field
 from mdaviz.logger import get_logger
 from mdaviz.progress_dialog import AsyncProgressDialog
 from mdaviz.lazy_loading_config import get_config
+from mdaviz.folder_index import FolderIndex, get_folder_index
+from mdaviz.paged_info_list import PagedInfoList
 
 # Get logger for this module
 logger = get_logger("lazy_folder_scanner")
@@ -27,9 +47,68 @@ logger = get_logger("lazy_folder_scanner")
 # when setStatus/statusbar triggers event processing and re-enters progress handler).
 PROGRESS_EMIT_INTERVAL = 100
 
+# Minimum time between two partial results of a progressive scan
+PROGRESSIVE_UPDATE_INTERVAL_S = 0.2
 
-# Cache key: resolved path str; value: (mtime, file_info dict)
-FileInfoCache = dict[str, tuple[float, dict[str, Any]]]
+
+# Cache key: resolved path str; value: (mtime, size, file_info dict)
+FileInfoCache = dict[str, tuple[float, int, dict[str, Any]]]
+
+# An MDA file with the stat result obtained while listing its folder
+MdaFileEntry = tuple[Path, os.stat_result]
+
+
+@dataclass
+class DirectoryListing:
+    """MDA files and subdirectories of one directory (see list_mda_directory)."""
+
+    mtime: float  # mtime of the directory when it was listed
+    files: list[MdaFileEntry]  # sorted by file name
+    subdirs: list[str]  # names of the subdirectories (symbolic links excluded)
+
+
+def list_mda_files(folder_path: Path) -> list[MdaFileEntry]:
+    """
+    List the MDA files of a folder with a single ``os.scandir`` pass.
+
+    Each file is stat'ed exactly once; the stat result is returned with the
+    path so that callers (file info readers, caches) do not stat it again.
+
+    Parameters:
+        folder_path (Path): Folder to list
+
+    Returns:
+        list[tuple[Path, os.stat_result]]: MDA files sorted by file name
+    """
+    return list_mda_directory(folder_path).files
+
+
+def list_mda_directory(folder_path: Path) -> DirectoryListing:
+    """
+    List the MDA files and the subdirectories of a folder (one ``os.scandir``).
+
+    Parameters:
+        folder_path (Path): Folder to list
+
+    Returns:
+        DirectoryListing: MDA files (with their stat results) and subdirectories
+    """
+    mtime = os.stat(folder_path).st_mtime
+    entries = []
+    subdirs = []
+    with os.scandir(folder_path) as it:
+        for entry in it:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.name)
+                elif entry.name.endswith(".mda") and entry.is_file():
+                    entries.append((folder_path / entry.name, entry.stat()))
+            except OSError as e:
+                # File vanished or is unreadable between listing and stat
+                logger.debug(f"Skipping {entry.path}: {e}")
+    entries.sort(key=lambda item: item[0].name)
+    subdirs.sort()
+    return DirectoryListing(mtime, entries, subdirs)
 
 
 @dataclass
@@ -37,6 +116,7 @@ class FolderScanResult:
     """Result of a folder scan operation."""
 
     file_list: list[str]
+    # A PagedInfoList (rows read on demand) for folders scanned with paging
     file_info_list: list[dict[str, Any]]
     total_files: int
     scanned_files: int
@@ -44,6 +124,99 @@ class FolderScanResult:
     error_message: Optional[str] = None
     is_progressive: bool = False  # Whether this is a progressive scan
     file_info_cache: Optional[FileInfoCache] = None  # For incremental refresh
+    # Partial results: rows read since the previous update (None: all rows are new)
+    updated_rows: Optional[list[int]] = None
+    folder_path: Optional[Path] = None  # Folder that was scanned
+    # Recursive scans: listing of every directory (resolved path str -> listing)
+    directory_cache: Optional[dict[str, DirectoryListing]] = None
+
+
+@dataclass
+class FolderDelta:
+    """Changes of the MDA files of a folder between two listings."""
+
+    folder_path: Path
+    added: list[MdaFileEntry] = field(default_factory=list)  # in file-name order
+    removed: list[str] = field(default_factory=list)  # file names
+    changed: list[MdaFileEntry] = field(default_factory=list)  # other size or mtime
+    # File info of the added and changed files that could be read: name (path
+    # relative to the folder, as in FolderScanResult.file_list) -> info
+    file_infos: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+class FolderDeltaTracker:
+    """
+    Snapshot of the MDA files of a folder, to find what changed in it.
+
+    The snapshot maps file names to (size, mtime). :meth:`update` lists the
+    folder again (one ``os.scandir`` pass, see :func:`list_mda_files`) and
+    diffs the listing against the snapshot, which costs a dict lookup per
+    file. Files seeded by name only (already shown in the folder table)
+    are never reported as added, nor as changed by the first update.
+
+    Only the files of the folder itself are tracked (not those of its
+    subfolders).
+    """
+
+    def __init__(self, folder_path: Path, names: Iterable[str] = ()):
+        """
+        Initialize the tracker.
+
+        Parameters:
+            folder_path (Path): Folder to track
+            names (iterable of str): Names of the files already known
+                (names of files in subfolders are ignored)
+        """
+        self.folder_path = Path(folder_path)
+        self._snapshot: dict[str, Optional[tuple[int, float]]] = dict.fromkeys(
+            name for name in names if "/" not in name
+        )
+
+    def __len__(self) -> int:
+        """Number of files in the snapshot."""
+        return len(self._snapshot)
+
+    def update(self) -> FolderDelta:
+        """List the folder and return (and forget) its changes."""
+        return self.diff(list_mda_files(self.folder_path))
+
+    def diff(self, entries: Iterable[MdaFileEntry]) -> FolderDelta:
+        """
+        Compare a listing of the folder with the snapshot, then keep it.
+
+        Parameters:
+            entries (iterable): MDA files of the folder, with their stat results
+
+        Returns:
+            FolderDelta: Files added, removed and changed since the snapshot
+        """
+        delta = FolderDelta(self.folder_path)
+        snapshot = self._snapshot
+        listed = {}
+        for path, file_stat in entries:
+            name = path.name
+            signature = (file_stat.st_size, file_stat.st_mtime)
+            listed[name] = signature
+            if name not in snapshot:
+                delta.added.append((path, file_stat))
+            elif snapshot[name] not in (None, signature):
+                delta.changed.append((path, file_stat))
+        if len(listed) != len(snapshot) + len(delta.added):
+            delta.removed = [name for name in snapshot if name not in listed]
+        self._snapshot = listed
+        return delta
+
+
+@dataclass(frozen=True)
+class ScanPriority:
+    """Reading order of a folder scan, as reported by the folder view."""
+
+    visible_names: tuple[str, ...] = ()  # file names shown in the view, read first
+    sort_column: Optional[str] = None  # sort column label of the view
+    descending: bool = False  # sort order of the view
 
 
 class LazyFolderScanner(QObject):
@@ -65,6 +238,8 @@ class LazyFolderScanner(QObject):
     scan_complete = pyqtSignal(object)  # FolderScanResult
     scan_error = pyqtSignal(str)  # error message
     progressive_scan_update = pyqtSignal(object)  # FolderScanResult (partial)
+    folder_delta = pyqtSignal(object)  # FolderDelta (with the file info read)
+    files_refreshed = pyqtSignal(object)  # FolderDelta (changed files read again)
 
     def __init__(
         self,
@@ -89,10 +264,24 @@ class LazyFolderScanner(QObject):
         self.progressive_loading = progressive_loading
         self._scanning = False
         self._current_scan_path: Optional[Path] = None
-        self._file_info_cache: FileInfoCache = {}  # path -> (mtime, file_info); reused on refresh
+        self._file_info_cache: FileInfoCache = {}  # path -> (mtime, size, file_info); reused on refresh
+        # Recursive scans: directory listings reused on refresh if unchanged
+        self._directory_cache: dict[str, DirectoryListing] = {}
         self.scanner_thread: Optional[QThread] = None
         self.scanner_worker: Optional[FolderScanWorker] = None
         self._progress_dialog: Optional[AsyncProgressDialog] = None
+        self._scan_priority: Optional[ScanPriority] = None  # last reported by the view
+        self._priority_folder: Optional[Path] = None  # folder shown by the view
+        # Changes of the folder shown (see check_folder_async)
+        self._delta_tracker: Optional[FolderDeltaTracker] = None
+        self._delta_thread: Optional[QThread] = None
+        self._delta_worker: Optional["FolderDeltaWorker"] = None
+        self._delta_again = False  # folder changed while it was being checked
+        # Files to read again (see refresh_files_async), oldest change first
+        self._refresh_folder: Optional[Path] = None
+        self._refresh_queue: OrderedDict[str, Path] = OrderedDict()
+        self._refresh_thread: Optional[QThread] = None
+        self._refresh_worker: Optional["FileRefreshWorker"] = None
 
     def scan_folder(
         self,
@@ -100,7 +289,11 @@ class LazyFolderScanner(QObject):
         progress_callback: Optional[Callable[[int, int], None]] = None,
     ) -> FolderScanResult:
         """
-        Scan a folder for MDA files using lazy loading.
+        Scan a folder for MDA files in the calling thread.
+
+        Runs the worker of :meth:`scan_folder_async` (same readers and
+        options) synchronously: progress and partial results are emitted as
+        for asynchronous scans, and the result by ``scan_complete``.
 
         Parameters:
             folder_path (Path): Path to the folder to scan
@@ -109,232 +302,22 @@ class LazyFolderScanner(QObject):
         Returns:
             FolderScanResult: Result of the scan operation
         """
-        if not folder_path.exists() or not folder_path.is_dir():
-            return FolderScanResult([], [], 0, 0, False, "Folder does not exist")
-
-        # Get all MDA files in the folder
-        mda_files = list(folder_path.glob("*.mda"))
-        total_files = len(mda_files)
-
-        if total_files == 0:
-            return FolderScanResult([], [], 0, 0, True, "No MDA files found")
-
-        # For very large directories, use progressive loading
-        if total_files > self.max_files and self.progressive_loading:
-            return self._progressive_scan(folder_path, mda_files, progress_callback)
-
-        if total_files > self.max_files:
+        worker = self._create_scan_worker(Path(folder_path))
+        results: list[FolderScanResult] = []
+        errors: list[str] = []
+        worker.progress.connect(self.scan_progress)
+        if progress_callback is not None:
+            worker.progress.connect(progress_callback)
+        worker.progressive_update.connect(self.progressive_scan_update)
+        worker.complete.connect(results.append)
+        worker.error.connect(errors.append)
+        worker.scan()
+        if not results:
             return FolderScanResult(
-                [],
-                [],
-                total_files,
-                0,
-                False,
-                f"Too many files ({total_files} > {self.max_files})",
+                [], [], 0, 0, False, errors[0] if errors else "Scan cancelled"
             )
-
-        # Read setting in main thread (QSettings is not thread-safe)
-        from mdaviz.user_settings import settings
-
-        show_pos = settings.getKey("show_positioners_in_folder")
-        if isinstance(show_pos, str):
-            show_pos = show_pos.lower() in ("true", "1", "yes", "on")
-        show_pos = bool(show_pos)
-
-        # Scan files in batches
-        file_list = []
-        file_info_list = []
-        scanned_files = 0
-
-        for i in range(0, total_files, self.batch_size):
-            batch_files = mda_files[i : i + self.batch_size]
-
-            for file_path in batch_files:
-                try:
-                    if self.use_lightweight_scan and not show_pos:
-                        file_info = get_file_info_lightweight(file_path)
-                    else:
-                        file_info = get_file_info_full(file_path)
-
-                    file_list.append(file_path.name)
-                    file_info_list.append(file_info)
-                    scanned_files += 1
-
-                    # Emit progress signal
-                    self.scan_progress.emit(scanned_files, total_files)
-                    if progress_callback:
-                        progress_callback(scanned_files, total_files)
-
-                except Exception as e:
-                    # Continue scanning other files even if one fails
-                    logger.error(f"Error scanning {file_path}: {e}")
-                    continue
-
-        result = FolderScanResult(
-            file_list=file_list,
-            file_info_list=file_info_list,
-            total_files=total_files,
-            scanned_files=scanned_files,
-            is_complete=True,
-        )
-
-        self.scan_complete.emit(result)
-        return result
-
-    def _progressive_scan(
-        self,
-        folder_path: Path,
-        mda_files: list[Path],
-        progress_callback: Optional[Callable[[int, int], None]] = None,
-    ) -> FolderScanResult:
-        """
-        Perform progressive scanning for very large directories.
-
-        This method scans files in chunks and provides partial results
-        to keep the UI responsive.
-
-        Parameters:
-            folder_path (Path): Path to the folder to scan
-            mda_files (list[Path]): List of MDA files to scan
-            progress_callback (callable, optional): Callback for progress updates
-
-        Returns:
-            FolderScanResult: Initial result with first batch of files
-        """
-        total_files = len(mda_files)
-
-        from mdaviz.user_settings import settings
-
-        show_pos = settings.getKey("show_positioners_in_folder")
-        if isinstance(show_pos, str):
-            show_pos = show_pos.lower() in ("true", "1", "yes", "on")
-        show_pos = bool(show_pos)
-
-        # For progressive loading, we'll scan the first batch immediately
-        # and return a partial result
-        initial_batch_size = min(self.batch_size * 2, total_files)
-
-        file_list = []
-        file_info_list = []
-        scanned_files = 0
-
-        # Scan initial batch
-        for i in range(initial_batch_size):
-            file_path = mda_files[i]
-            try:
-                if self.use_lightweight_scan and not show_pos:
-                    file_info = get_file_info_lightweight(file_path)
-                else:
-                    file_info = get_file_info_full(file_path)
-
-                file_list.append(file_path.name)
-                file_info_list.append(file_info)
-                scanned_files += 1
-
-                # Emit progress signal
-                self.scan_progress.emit(scanned_files, total_files)
-                if progress_callback:
-                    progress_callback(scanned_files, total_files)
-
-            except Exception as e:
-                logger.error(f"Error scanning {file_path}: {e}")
-                continue
-
-        # Return partial result
-        result = FolderScanResult(
-            file_list=file_list,
-            file_info_list=file_info_list,
-            total_files=total_files,
-            scanned_files=scanned_files,
-            is_complete=False,  # Not complete yet
-            is_progressive=True,
-        )
-
-        # Emit progressive update
-        self.progressive_scan_update.emit(result)
-
-        # Continue scanning in background
-        self._continue_progressive_scan(
-            folder_path, mda_files, scanned_files, progress_callback
-        )
-
-        return result
-
-    def _continue_progressive_scan(
-        self,
-        folder_path: Path,
-        mda_files: list[Path],
-        start_index: int,
-        progress_callback: Optional[Callable[[int, int], None]] = None,
-    ) -> None:
-        """
-        Continue progressive scanning from a given index.
-
-        Parameters:
-            folder_path (Path): Path to the folder to scan
-            mda_files (list[Path]): List of MDA files to scan
-            start_index (int): Index to start scanning from
-            progress_callback (callable, optional): Callback for progress updates
-        """
-        total_files = len(mda_files)
-        file_list = []
-        file_info_list = []
-        scanned_files = start_index
-
-        from mdaviz.user_settings import settings
-
-        show_pos = settings.getKey("show_positioners_in_folder")
-        if isinstance(show_pos, str):
-            show_pos = show_pos.lower() in ("true", "1", "yes", "on")
-        show_pos = bool(show_pos)
-
-        # Continue scanning from where we left off
-        for i in range(start_index, total_files, self.batch_size):
-            batch_files = mda_files[i : i + self.batch_size]
-
-            for file_path in batch_files:
-                try:
-                    if self.use_lightweight_scan and not show_pos:
-                        file_info = get_file_info_lightweight(file_path)
-                    else:
-                        file_info = get_file_info_full(file_path)
-
-                    file_list.append(file_path.name)
-                    file_info_list.append(file_info)
-                    scanned_files += 1
-
-                    # Emit progress signal
-                    self.scan_progress.emit(scanned_files, total_files)
-                    if progress_callback:
-                        progress_callback(scanned_files, total_files)
-
-                except Exception as e:
-                    logger.error(f"Error scanning {file_path}: {e}")
-                    continue
-
-            # Emit progressive update every batch
-            if file_list:
-                result = FolderScanResult(
-                    file_list=file_list,
-                    file_info_list=file_info_list,
-                    total_files=total_files,
-                    scanned_files=scanned_files,
-                    is_complete=(scanned_files >= total_files),
-                    is_progressive=True,
-                )
-                self.progressive_scan_update.emit(result)
-
-        # Final completion
-        if scanned_files >= total_files:
-            final_result = FolderScanResult(
-                file_list=file_list,
-                file_info_list=file_info_list,
-                total_files=total_files,
-                scanned_files=scanned_files,
-                is_complete=True,
-                is_progressive=True,
-            )
-            self.scan_complete.emit(final_result)
+        self.scan_complete.emit(results[0])
+        return results[0]
 
     def scan_folder_async(self, folder_path: Path) -> None:
         """
@@ -374,6 +357,7 @@ class LazyFolderScanner(QObject):
                 return
 
         self._scanning = True
+        self._delta_tracker = None  # the table is about to list the folder again
         resolved_folder = Path(folder_path).resolve()
         # Clear cache when switching to a different folder so we don't mix or grow unbounded
         if (
@@ -381,6 +365,7 @@ class LazyFolderScanner(QObject):
             and resolved_folder != self._current_scan_path.resolve()
         ):
             self._file_info_cache = {}
+            self._directory_cache = {}
         self._current_scan_path = folder_path
 
         # Copy of cache for worker (same folder: reuse unchanged file info on refresh)
@@ -398,24 +383,12 @@ class LazyFolderScanner(QObject):
         else:
             self._progress_dialog = None
 
-        # Read setting in main thread (QSettings is not thread-safe)
-        from mdaviz.user_settings import settings
-
-        show_pos = settings.getKey("show_positioners_in_folder")
-        if isinstance(show_pos, str):
-            show_pos = show_pos.lower() in ("true", "1", "yes", "on")
-        show_pos = bool(show_pos)
-
         # Create a worker thread for scanning
         self.scanner_thread = QThread()
-        self.scanner_worker = FolderScanWorker(
+        self.scanner_worker = self._create_scan_worker(
             folder_path,
-            self.batch_size,
-            self.max_files,
-            self.use_lightweight_scan,
-            self.progressive_loading,
             previous_cache=previous_cache,
-            show_positioners=show_pos,
+            previous_directories=dict(self._directory_cache),
         )
 
         # Move worker to thread
@@ -452,6 +425,8 @@ class LazyFolderScanner(QObject):
         """Handle scan completion."""
         if result.file_info_cache is not None:
             self._file_info_cache = result.file_info_cache
+        if result.directory_cache is not None:
+            self._directory_cache = result.directory_cache
         # Close progress dialog
         if hasattr(self, "_progress_dialog") and self._progress_dialog:
             self._progress_dialog.complete_async()
@@ -470,14 +445,245 @@ class LazyFolderScanner(QObject):
             self._progress_dialog.fail_async(error_message)
         self.scan_error.emit(error_message)
 
+    def check_folder_async(self, folder_path: Path, known_names: Sequence[str]) -> None:
+        """
+        Find the files added to, removed from or changed in a folder, in a
+        separate thread; the result is emitted by ``folder_delta``.
+
+        The folder is listed and compared with the previous listing (see
+        :class:`FolderDeltaTracker`); the file info of the added and changed
+        files is read in the same thread, with the options of folder scans.
+        If the folder changes again while it is being checked, it is checked
+        once more afterwards.
+
+        Parameters:
+            folder_path (Path): Folder shown in the folder table
+            known_names (sequence of str): Names of the files in the folder
+                table, used the first time the folder is checked (and after
+                each full scan)
+        """
+        folder_path = Path(folder_path)
+        if self._delta_thread is not None:
+            self._delta_again = True
+            return
+        tracker = self._delta_tracker
+        if tracker is None or tracker.folder_path != folder_path:
+            tracker = FolderDeltaTracker(folder_path, known_names)
+            self._delta_tracker = tracker
+        self._delta_again = False
+        self._delta_worker = FolderDeltaWorker(
+            tracker, self.batch_size, **self._reader_options()
+        )
+        self._delta_thread = self._run_worker(
+            self._delta_worker, self._on_folder_delta, self._on_delta_thread_finished
+        )
+
+    def refresh_files_async(
+        self, folder_path: Optional[Path], file_paths: Iterable[Path]
+    ) -> None:
+        """
+        Read the file info of files being written again, in a separate thread;
+        the result is emitted by ``files_refreshed``.
+
+        The files are queued (at most ``live_refresh_queue_size``, the least
+        recently changed are dropped) and read as one batch: the files queued
+        while a batch is read make the next batch. Each file is read once per
+        batch, with the options of folder scans.
+
+        Parameters:
+            folder_path (Path): Folder of the files (the files queued for
+                another folder are dropped); None to start the next batch
+            file_paths (iterable of Path): Files of the folder that changed
+        """
+        queue = self._refresh_queue
+        if folder_path is not None and folder_path != self._refresh_folder:
+            queue.clear()
+            self._refresh_folder = folder_path
+        for file_path in file_paths:
+            key = str(file_path)
+            queue.pop(key, None)
+            queue[key] = Path(file_path)
+        max_queued = max(1, get_config().live_refresh_queue_size)
+        while len(queue) > max_queued:
+            dropped, _ = queue.popitem(last=False)
+            logger.debug(f"Refresh queue full: dropped {dropped}")
+        if queue and self._refresh_thread is None:
+            batch = list(queue.values())
+            queue.clear()
+            self._refresh_worker = FileRefreshWorker(
+                self._refresh_folder, batch, self.batch_size, **self._reader_options()
+            )
+            self._refresh_thread = self._run_worker(
+                self._refresh_worker,
+                self.files_refreshed.emit,
+                self._on_refresh_thread_finished,
+            )
+
+    def _on_refresh_thread_finished(self) -> None:
+        """Read the files queued while the previous batch was read."""
+        self._refresh_thread = None
+        self._refresh_worker = None
+        self.refresh_files_async(None, ())
+
+    def _reader_options(self) -> dict[str, Any]:
+        """File info reader options of folder scans (reads settings: GUI thread)."""
+        from mdaviz.user_settings import settings
+
+        return dict(
+            use_lightweight_scan=self.use_lightweight_scan,
+            show_positioners=settings.getBoolKey("show_positioners_in_folder"),
+            scan_workers=get_config().folder_scan_workers,
+            recursive=settings.getBoolKey("scan_subfolders"),
+            search_terms=get_config().folder_search_enabled,
+            environment_pvs=get_config().folder_search_environment_pvs,
+        )
+
+    def _scan_priority_for(self, folder_path: Path) -> ScanPriority:
+        """Reading order of a scan: as last reported by the folder view, else
+        the sort preference (reads settings: GUI thread)."""
+        from mdaviz.user_settings import settings
+
+        priority = self._scan_priority
+        if priority is None:
+            sort_newest = settings.getBoolKey("sort_newest_first")
+            return ScanPriority(
+                sort_column="Date" if sort_newest else None, descending=sort_newest
+            )
+        if self._priority_folder != Path(folder_path).resolve():
+            # Visible rows belong to another folder; keep only the sort order
+            return ScanPriority(
+                sort_column=priority.sort_column, descending=priority.descending
+            )
+        return priority
+
+    def _create_scan_worker(
+        self,
+        folder_path: Path,
+        previous_cache: Optional[FileInfoCache] = None,
+        previous_directories: Optional[dict[str, DirectoryListing]] = None,
+    ) -> "FolderScanWorker":
+        """
+        Create the worker of a folder scan, with the options of the preferences.
+
+        Reads settings: must run in the GUI thread (QSettings is not thread-safe).
+
+        Parameters:
+            folder_path (Path): Folder to scan
+            previous_cache (dict, optional): File info of the last scan
+            previous_directories (dict, optional): Directory listings of the
+                last recursive scan
+
+        Returns:
+            FolderScanWorker: The worker, not started
+        """
+        config = get_config()
+        return FolderScanWorker(
+            folder_path,
+            self.batch_size,
+            self.max_files,
+            progressive_loading=self.progressive_loading,
+            previous_cache=previous_cache,
+            folder_index=get_folder_index() if config.folder_index_enabled else None,
+            priority=self._scan_priority_for(folder_path),
+            paged=config.folder_scan_paged,
+            cache_rows=config.folder_row_cache_size,
+            previous_directories=previous_directories,
+            **self._reader_options(),
+        )
+
+    def _run_worker(
+        self,
+        worker: "FolderScanWorker",
+        on_complete: Callable[[Any], None],
+        on_finished: Callable[[], None],
+    ) -> QThread:
+        """
+        Run a worker in a new thread, deleted (with the worker) when done.
+
+        Parameters:
+            worker (FolderScanWorker): Worker whose scan() runs in the thread
+            on_complete (callable): Slot of the worker's complete signal
+            on_finished (callable): Called (GUI thread) when the thread finished
+
+        Returns:
+            QThread: The started thread
+        """
+        thread = QThread()
+        worker.moveToThread(thread)
+        thread.started.connect(worker.scan)
+        worker.complete.connect(on_complete)
+        worker.error.connect(lambda message: logger.warning(message))
+        worker.finished.connect(thread.quit)
+        thread.finished.connect(on_finished)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        thread.start()
+        return thread
+
+    def _on_folder_delta(self, delta: "FolderDelta") -> None:
+        """Emit the changes found, unless the folder was scanned again since."""
+        worker = self._delta_worker
+        if worker is not None and worker.tracker is self._delta_tracker:
+            self.folder_delta.emit(delta)
+
+    def _on_delta_thread_finished(self) -> None:
+        """Check the folder again if it changed while it was being checked."""
+        tracker = self._delta_tracker
+        self._delta_thread = None
+        self._delta_worker = None
+        if self._delta_again and tracker is not None:
+            self.check_folder_async(tracker.folder_path, ())
+
     def is_scanning(self) -> bool:
         """Check if a scan is currently in progress."""
         return self._scanning
 
+    def set_scan_priority(
+        self,
+        folder_path: Optional[Path],
+        visible_names: Sequence[str] = (),
+        sort_column: Optional[str] = None,
+        descending: bool = False,
+    ) -> None:
+        """
+        Report the state of the folder view so scans read what it shows first.
+
+        Applies to the running scan (if it is of the same folder) and to the
+        next scans.
+
+        Parameters:
+            folder_path (Path, optional): Folder shown by the view
+            visible_names (sequence of str): File names of the visible rows
+            sort_column (str, optional): Sort column label of the view
+            descending (bool): Whether the view is sorted in descending order
+        """
+        self._scan_priority = ScanPriority(
+            tuple(visible_names), sort_column, descending
+        )
+        self._priority_folder = (
+            Path(folder_path).resolve() if folder_path is not None else None
+        )
+        worker = self.scanner_worker
+        if (
+            self._scanning
+            and worker is not None
+            and self._current_scan_path is not None
+            and self._priority_folder == Path(self._current_scan_path).resolve()
+        ):
+            worker.set_priority(visible_names, sort_column, descending)
+        elif self._scanning and worker is not None:
+            worker.set_priority((), sort_column, descending)
+
     def cancel_scan(self) -> None:
-        """Cancel the current scan operation."""
+        """Cancel the current scan operation (and folder check)."""
         if self.scanner_worker is not None:
             self.scanner_worker.cancel()
+        if self._delta_worker is not None:
+            self._delta_worker.cancel()
+        self._delta_again = False
+        if self._refresh_worker is not None:
+            self._refresh_worker.cancel()
+        self._refresh_queue.clear()
         self._scanning = False
         self._current_scan_path = None
 
@@ -485,6 +691,33 @@ class LazyFolderScanner(QObject):
 class FolderScanWorker(QObject):
     """
     Worker class for performing folder scans in background threads.
+
+    File headers are read in batches. With ``scan_workers > 1`` the files of
+    each batch that are not in the file-info cache are read concurrently by a
+    thread pool (header reads are I/O bound); results are always collected
+    and emitted in file-name order.
+
+    Files are read in the order of the folder view (see :meth:`set_priority`):
+    the rows visible in the view first, then the others in the view's sort
+    order. With progressive loading, partial results list every file, with
+    placeholder rows (see :func:`~mdaviz.utils.get_file_info_placeholder`)
+    for the files not read yet.
+
+    With a ``folder_index``, rows stored by earlier sessions seed the cache
+    and the rows of new or changed files are written back after the scan.
+
+    With ``paged``, folders of more than ``max_files`` files are only
+    listed: the result holds a :class:`~mdaviz.paged_info_list.PagedInfoList`
+    whose rows are read when the folder table shows them.
+
+    With ``recursive``, the MDA files of all subfolders are scanned as well.
+    The directory tree is walked one level at a time, the directories of a
+    level being listed concurrently by the thread pool. A directory whose
+    mtime did not change since ``previous_directories`` were listed is not
+    listed again (files are only added, removed or renamed when the mtime of
+    their directory changes). Files are identified by their path relative
+    to the scanned folder (their ``Name`` in the result's ``file_list``)
+    and their file info has a ``Folder`` key: the relative subfolder.
     """
 
     # Signals
@@ -503,6 +736,15 @@ class FolderScanWorker(QObject):
         progressive_loading: bool = True,
         previous_cache: Optional[FileInfoCache] = None,
         show_positioners: bool = False,
+        scan_workers: int = 1,
+        folder_index: Optional[FolderIndex] = None,
+        priority: Optional[ScanPriority] = None,
+        paged: bool = False,
+        cache_rows: int = 2000,
+        recursive: bool = False,
+        previous_directories: Optional[dict[str, DirectoryListing]] = None,
+        search_terms: bool = False,
+        environment_pvs: Iterable[str] = (),
     ):
         """
         Initialize the folder scan worker.
@@ -513,8 +755,26 @@ class FolderScanWorker(QObject):
             max_files (int): Maximum number of files to scan before warning
             use_lightweight_scan (bool): Whether to use lightweight scanning
             progressive_loading (bool): Whether to use progressive loading
-            previous_cache (dict, optional): Cache from last scan (path -> (mtime, file_info))
-                to avoid re-reading unchanged files on refresh.
+            previous_cache (dict, optional): Cache from last scan
+                (path -> (mtime, size, file_info)) to avoid re-reading unchanged
+                files on refresh.
+            show_positioners (bool): Fill the Positioners column (from the file headers)
+            scan_workers (int): Number of threads reading file headers concurrently
+            folder_index (FolderIndex, optional): Persistent index to seed the
+                cache from and to update
+            priority (ScanPriority, optional): Initial reading order (file-name
+                order if not given)
+            paged (bool): List folders of more than max_files files without
+                reading them (rows are read on demand)
+            cache_rows (int): Rows of a paged folder kept in memory
+            recursive (bool): Scan the subfolders too
+            previous_directories (dict, optional): Directory listings of the
+                last recursive scan (resolved path -> listing), reused for
+                directories whose mtime did not change
+            search_terms (bool): Read the metadata search terms of each file
+                (header reader, see :mod:`~mdaviz.folder_search`)
+            environment_pvs (iterable of str): Environment PVs whose values
+                are search terms
         """
         super().__init__()
         self.folder_path = folder_path
@@ -523,8 +783,24 @@ class FolderScanWorker(QObject):
         self.use_lightweight_scan = use_lightweight_scan
         self.progressive_loading = progressive_loading
         self.show_positioners = show_positioners
+        self.scan_workers = max(1, scan_workers)
         self._previous_cache = dict(previous_cache) if previous_cache else {}
+        self._folder_index = folder_index
+        self._read_entries: FileInfoCache = {}  # files read (not cached) in this scan
+        self._resolved_folder = Path(folder_path)
+        self._executor: Optional[ThreadPoolExecutor] = None
         self._cancelled = False
+        # Set from the GUI thread, read between batches by the scan thread
+        self._priority_lock = threading.Lock()
+        self._priority = priority if priority is not None else ScanPriority()
+        self._priority_changed = True
+        self.paged = paged
+        self.cache_rows = cache_rows
+        self.recursive = recursive
+        self._previous_directories = dict(previous_directories or {})
+        self._directories: dict[str, DirectoryListing] = {}  # listed in this scan
+        self.search_terms = search_terms
+        self.environment_pvs = tuple(environment_pvs)
 
     def scan(self) -> None:
         """Perform the folder scan operation."""
@@ -532,249 +808,518 @@ class FolderScanWorker(QObject):
             if not self.folder_path.exists() or not self.folder_path.is_dir():
                 self.error.emit("Folder does not exist")
                 return
+            # Cache keys use the resolved folder, resolved once per scan
+            self._resolved_folder = self.folder_path.resolve()
+            if self.scan_workers > 1:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.scan_workers, thread_name_prefix="mda-scan"
+                )
+            try:
+                self._scan()
+            finally:
+                if self._executor is not None:
+                    self._executor.shutdown(wait=True, cancel_futures=True)
+                    self._executor = None
 
-            # Get all MDA files in the folder
-            mda_files = list(self.folder_path.glob("*.mda"))
-            total_files = len(mda_files)
-
-            if total_files == 0:
-                result = FolderScanResult([], [], 0, 0, True, "No MDA files found")
-                self.complete.emit(result)
-                return
+        except Exception as e:
+            self.error.emit(f"Scan error: {e}")
+        finally:
+            self.finished.emit()
 
-            # For very large directories, use progressive loading
-            if total_files > self.max_files and self.progressive_loading:
-                self._progressive_scan(mda_files)
+    def _scan(self) -> None:
+        """List the folder (or tree), then read the files or emit a paged result."""
+        # Get all MDA files (one stat per file)
+        if self.recursive:
+            mda_files = self._list_tree()
+            if self._cancelled:
                 return
+        else:
+            mda_files = list_mda_files(self.folder_path)
+        total_files = len(mda_files)
 
-            if total_files > self.max_files:
-                result = FolderScanResult(
-                    [],
-                    [],
-                    total_files,
-                    0,
-                    False,
-                    f"Too many files ({total_files} > {self.max_files})",
-                )
-                self.complete.emit(result)
-                return
+        if total_files == 0:
+            result = FolderScanResult([], [], 0, 0, True, "No MDA files found")
+            self.complete.emit(result)
+            return
 
-            # Regular batch scanning; reuse cached file_info when mtime unchanged
-            file_list = []
-            file_info_list = []
-            cache: FileInfoCache = dict(self._previous_cache)
-            scanned_files = 0
-
-            for i in range(0, total_files, self.batch_size):
-                if self._cancelled:
-                    break
-
-                batch_files = mda_files[i : i + self.batch_size]
-
-                for file_path in batch_files:
-                    if self._cancelled:
-                        break
-
-                    try:
-                        key = str(file_path.resolve())
-                        st = file_path.stat()
-                        if key in cache and cache[key][0] == st.st_mtime:
-                            file_info = cache[key][1]
-                        else:
-                            if self.use_lightweight_scan and not self.show_positioners:
-                                file_info = get_file_info_lightweight(file_path)
-                            else:
-                                file_info = get_file_info_full(file_path)
-                            cache[key] = (st.st_mtime, file_info)
-
-                        file_list.append(file_path.name)
-                        file_info_list.append(file_info)
-                        scanned_files += 1
-
-                        # Emit progress throttled to avoid event-queue flood and RecursionError
-                        if (
-                            scanned_files % PROGRESS_EMIT_INTERVAL == 0
-                            or scanned_files == total_files
-                        ):
-                            self.progress.emit(scanned_files, total_files)
-
-                    except Exception as e:
-                        logger.error(f"Error scanning {file_path}: {e}")
-                        continue
-
-            if not self._cancelled:
-                result = FolderScanResult(
-                    file_list=file_list,
-                    file_info_list=file_info_list,
-                    total_files=total_files,
-                    scanned_files=scanned_files,
-                    is_complete=True,
-                    file_info_cache=cache,
-                )
-                self.complete.emit(result)
+        if total_files > self.max_files and self.paged:
+            self._list_files(mda_files)
+            return
 
-        except Exception as e:
-            self.error.emit(f"Scan error: {e}")
+        if total_files > self.max_files and not self.progressive_loading:
+            result = FolderScanResult(
+                [],
+                [],
+                total_files,
+                0,
+                False,
+                f"Too many files ({total_files} > {self.max_files})",
+            )
+            self.complete.emit(result)
+            return
+
+        if self._folder_index is not None:
+            stored = self._folder_index.load_folder(
+                str(self._resolved_folder),
+                require_positioners=self._full_read(),
+                require_terms=self.search_terms,
+            )
+            # Rows from this session take precedence over stored ones
+            self._previous_cache = {**stored, **self._previous_cache}
+        try:
+            self._scan_files(mda_files)
         finally:
-            self.finished.emit()
+            self._update_index(mda_files)
 
-    def _progressive_scan(self, mda_files: list[Path]) -> None:
+    def _list_tree(self) -> list[MdaFileEntry]:
         """
-        Perform progressive scanning for very large directories.
+        List the MDA files of the folder and of all its subfolders.
+
+        Returns:
+            list: MDA files with their stat results, sorted by relative path
+        """
+        mda_files: list[MdaFileEntry] = []
+        level = [self.folder_path]
+        while level and not self._cancelled:
+            if self._executor is not None and len(level) > 1:
+                listings = list(self._executor.map(self._list_directory, level))
+            else:
+                listings = [self._list_directory(directory) for directory in level]
+            next_level = []
+            for directory, listing in zip(level, listings):
+                if listing is None:
+                    continue
+                mda_files.extend(listing.files)
+                next_level.extend(directory / name for name in listing.subdirs)
+            level = next_level
+        mda_files.sort(key=lambda entry: self._file_name(entry[0]))
+        return mda_files
+
+    def _list_directory(self, directory: Path) -> Optional[DirectoryListing]:
+        """
+        List one directory, reusing its previous listing if it did not change.
 
         Parameters:
-            mda_files (list[Path]): List of MDA files to scan
+            directory (Path): Directory to list (the folder or a subfolder)
+
+        Returns:
+            DirectoryListing or None: None if the directory cannot be listed
         """
-        total_files = len(mda_files)
-        cache: FileInfoCache = dict(self._previous_cache)
+        if self._cancelled:
+            return None
+        key = str(self._resolved_folder / directory.relative_to(self.folder_path))
+        try:
+            previous = self._previous_directories.get(key)
+            if previous is not None and previous.mtime == os.stat(directory).st_mtime:
+                listing = previous
+            else:
+                listing = list_mda_directory(directory)
+        except OSError as e:
+            logger.error(f"Error listing {directory}: {e}")
+            return None
+        self._directories[key] = listing
+        return listing
+
+    def _file_name(self, file_path: Path) -> str:
+        """Name of a file in the results: its path relative to the scanned folder."""
+        if not self.recursive:
+            return file_path.name
+        return file_path.relative_to(self.folder_path).as_posix()
+
+    def _subfolder(self, file_path: Path) -> str:
+        """Folder column of a file: its subfolder relative to the scanned folder."""
+        folder = file_path.parent.relative_to(self.folder_path).as_posix()
+        return "" if folder == "." else folder
+
+    def _with_folder(
+        self, file_info: dict[str, Any], file_path: Path
+    ) -> dict[str, Any]:
+        """Set the Folder column of a file info (recursive scans only)."""
+        if self.recursive:
+            file_info["Folder"] = self._subfolder(file_path)
+        return file_info
+
+    def set_priority(
+        self,
+        visible_names: Sequence[str] = (),
+        sort_column: Optional[str] = None,
+        descending: bool = False,
+    ) -> None:
+        """
+        Change the order in which the remaining files are read.
+
+        Safe to call from any thread; takes effect at the next batch.
+
+        Parameters:
+            visible_names (sequence of str): File names shown in the folder
+                view, read first (in this order)
+            sort_column (str, optional): Sort column of the folder view;
+                "Date" and "Size" are known before reading a file, any other
+                column falls back to file-name order
+            descending (bool): Whether the view is sorted in descending order
+        """
+        with self._priority_lock:
+            self._priority = ScanPriority(tuple(visible_names), sort_column, descending)
+            self._priority_changed = True
+
+    def _prioritize(
+        self, pending: list[int], mda_files: list[MdaFileEntry]
+    ) -> list[int]:
+        """
+        Order the files still to be read according to the current priority.
+
+        Parameters:
+            pending (list): Indexes (into mda_files) of the files still to be read
+            mda_files (list): MDA files of the folder, with their stat results
 
-        # Initial batch
-        initial_batch_size = min(self.batch_size * 2, total_files)
-        file_list = []
-        file_info_list = []
-        scanned_files = 0
+        Returns:
+            list: The same indexes, visible files first, then in sort order
+        """
+        with self._priority_lock:
+            priority = self._priority
+            self._priority_changed = False
+
+        if priority.sort_column == "Date":
+            order = sorted(pending, key=lambda n: mda_files[n][1].st_mtime)
+        elif priority.sort_column == "Size":
+            order = sorted(pending, key=lambda n: mda_files[n][1].st_size)
+        else:
+            order = sorted(pending)  # mda_files are in file-name order
+        if priority.descending:
+            order.reverse()
+
+        if priority.visible_names:
+            pending_set = set(pending)
+            rows = {self._file_name(path): n for n, (path, _) in enumerate(mda_files)}
+            first = [rows[name] for name in priority.visible_names if name in rows]
+            first = list(dict.fromkeys(n for n in first if n in pending_set))
+            first_set = set(first)
+            order = first + [n for n in order if n not in first_set]
+        return order
+
+    def _scan_files(self, mda_files: list[MdaFileEntry]) -> None:
+        """
+        Read the files of the folder and emit the complete result.
+
+        Cached entries (same mtime and size) are reused; the others are read
+        in batches, in priority order. With progressive loading, a partial
+        result is emitted after the folder listing and then at most every
+        PROGRESSIVE_UPDATE_INTERVAL_S seconds.
 
-        # Scan initial batch (reuse cache when mtime unchanged)
-        for i in range(initial_batch_size):
+        Parameters:
+            mda_files (list): MDA files to scan, with their stat results
+        """
+        total_files = len(mda_files)
+        cache: FileInfoCache = dict(self._previous_cache)
+        names = [self._file_name(path) for path, _ in mda_files]
+        keys = [str(self._resolved_folder / name) for name in names]
+        infos: list[Optional[dict[str, Any]]] = []
+        pending = []
+        for n, (key, (path, file_stat)) in enumerate(zip(keys, mda_files)):
+            cached = cache.get(key)
+            if cached is not None and cached[:2] == (
+                file_stat.st_mtime,
+                file_stat.st_size,
+            ):
+                infos.append(self._with_folder(cached[2], path))
+            else:
+                infos.append(None)
+                pending.append(n)
+
+        scanned_files = total_files - len(pending)
+        if scanned_files:
+            self.progress.emit(scanned_files, total_files)
+        progressive = self.progressive_loading and bool(pending)
+        rows: list[dict[str, Any]] = []
+        updated_rows: list[int] = []
+        if progressive:
+            rows = [
+                info
+                if info is not None
+                else self._with_folder(get_file_info_placeholder(path, file_stat), path)
+                for info, (path, file_stat) in zip(infos, mda_files)
+            ]
+            self._emit_update(mda_files, rows, None, scanned_files, cache)
+        last_update = time.monotonic()
+
+        while pending and not self._cancelled:
+            if self._priority_changed:
+                pending = self._prioritize(pending, mda_files)
+            batch, pending = pending[: self.batch_size], pending[self.batch_size :]
+            entries = [mda_files[n] for n in batch]
+            if self._executor is not None and len(entries) > 1:
+                read = list(self._executor.map(self._read_file_info, entries))
+            else:
+                read = [self._read_file_info(entry) for entry in entries]
             if self._cancelled:
                 break
 
-            file_path = mda_files[i]
-            try:
-                key = str(file_path.resolve())
-                st = file_path.stat()
-                if key in cache and cache[key][0] == st.st_mtime:
-                    file_info = cache[key][1]
-                else:
-                    if self.use_lightweight_scan and not self.show_positioners:
-                        file_info = get_file_info_lightweight(file_path)
-                    else:
-                        file_info = get_file_info_full(file_path)
-                    cache[key] = (st.st_mtime, file_info)
-
-                file_list.append(file_path.name)
-                file_info_list.append(file_info)
-                scanned_files += 1
-
-                if (
-                    scanned_files % PROGRESS_EMIT_INTERVAL == 0
-                    or scanned_files == total_files
-                ):
-                    self.progress.emit(scanned_files, total_files)
-
-            except Exception as e:
-                logger.error(f"Error scanning {file_path}: {e}")
-                continue
-
-        # Emit initial result
+            for n, file_info in zip(batch, read):
+                if file_info is None:
+                    continue
+                file_stat = mda_files[n][1]
+                entry = (file_stat.st_mtime, file_stat.st_size, file_info)
+                cache[keys[n]] = entry
+                self._read_entries[keys[n]] = entry
+                infos[n] = file_info
+                if progressive:
+                    rows[n] = file_info
+                    updated_rows.append(n)
+            # Unreadable files count as scanned (they are left out of the result)
+            previous = scanned_files
+            scanned_files += len(batch)
+            # Emit progress throttled to avoid event-queue flood and RecursionError
+            if (
+                scanned_files // PROGRESS_EMIT_INTERVAL
+                != previous // PROGRESS_EMIT_INTERVAL
+                or scanned_files == total_files
+            ):
+                self.progress.emit(scanned_files, total_files)
+            if (
+                progressive
+                and pending
+                and time.monotonic() - last_update >= PROGRESSIVE_UPDATE_INTERVAL_S
+            ):
+                self._emit_update(mda_files, rows, updated_rows, scanned_files, cache)
+                updated_rows = []
+                last_update = time.monotonic()
+
         if not self._cancelled:
+            file_list = []
+            file_info_list = []
+            for name, file_info in zip(names, infos):
+                if file_info is not None:
+                    file_list.append(name)
+                    file_info_list.append(file_info)
             result = FolderScanResult(
                 file_list=file_list,
                 file_info_list=file_info_list,
                 total_files=total_files,
-                scanned_files=scanned_files,
-                is_complete=False,
-                is_progressive=True,
+                scanned_files=len(file_list),
+                is_complete=True,
+                is_progressive=progressive,
                 file_info_cache=cache,
+                folder_path=self.folder_path,
+                directory_cache=self._directories if self.recursive else None,
             )
-            self.progressive_update.emit(result)
+            self.complete.emit(result)
 
-        # Continue scanning in background; pass the initial-batch lists in so they
-        # accumulate across all subsequent batches (the final emit needs the full set).
-        if not self._cancelled:
-            self._continue_progressive_scan(
-                mda_files, scanned_files, cache, file_list, file_info_list
-            )
+    def _list_files(self, mda_files: list[MdaFileEntry]) -> None:
+        """
+        Emit the complete result of a paged folder, without reading any file.
+
+        Parameters:
+            mda_files (list): MDA files of the folder, with their stat results
+        """
+        file_info_list = PagedInfoList(
+            self.folder_path,
+            [self._file_name(path) for path, _ in mda_files],
+            [file_stat.st_mtime for _, file_stat in mda_files],
+            [file_stat.st_size for _, file_stat in mda_files],
+            cache_rows=self.cache_rows,
+            read_workers=self.scan_workers,
+            search_terms=self.search_terms,
+            environment_pvs=self.environment_pvs,
+        )
+        self.progress.emit(len(mda_files), len(mda_files))
+        result = FolderScanResult(
+            file_list=list(file_info_list.names),
+            file_info_list=file_info_list,
+            total_files=len(mda_files),
+            scanned_files=len(mda_files),
+            is_complete=True,
+            folder_path=self.folder_path,
+            directory_cache=self._directories if self.recursive else None,
+        )
+        self.complete.emit(result)
 
-    def _continue_progressive_scan(
+    def _emit_update(
         self,
-        mda_files: list[Path],
-        start_index: int,
+        mda_files: list[MdaFileEntry],
+        rows: list[dict[str, Any]],
+        updated_rows: Optional[list[int]],
+        scanned_files: int,
         cache: FileInfoCache,
-        file_list: Optional[list[str]] = None,
-        file_info_list: Optional[list[dict[str, Any]]] = None,
     ) -> None:
         """
-        Continue progressive scanning from a given index.
+        Emit a partial result listing every file of the folder.
 
         Parameters:
-            mda_files (list[Path]): List of MDA files to scan
-            start_index (int): Index to start scanning from
-            cache (dict): File info cache (path -> (mtime, file_info)); updated in place.
-            file_list (list, optional): Cumulative file names from earlier batches; appended to.
-            file_info_list (list, optional): Cumulative file info from earlier batches; appended to.
+            mda_files (list): MDA files of the folder, with their stat results
+            rows (list): File info of every file (placeholders for files not read yet)
+            updated_rows (list or None): Rows read since the previous update
+                (None for the first update)
+            scanned_files (int): Number of files read or found in the cache so far
+            cache (dict): File info cache (path -> (mtime, size, file_info))
         """
-        total_files = len(mda_files)
-        if file_list is None:
-            file_list = []
-        if file_info_list is None:
-            file_info_list = []
-        scanned_files = start_index
+        result = FolderScanResult(
+            file_list=[self._file_name(path) for path, _ in mda_files],
+            file_info_list=list(rows),
+            total_files=len(mda_files),
+            scanned_files=scanned_files,
+            is_complete=False,
+            is_progressive=True,
+            file_info_cache=cache,
+            updated_rows=updated_rows,
+            folder_path=self.folder_path,
+        )
+        self.progressive_update.emit(result)
 
-        # Continue scanning from where we left off; reuse cache when mtime unchanged.
-        # Lists accumulate across batches so the final completion emit carries every file.
-        for i in range(start_index, total_files, self.batch_size):
-            if self._cancelled:
-                break
+    def _full_read(self) -> bool:
+        """Whether rows are read with positioner names (header or full reader)."""
+        return (
+            not self.use_lightweight_scan or self.show_positioners or self.search_terms
+        )
 
-            batch_files = mda_files[i : i + self.batch_size]
-
-            for file_path in batch_files:
-                if self._cancelled:
-                    break
-
-                try:
-                    key = str(file_path.resolve())
-                    st = file_path.stat()
-                    if key in cache and cache[key][0] == st.st_mtime:
-                        file_info = cache[key][1]
-                    else:
-                        if self.use_lightweight_scan and not self.show_positioners:
-                            file_info = get_file_info_lightweight(file_path)
-                        else:
-                            file_info = get_file_info_full(file_path)
-                        cache[key] = (st.st_mtime, file_info)
-
-                    file_list.append(file_path.name)
-                    file_info_list.append(file_info)
-                    scanned_files += 1
+    def _update_index(self, mda_files: list[MdaFileEntry]) -> None:
+        """
+        Write the files read during this scan to the folder index.
 
-                    if (
-                        scanned_files % PROGRESS_EMIT_INTERVAL == 0
-                        or scanned_files == total_files
-                    ):
-                        self.progress.emit(scanned_files, total_files)
+        Rows of files that disappeared are deleted only after a complete scan.
 
-                except Exception as e:
-                    logger.error(f"Error scanning {file_path}: {e}")
-                    continue
+        Parameters:
+            mda_files (list): MDA files of the folder, with their stat results
+        """
+        if self._folder_index is None:
+            return
+        present = None
+        if not self._cancelled:
+            present = [
+                str(self._resolved_folder / self._file_name(path))
+                for path, _ in mda_files
+            ]
+        elif not self._read_entries:
+            return
+        self._folder_index.update_folder(
+            str(self._resolved_folder),
+            self._read_entries,
+            full_read=self._full_read(),
+            present=present,
+        )
 
-            # Emit progressive update every batch
-            if file_list and not self._cancelled:
-                result = FolderScanResult(
-                    file_list=file_list,
-                    file_info_list=file_info_list,
-                    total_files=total_files,
-                    scanned_files=scanned_files,
-                    is_complete=(scanned_files >= total_files),
-                    is_progressive=True,
-                    file_info_cache=cache,
-                )
-                self.progressive_update.emit(result)
+    def _read_file_info(self, entry: MdaFileEntry) -> Optional[dict[str, Any]]:
+        """
+        Read the file info of one file (safe to call from pool threads).
 
-        # Final completion
-        if scanned_files >= total_files and not self._cancelled:
-            final_result = FolderScanResult(
-                file_list=file_list,
-                file_info_list=file_info_list,
-                total_files=total_files,
-                scanned_files=scanned_files,
-                is_complete=True,
-                is_progressive=True,
-                file_info_cache=cache,
-            )
-            self.complete.emit(final_result)
+        Parameters:
+            entry (tuple): MDA file path and its stat result
+
+        Returns:
+            dict or None: File information, or None if cancelled or unreadable
+        """
+        if self._cancelled:
+            return None
+        file_path, file_stat = entry
+        try:
+            if self.show_positioners or self.search_terms:
+                file_info = get_file_info_header(
+                    file_path,
+                    file_stat,
+                    search_terms=self.search_terms,
+                    environment_pvs=self.environment_pvs,
+                )
+            elif self.use_lightweight_scan:
+                file_info = get_file_info_lightweight(file_path, file_stat)
+            else:
+                file_info = get_file_info_full(file_path, file_stat)
+            return self._with_folder(file_info, file_path)
+        except Exception as e:
+            # Continue scanning other files even if one fails
+            logger.error(f"Error scanning {file_path}: {e}")
+            return None
 
     def cancel(self) -> None:
         """Cancel the scan operation."""
         self._cancelled = True
+
+
+class FolderDeltaWorker(FolderScanWorker):
+    """
+    Worker finding the changes of a folder in a background thread.
+
+    Lists the folder with a :class:`FolderDeltaTracker` and reads the file
+    info of the added and changed files like a folder scan (same readers,
+    thread pool with ``scan_workers > 1``). ``complete`` is emitted with a
+    :class:`FolderDelta` (instead of a :class:`FolderScanResult`).
+    """
+
+    def __init__(self, tracker: FolderDeltaTracker, batch_size: int = 50, **kwargs):
+        """
+        Initialize the worker.
+
+        Parameters:
+            tracker (FolderDeltaTracker): Snapshot of the folder (updated by the worker)
+            batch_size (int): Number of files read concurrently
+            **kwargs: Reader options of :class:`FolderScanWorker`
+                (use_lightweight_scan, show_positioners, scan_workers,
+                recursive, search_terms, environment_pvs)
+        """
+        kwargs.setdefault("use_lightweight_scan", True)
+        super().__init__(tracker.folder_path, batch_size, 0, **kwargs)
+        self.tracker = tracker
+
+    def _scan(self) -> None:
+        """Diff the folder listing with the snapshot, then read the new files."""
+        delta = self.tracker.update()
+        entries = delta.added + delta.changed
+        for first in range(0, len(entries), self.batch_size):
+            if self._cancelled:
+                return
+            batch = entries[first : first + self.batch_size]
+            if self._executor is not None and len(batch) > 1:
+                read = list(self._executor.map(self._read_file_info, batch))
+            else:
+                read = [self._read_file_info(entry) for entry in batch]
+            for (path, _), file_info in zip(batch, read):
+                if file_info is not None:
+                    delta.file_infos[self._file_name(path)] = file_info
+        self.complete.emit(delta)
+
+
+class FileRefreshWorker(FolderScanWorker):
+    """
+    Worker reading given files again in a background thread.
+
+    Used for the files being written during acquisitions (see
+    :meth:`LazyFolderScanner.refresh_files_async`). Each file is stat'ed
+    and read once, with the readers of folder scans. ``complete`` is emitted
+    with a :class:`FolderDelta` listing the files as changed (files that no
+    longer exist are left out).
+    """
+
+    def __init__(
+        self,
+        folder_path: Path,
+        file_paths: Sequence[Path],
+        batch_size: int = 50,
+        **kwargs,
+    ):
+        """
+        Initialize the worker.
+
+        Parameters:
+            folder_path (Path): Folder of the files
+            file_paths (sequence of Path): Files to read
+            batch_size (int): Number of files read concurrently
+            **kwargs: Reader options of :class:`FolderScanWorker`
+        """
+        super().__init__(folder_path, batch_size, 0, **kwargs)
+        self.file_paths = [Path(file_path) for file_path in file_paths]
+
+    def _scan(self) -> None:
+        """Stat and read the files."""
+        delta = FolderDelta(self.folder_path)
+        for file_path in self.file_paths:
+            try:
+                delta.changed.append((file_path, os.stat(file_path)))
+            except OSError:
+                continue  # deleted meanwhile
+        if self._executor is not None and len(delta.changed) > 1:
+            read = list(self._executor.map(self._read_file_info, delta.changed))
+        else:
+            read = [self._read_file_info(entry) for entry in delta.changed]
+        for (file_path, _), file_info in zip(delta.changed, read):
+            if file_info is not None:
+                delta.file_infos[self._file_name(file_path)] = file_info
+        if not self._cancelled:
+            self.complete.emit(delta)
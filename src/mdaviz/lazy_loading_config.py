@@ -15,7 +15,7 @@ allowing users to customize behavior and persist settings.
 import json
 from pathlib import Path
 from typing import Any, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from PyQt6.QtCore import QObject, pyqtSignal
 from mdaviz.logger import get_logger
 
@@ -36,16 +36,48 @@ class LazyLoadingConfig:
     folder_scan_batch_size: int = 50
     folder_scan_max_files: int = 10000
     folder_scan_use_lightweight: bool = True
+    folder_scan_workers: int = 8  # threads reading file headers concurrently
+    folder_index_enabled: bool = True  # persist folder rows in ~/.mdaviz/cache
+    # Folders with more than folder_scan_max_files files are listed without
+    # reading the files; rows are read when shown (see PagedInfoList)
+    folder_scan_paged: bool = True
+    folder_row_cache_size: int = 2000  # rows of a paged folder kept in memory
+    # Extract metadata search terms (PV names, descriptions, scan numbers)
+    # while scanning, for the folder table filter box
+    folder_search_enabled: bool = True
+    # Environment PVs whose values are search terms too (e.g. a sample name PV)
+    folder_search_environment_pvs: list[str] = field(default_factory=list)
+
+    # Live monitoring of the folder, the live file and new files: change
+    # notifications, coalesced over live_monitor_debounce_ms; paths on network
+    # filesystems are polled every live_monitor_poll_min_ms after a change, up
+    # to every live_monitor_poll_max_ms while idle
+    live_monitor_debounce_ms: int = 50
+    live_monitor_poll_min_ms: int = 250
+    live_monitor_poll_max_ms: int = 4000
+    # Files being written (new files, files whose metadata is incomplete) are
+    # read again in the background; at most live_refresh_queue_size of them
+    # wait for the next batch (the least recently changed are dropped)
+    live_refresh_queue_size: int = 256
 
     # Data cache settings
     data_cache_max_size_mb: float = 500.0
     data_cache_max_entries: int = 100
     data_cache_enable_compression: bool = False
+    # "notify": validate entries from filesystem change notifications,
+    # "stat": stat the file on every cache lookup
+    data_cache_validation_mode: str = "notify"
+    data_cache_validation_interval_s: float = 5.0
 
     # Virtual table settings
     virtual_table_page_size: int = 100
     virtual_table_preload_pages: int = 2
 
+    # 1D curves with at least plot_decimation_min_points points are drawn
+    # decimated to the plot width (lowest and highest point per pixel column);
+    # 0 draws all the points
+    plot_decimation_min_points: int = 20000
+
     # Performance settings
     enable_progress_dialogs: bool = True
     enable_memory_monitoring: bool = True
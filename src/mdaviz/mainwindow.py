@@ -21,6 +21,7 @@ from mdaviz.user_settings import settings
 from mdaviz.opendialog import DIR_SETTINGS_KEY
 from mdaviz.lazy_folder_scanner import LazyFolderScanner, FolderScanResult
 from mdaviz.logger import get_logger
+from mdaviz.paged_info_list import PagedInfoList
 
 # Get logger for this module
 logger = get_logger("mainwindow")
@@ -71,6 +72,7 @@ class MainWindow(QMainWindow):
         self._setup_window_properties()
         self._initialize_data()
         self._setup_scanner()
+        self._setup_cache_stats_panel()
         self._connect()
         self._setup_window_geometry()
 
@@ -93,6 +95,30 @@ class MainWindow(QMainWindow):
         self.lazy_scanner.scan_progress.connect(self._on_scan_progress)
         self.lazy_scanner.scan_complete.connect(self._on_scan_complete)
         self.lazy_scanner.scan_error.connect(self._on_scan_error)
+        self.lazy_scanner.progressive_scan_update.connect(
+            self._on_progressive_scan_update
+        )
+
+    def _setup_cache_stats_panel(self):
+        """Create the dockable cache statistics panel (View menu toggles it)."""
+        from mdaviz.cache_stats_panel import CacheStatsPanel
+        from mdaviz.lazy_loading_config import get_config
+
+        self.cache_stats_panel = CacheStatsPanel(self)
+        self.addDockWidget(
+            Qt.DockWidgetArea.RightDockWidgetArea, self.cache_stats_panel
+        )
+        self.cache_stats_panel.setVisible(get_config().show_cache_stats)
+        toggle_action = self.cache_stats_panel.toggleViewAction()
+        self.menuView.addAction(toggle_action)  # type: ignore[attr-defined]
+        toggle_action.toggled.connect(self._on_cache_stats_toggled)
+
+    def _on_cache_stats_toggled(self, checked):
+        """Remember whether the cache statistics panel is shown."""
+        from mdaviz.lazy_loading_config import get_config, update_config
+
+        if get_config().show_cache_stats != checked:
+            update_config(show_cache_stats=checked)
 
     def _connect(self):
         self.actionOpen.triggered.connect(self.doOpen)
@@ -214,14 +240,15 @@ class MainWindow(QMainWindow):
         settings.setKey(
             "show_positioners_in_folder", settings_dict["show_positioners_in_folder"]
         )
+        settings.setKey("scan_subfolders", settings_dict["scan_subfolders"])
 
         # Update UI components
         self._update_plot_height(settings_dict["plot_max_height"])
         if hasattr(self, "mvc_folder") and self.mvc_folder:
             self.mvc_folder.mda_folder_tableview.applyDefaultSort()
 
-        # If positioners setting changed, clear the scan cache and rescan the current folder
-        # so the column appears/disappears immediately without requiring a manual refresh.
+        # If positioners or subfolders setting changed, clear the scan cache and rescan
+        # the current folder so the columns and rows change without a manual refresh.
         if hasattr(self, "lazy_scanner") and self.dataPath():
             self.lazy_scanner._file_info_cache.clear()
             self.lazy_scanner.scan_folder_async(self.dataPath())
@@ -500,7 +527,7 @@ class MainWindow(QMainWindow):
                                 f"Preserving selection (alt method): {selected_file_name}"
                             )
 
-            # Invalidate cache for all files in the current folder
+            # Invalidate cache for files of the current folder changed on disk
             from mdaviz.data_cache import get_global_cache
 
             cache = get_global_cache()
@@ -508,14 +535,16 @@ class MainWindow(QMainWindow):
                 f"🔄 REFRESH DEBUG: Invalidating cache for folder: {current_folder}"
             )
             self.setStatus(f"Invalidating cache for folder: {current_folder}")
-            invalidated_count = cache.invalidate_folder(str(current_folder))
+            invalidated_count = cache.invalidate_folder(
+                str(current_folder), changed_only=True
+            )
             logger.info(
                 f"🔄 REFRESH DEBUG: Invalidated {invalidated_count} files from cache"
             )
             if invalidated_count > 0:
                 self.setStatus(f"Invalidated cache for {invalidated_count} files")
             else:
-                self.setStatus("No cached files found to invalidate")
+                self.setStatus("No changed cached files to invalidate")
 
             current_mdaFileList = self.mdaFileList()
             self.onFolderSelected(current_folder)
@@ -615,96 +644,36 @@ class MainWindow(QMainWindow):
     def _on_scan_complete(self, result: FolderScanResult) -> None:
         """Handle scan completion."""
         if result.is_complete and result.file_list:
-            # Sort the file list
-            sorted_files = sorted(result.file_list)
-            sorted_info = sorted(result.file_info_list, key=lambda x: x["Name"])
+            if isinstance(result.file_info_list, PagedInfoList):
+                # Paged folder: listed in file-name order, rows read when shown
+                sorted_files = list(result.file_list)
+                sorted_info = result.file_info_list
+            else:
+                # Sort the file list (names are relative paths in recursive scans)
+                pairs = sorted(
+                    zip(result.file_list, result.file_info_list), key=lambda x: x[0]
+                )
+                sorted_files = [name for name, _ in pairs]
+                sorted_info = [file_info for _, file_info in pairs]
 
-            # Set the data - extract folder path from the first file
-            if sorted_info and "folderPath" in sorted_info[0]:
+            # Set the data - the scanned folder, else the folder of the first file
+            if result.folder_path is not None:
+                folder_path = Path(result.folder_path)
+            elif sorted_info and "folderPath" in sorted_info[0]:
                 folder_path = Path(sorted_info[0]["folderPath"])
             else:
                 # Fallback: construct folder path from file path
                 folder_path = Path(sorted_files[0]).parent if sorted_files else None  # type: ignore[assignment]
 
             if folder_path is not None:
-                self.setDataPath(folder_path)
-                self.setMdaInfoList(sorted_info)
-                self.setMdaFileList(sorted_files)
                 self._addToRecentFolders(str(folder_path))
                 self.info.setText(f"{len(sorted_files)} mda files")  # type: ignore[attr-defined]
-
-                # Create or update the folder view
-                layout = self.groupbox.layout()  # type: ignore[attr-defined]
-                if self.mvc_folder is None:
-                    self.mvc_folder = MDA_MVC(self)
-                    layout.addWidget(self.mvc_folder)
+                if self._mergeFolderRows(folder_path, sorted_files, sorted_info):
+                    # The table was updated in place and kept its selection
+                    self._selected_file_name = None
+                    self._saved_selection_field = None
                 else:
-                    # Always update the folder view since it is a new folder
-                    self.mvc_folder.updateFolderView()
-
-                # Highlight the selected file if one was specified, otherwise select the first file
-                if hasattr(self, "_selected_file_name") and self._selected_file_name:
-                    # Use a timer to delay selection restoration (helps with timing issues on Linux)
-                    from PyQt6.QtCore import QTimer
-
-                    def restore_selection():
-                        try:
-                            # Restore detector/positioner selection before selecting file
-                            if (
-                                getattr(self, "_saved_selection_field", None)
-                                and self.mvc_folder
-                            ):
-                                self.mvc_folder.setSelectionField(
-                                    self._saved_selection_field
-                                )
-                            # Find the index of the selected file
-                            selected_index = sorted_files.index(
-                                self._selected_file_name
-                            )
-                            # Select and highlight the file in the folder view
-                            if self.mvc_folder and hasattr(
-                                self.mvc_folder, "mda_folder_tableview"
-                            ):
-                                proxy = self.mvc_folder.mda_folder_tableview.tableView.model()
-                                if proxy is not None:
-                                    source_model = proxy.sourceModel()
-                                    if (
-                                        source_model
-                                        and selected_index < source_model.rowCount()
-                                    ):
-                                        source_idx = source_model.index(
-                                            selected_index, 0
-                                        )
-                                        proxy_idx = proxy.mapFromSource(source_idx)
-                                        self.mvc_folder.selectAndShowIndex(proxy_idx)
-                                    self.setStatus(
-                                        f"Highlighted selected file: {self._selected_file_name}"
-                                    )
-                        except ValueError:
-                            # File not found in the list, ignore
-                            self.setStatus(
-                                f"Selected file {self._selected_file_name} not found after refresh"
-                            )
-                        finally:
-                            # Clear the selected file name and saved selection
-                            self._selected_file_name = None
-                            if hasattr(self, "_saved_selection_field"):
-                                self._saved_selection_field = None
-
-                    # Use a short delay to ensure the model is fully updated
-                    QTimer.singleShot(100, restore_selection)
-                else:
-                    # Auto-select the first file if no specific file was selected
-                    if self.mvc_folder and hasattr(
-                        self.mvc_folder, "mda_folder_tableview"
-                    ):
-                        model = self.mvc_folder.mda_folder_tableview.tableView.model()
-                        if model and model.rowCount() > 0:
-                            first_index = model.index(0, 0)
-                            self.mvc_folder.selectAndShowIndex(first_index)
-                            self.setStatus(
-                                f"Auto-selected first file: {sorted_files[0]}"
-                            )
+                    self._showFolder(folder_path, sorted_files, sorted_info)
 
                 self.setStatus(
                     f"Loaded {len(sorted_files)} MDA files from {folder_path}"
@@ -722,6 +691,154 @@ class MainWindow(QMainWindow):
             self.reset_mainwindow()
             self.setStatus(f"Scan failed: {error_msg}")
 
+    def _on_progressive_scan_update(self, result: FolderScanResult) -> None:
+        """
+        Show partial scan results as they arrive.
+
+        The first partial result of a new folder creates the folder table
+        (with placeholder rows for files not read yet); later ones only
+        replace the rows that were read, so the table keeps its selection.
+        """
+        if not result.file_info_list:
+            return
+        if result.folder_path is not None:
+            folder_path = Path(result.folder_path)
+        else:
+            folder_path = Path(result.file_info_list[0]["folderPath"])
+        if self._mergeFolderRows(
+            folder_path, result.file_list, result.file_info_list, result.updated_rows
+        ):
+            return
+        if result.updated_rows is None:
+            self.info.setText(f"{len(result.file_list)} mda files")  # type: ignore[attr-defined]
+            self._showFolder(
+                folder_path, list(result.file_list), list(result.file_info_list)
+            )
+
+    def _mergeFolderRows(
+        self,
+        folder_path: Path,
+        file_list: List[str],
+        file_info_list: List[dict],
+        updated_rows: Optional[List[int]] = None,
+    ) -> bool:
+        """
+        Merge scan results into the folder table if it shows the same folder.
+
+        Returns:
+            bool: False if the table shows another folder (or nothing) and
+            must be created with _showFolder; paged folders (see
+            PagedInfoList) are always shown anew, since merging compares
+            every row, and so are tables whose columns changed in the
+            preferences
+        """
+        if self.mvc_folder is None or not self.dataPath():
+            return False
+        if self.mvc_folder.mda_folder_tableview.columnsOutdated():
+            return False
+        if isinstance(file_info_list, PagedInfoList) or isinstance(
+            self.mdaInfoList(), PagedInfoList
+        ):
+            return False
+        if Path(self.dataPath()).resolve() != Path(folder_path).resolve():
+            return False
+        return self.mvc_folder.mergeFolderRows(file_list, file_info_list, updated_rows)
+
+    def _showFolder(
+        self, folder_path: Path, sorted_files: List[str], sorted_info: List[dict]
+    ) -> None:
+        """
+        Create the folder table for a newly opened folder.
+
+        Selects the file saved by onRefresh if there is one, otherwise the first file.
+        """
+        self.setDataPath(folder_path)
+        self.setMdaInfoList(sorted_info)
+        self.setMdaFileList(sorted_files)
+
+        # Create or update the folder view
+        if self.mvc_folder is None:
+            self._createFolderView()
+        else:
+            # Always update the folder view since it is a new folder
+            self.mvc_folder.updateFolderView()
+
+        # Highlight the selected file if one was specified, otherwise select the first file
+        if hasattr(self, "_selected_file_name") and self._selected_file_name:
+            # Use a timer to delay selection restoration (helps with timing issues on Linux)
+            from PyQt6.QtCore import QTimer
+
+            def restore_selection():
+                try:
+                    # Restore detector/positioner selection before selecting file
+                    if (
+                        getattr(self, "_saved_selection_field", None)
+                        and self.mvc_folder
+                    ):
+                        self.mvc_folder.setSelectionField(self._saved_selection_field)
+                    # Find the index of the selected file
+                    selected_index = sorted_files.index(self._selected_file_name)
+                    # Select and highlight the file in the folder view
+                    if self.mvc_folder and hasattr(
+                        self.mvc_folder, "mda_folder_tableview"
+                    ):
+                        proxy = self.mvc_folder.mda_folder_tableview.tableView.model()
+                        if proxy is not None:
+                            source_model = proxy.sourceModel()
+                            if (
+                                source_model
+                                and selected_index < source_model.rowCount()
+                            ):
+                                source_idx = source_model.index(selected_index, 0)
+                                proxy_idx = proxy.mapFromSource(source_idx)
+                                self.mvc_folder.selectAndShowIndex(proxy_idx)
+                            self.setStatus(
+                                f"Highlighted selected file: {self._selected_file_name}"
+                            )
+                except ValueError:
+                    # File not found in the list, ignore
+                    self.setStatus(
+                        f"Selected file {self._selected_file_name} not found after refresh"
+                    )
+                finally:
+                    # Clear the selected file name and saved selection
+                    self._selected_file_name = None
+                    if hasattr(self, "_saved_selection_field"):
+                        self._saved_selection_field = None
+
+            # Use a short delay to ensure the model is fully updated
+            QTimer.singleShot(100, restore_selection)
+        else:
+            # Auto-select the first file if no specific file was selected
+            if self.mvc_folder and hasattr(self.mvc_folder, "mda_folder_tableview"):
+                model = self.mvc_folder.mda_folder_tableview.tableView.model()
+                if model and model.rowCount() > 0:
+                    first_index = model.index(0, 0)
+                    self.mvc_folder.selectAndShowIndex(first_index)
+                    self.setStatus(f"Auto-selected first file: {sorted_files[0]}")
+
+    def _createFolderView(self) -> None:
+        """
+        Create the folder view (once, for the first folder shown).
+
+        Its viewport reports let a running scan read the visible rows first,
+        including during the scan that creates it.
+        """
+        self.mvc_folder = MDA_MVC(self)
+        self.groupbox.layout().addWidget(self.mvc_folder)  # type: ignore[attr-defined]
+        self.mvc_folder.mda_folder_tableview.viewportChanged.connect(
+            self._on_folder_viewport_changed
+        )
+
+    def _on_folder_viewport_changed(self) -> None:
+        """Let the folder scanner read the rows shown in the folder view first."""
+        if self.mvc_folder is None:
+            return
+        state = self.mvc_folder.mda_folder_tableview.viewportState()
+        self.lazy_scanner.set_scan_priority(
+            self.dataPath(), state.visible_names, state.sort_column, state.descending
+        )
+
     def _on_scan_error(self, error_message: str) -> None:
         """Handle scan errors."""
         self.reset_mainwindow()
@@ -243,9 +243,12 @@ class MDAFile(QWidget):
             if rank >= 2 and len(result) > 2:
                 try:
                     file_data_dim2 = result[2]
-                    scanDict2D, _, _ = utils.get_scan_2d(file_data_dim1, file_data_dim2)
-                    # Also store inner dimension data for 1D plotting
+                    # Inner dimension data for 1D plotting; the 2D dict shares
+                    # its detector entries
                     scan_dict_inner, _, first_det = utils.get_scan(file_data_dim2)
+                    scanDict2D, _, _ = utils.get_scan_2d(
+                        file_data_dim1, file_data_dim2, scan_dict_inner
+                    )
                 except Exception as e:
                     logger.warning(f"Warning: Could not process 2D data: {e}")
                     scanDict2D = {}
@@ -709,6 +712,7 @@ class TabManager(QObject):
     - Tracks metadata and table data for each open tab.
     - Allows adding and removing tabs dynamically.
     - Emits signals to notify other components of tab-related changes.
+    - Pins the data cache entries of open tabs so they are never evicted.
 
     Signals:
     - tabRemoved: Emitted when a tab is removed. Passes the file path of the removed tab.
@@ -724,6 +728,7 @@ class TabManager(QObject):
         """Adds a new tab with specified metadata and table data."""
         if file_path not in self._tabs:
             self._tabs[file_path] = {"metadata": metadata, "tabledata": tabledata}
+            get_global_cache().pin(file_path, "tab")
 
     def removeTab(self, file_path):
         """
@@ -732,11 +737,13 @@ class TabManager(QObject):
         """
         if file_path in self._tabs:
             del self._tabs[file_path]
+            get_global_cache().unpin(file_path, "tab")
             self.tabRemoved.emit(file_path)
 
     def removeAllTabs(self):
         """Removes all tabs."""
         self._tabs.clear()
+        get_global_cache().unpin_all("tab")
 
     def getTabData(self, file_path):
         """Returns the metatdata & data for the tab associated with the given file path."""
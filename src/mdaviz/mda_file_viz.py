@@ -231,7 +231,7 @@ class MDAFileVisualization(QWidget):
             # tab_count >= 4, just show/hide as needed
             self.tabWidget.setTabVisible(3, show_2d_tab)
 
-    def set2DData(self, data):
+    def set2DData(self, data, live=False):
         """
         Set 2D data for visualization and manage 2D tab visibility.
 
@@ -240,7 +240,10 @@ class MDAFileVisualization(QWidget):
 
         Parameters:
             data (dict or None): 2D data dictionary with scanDict2D and metadata, or None to clear
+            live (bool): True if the scan is being acquired: its heatmap covers the
+                whole scan and is filled in row by row
         """
+        self._2d_live = live
 
         if not data or not data.get("isMultidimensional", False):
             self.update2DTabVisibility(False)
@@ -373,6 +376,9 @@ class MDAFileVisualization(QWidget):
 
                     plot_options["vmin"] = selection.get("vmin")
                     plot_options["vmax"] = selection.get("vmax")
+                    if getattr(self, "_2d_live", False):
+                        dimensions = self._2d_data.get("dimensions") or [None]
+                        plot_options["x2_points"] = dimensions[0]
 
                     widgetMpl2D.plot2D(y_data, x_data, x2_data, plot_options)
                 else:
@@ -68,7 +68,7 @@ from functools import partial
 from pathlib import Path
 
 from PyQt6 import QtCore
-from PyQt6.QtCore import QItemSelectionModel, QTimer, Qt, pyqtSignal
+from PyQt6.QtCore import QItemSelectionModel, Qt, pyqtSignal
 from PyQt6.QtWidgets import QAbstractItemView, QApplication, QWidget
 
 from mdaviz import utils
@@ -133,21 +133,29 @@ class MDA_MVC(QWidget):
         self._last_plotted_file_path = None
         self._last_selection = None
 
-        # Live plotting: poll the current file's mtime every 2s and replot if it changed.
+        # Live plotting: replot the current file when it changes on disk.
         self._live_file_path = None
-        self._live_mtime = None
         self._live_selection = None  # selection at the time live watch was started
         self._2d_watch_path = None  # 2D scan being watched for structure changes only
-        self._2d_watch_mtime = None
-        self._folder_mtime = (
-            None  # mtime of the watched folder (for new-file detection)
-        )
         self._pending_metadata = []  # files whose metadata was incomplete at detection time
         self._tracking_files = {}  # file_path → last_mtime, for Points column auto-update
-        self._poll_timer = QTimer()
-        self._poll_timer.setInterval(2000)  # ms
-        self._poll_timer.timeout.connect(self._pollForChanges)
-        self._poll_timer.start()
+        # The folder (new files), the live file, the 2D watch file and the tracked
+        # files are watched for changes (see mdaviz.file_monitor)
+        from mdaviz.file_monitor import FileMonitor
+        from mdaviz.lazy_loading_config import get_config
+
+        config = get_config()
+        self._file_monitor = FileMonitor(
+            self,
+            debounce_ms=config.live_monitor_debounce_ms,
+            poll_min_ms=config.live_monitor_poll_min_ms,
+            poll_max_ms=config.live_monitor_poll_max_ms,
+        )
+        self._file_monitor.changed.connect(self._onPathsChanged)
+        self._updateWatchedPaths()
+        # New files are found and read in the background (see _checkForNewFiles)
+        self.mainWindow.lazy_scanner.folder_delta.connect(self._onFolderDelta)
+        self.mainWindow.lazy_scanner.files_refreshed.connect(self._onFilesRefreshed)
 
         # Set Selection Model & Focus for keyboard arrow keys to Folder Table View:
         model = self.mda_folder_tableview.tableView.model()
@@ -221,6 +229,22 @@ class MDA_MVC(QWidget):
         """
         return self.mainWindow.mdaFileList()
 
+    def fileListName(self, file_path):
+        """
+        Name of a file in mdaFileList(): its path relative to the folder (the
+        file name, unless subfolders are scanned).
+
+        Args:
+            file_path (str or Path): Path of the file
+
+        Returns:
+            str: Name to look up in mdaFileList()
+        """
+        try:
+            return Path(file_path).relative_to(self.dataPath()).as_posix()
+        except (TypeError, ValueError):
+            return Path(file_path).name
+
     def mdaInfoList(self):
         """
         Fetches a list of MDA file info from the currently selected folder.
@@ -274,8 +298,8 @@ class MDA_MVC(QWidget):
 
     def updateFolderView(self):
         """Clear existing data and set new data for the folder tableview"""
-        self._folder_mtime = None  # re-baseline folder mtime after a full rescan
         self._tracking_files = {}
+        self._updateWatchedPaths()
         self.mda_folder_tableview.clearContents()
         self.mda_folder_tableview.displayTable()
         model = self.mda_folder_tableview.tableView.model()
@@ -285,6 +309,60 @@ class MDA_MVC(QWidget):
             self.setSelectionModel(selection_model)
             utils.reconnect(self.selectionModel().currentChanged, self.onFileSelected)
 
+    def mergeFolderRows(self, file_list, file_info_list, updated_rows=None):
+        """
+        Merge folder scan results into the table without rebuilding its model.
+
+        Rows are matched by file name, so the selection and the sort order of
+        the view are kept.
+
+        Parameters:
+            file_list (list): File names of the scan result
+            file_info_list (list): File info of the scan result (same order)
+            updated_rows (list, optional): Only merge these positions of the
+                lists (a progressive update); otherwise the table is made to
+                hold exactly the given files: vanished files are removed, new
+                files appended and changed rows replaced
+
+        Returns:
+            bool: False if there is no table to merge into
+        """
+        proxy = self.mda_folder_tableview.proxyModel
+        source_model = proxy.sourceModel() if proxy is not None else None
+        if source_model is None:
+            return False
+        names = self.mdaFileList()
+        row_of = {name: row for row, name in enumerate(names)}
+
+        if updated_rows is not None:
+            positions = updated_rows
+        else:
+            wanted = set(file_list)
+            gone = [row for row, name in enumerate(names) if name not in wanted]
+            if gone:
+                source_model.removeFileRows(gone)
+                gone_names = {names[row] for row in gone}
+                names[:] = [name for name in names if name not in gone_names]
+                row_of = {name: row for row, name in enumerate(names)}
+            positions = range(len(file_list))
+
+        changed = {}
+        new_names, new_infos = [], []
+        info_list = self.mdaInfoList()
+        for n in positions:
+            name, file_info = file_list[n], file_info_list[n]
+            row = row_of.get(name)
+            if row is None:
+                new_names.append(name)
+                new_infos.append(file_info)
+            elif info_list[row] != file_info:
+                changed[row] = file_info
+        source_model.updateRows(changed)
+        if new_infos:
+            names.extend(new_names)
+            source_model.appendRows(new_infos)
+        return True
+
     # # ------------ Fields selection methods:
 
     def selectionField(self):
@@ -539,7 +617,7 @@ class MDA_MVC(QWidget):
         else:
             self.setStatus("Could not find a (positioner,detector) pair to plot.")
 
-        # Initialize live polling for 2D files. _startWatching is normally called
+        # Initialize live watching for 2D files. _startWatching is normally called
         # from doPlot's 1D auto-fallback at the end, but if the 2D scan is so fresh
         # it has no detector yet, doPlot bails early at "Nothing to plot" and never
         # sets _2d_watch_path. Without it, _check2DStructure never fires and the
@@ -551,22 +629,26 @@ class MDA_MVC(QWidget):
 
     def _startWatching(self, file_path):
         """Track file_path for updates.
-        - 1D scans: full live replotting every poll cycle.
-        - 2D scans: only watch for the inner scan structure becoming available (no replot)."""
+        - 1D scans: full live replotting whenever the file changes.
+        - 2D scans: only watch for the inner scan structure becoming available (no replot).
+
+        The watched file is pinned in the data cache so it is never evicted."""
+        from mdaviz.data_cache import get_global_cache
+
+        cache = get_global_cache()
+        cache.unpin_all("live")
+        cache.pin(str(file_path), "live")
         file_data = self.mda_file.data()
         if file_data and file_data.get("isMultidimensional", False):
             # 2D: watch for structure changes only, no live plotting.
             self._2d_watch_path = file_path
-            self._2d_watch_mtime = self._getMtime(file_path)
             self._live_file_path = None
-            self._live_mtime = None
             self._live_selection = None
-            return
-        self._live_file_path = file_path
-        self._live_mtime = self._getMtime(file_path)
-        self._live_selection = self.selectionField()
-        self._2d_watch_path = None
-        self._2d_watch_mtime = None
+        else:
+            self._live_file_path = file_path
+            self._live_selection = self.selectionField()
+            self._2d_watch_path = None
+        self._updateWatchedPaths()
 
     def _getMtime(self, file_path):
         """Return the mtime of file_path, or None if it cannot be stat'd."""
@@ -575,149 +657,218 @@ class MDA_MVC(QWidget):
         except OSError:
             return None
 
-    def _pollForChanges(self):
-        """Check if the current file has changed on disk; replot if so.
-        Also check if new files appeared in the folder."""
+    def _updateWatchedPaths(self):
+        """Watch the folder, the live file, the 2D watch file and the tracked files."""
+        self._file_monitor.setPaths(
+            [
+                self.dataPath(),
+                self._live_file_path,
+                self._2d_watch_path,
+                *self._tracking_files,
+                *self._pending_metadata,
+            ]
+        )
+
+    def _onPathsChanged(self, paths):
+        """
+        Handle coalesced changes of watched paths (see FileMonitor.changed).
+
+        New files in the folder are added to the table, the rows of tracked
+        files are updated, and the live 1D or 2D plot is refreshed.
+        """
+        changed = set(paths)
         folder_path = self.dataPath()
-        if folder_path:
-            folder_mtime = self._getMtime(folder_path)
-            if self._folder_mtime is not None and folder_mtime != self._folder_mtime:
-                self._checkForNewFiles(folder_path)
-            self._folder_mtime = folder_mtime
-        if self._pending_metadata:
-            self._retryPendingMetadata()
-        if self._tracking_files:
-            self._updateTrackingFiles()
-        if self._2d_watch_path:
-            mtime = self._getMtime(self._2d_watch_path)
-            if mtime is not None and mtime != self._2d_watch_mtime:
-                self._2d_watch_mtime = mtime
+        if folder_path and str(folder_path) in changed:
+            self._checkForNewFiles(folder_path)
+        self._updateTrackingFiles(changed)
+        if self._2d_watch_path and str(self._2d_watch_path) in changed:
+            if self._getMtime(self._2d_watch_path) is not None:
                 self._check2DStructure()
+        if self._live_file_path and str(self._live_file_path) in changed:
+            self._reloadLiveFile()
+        self._updateWatchedPaths()
 
-        if not self._live_file_path:
-            return
-        mtime = self._getMtime(self._live_file_path)
-        if mtime is None:
+    def _reloadLiveFile(self):
+        """The live file changed on disk: reload its data and replot its curves."""
+        if self._getMtime(self._live_file_path) is None:
             return
-        if mtime != self._live_mtime:
-            logger.debug(
-                f"Live update: {Path(self._live_file_path).name} changed, replotting"
-            )
-            self._live_mtime = mtime
-            from mdaviz.data_cache import get_global_cache
-
-            get_global_cache().invalidate_file(self._live_file_path)
-            # Reload mda_file data from disk so the live tableview uses fresh data.
-            try:
-                file_name = Path(self._live_file_path).name
-                file_index = self.mdaFileList().index(file_name)
-                self.mda_file.setData(file_index)
-                tableview = self.mda_file.tabPath2Tableview(self._live_file_path)
-                if tableview is not None:
-                    tableview.setData()
-                # Update "Points" column in folder table with the latest acquired count.
-                acq_dims = self.mda_file.data().get("acquiredDimensions", [])
-                if acq_dims and file_index < len(self.mdaInfoList()):
-                    self.mdaInfoList()[file_index]["Points"] = acq_dims[0]
-                    proxy = self.mda_folder_tableview.proxyModel
-                    if proxy is not None:
-                        source_model = proxy.sourceModel()
-                        POINTS_COL = 2  # index of "Points" in HEADERS
-                        cell = source_model.index(file_index, POINTS_COL)
-                        source_model.dataChanged.emit(cell, cell)
-            except Exception as exc:
-                logger.warning(f"Live update: failed to reload data: {exc}")
-            self._doLiveUpdate()
-            self._updateLiveTitle()
+        logger.debug(
+            f"Live update: {Path(self._live_file_path).name} changed, replotting"
+        )
+        from mdaviz.data_cache import get_global_cache
+
+        get_global_cache().invalidate_file(self._live_file_path)
+        # Reload mda_file data from disk so the live tableview uses fresh data.
+        try:
+            file_name = self.fileListName(self._live_file_path)
+            file_index = self.mdaFileList().index(file_name)
+            self.mda_file.setData(file_index)
+            tableview = self.mda_file.tabPath2Tableview(self._live_file_path)
+            if tableview is not None:
+                tableview.setData()
+            # Update "Points" column in folder table with the latest acquired count.
+            acq_dims = self.mda_file.data().get("acquiredDimensions", [])
+            if acq_dims and file_index < len(self.mdaInfoList()):
+                self.mdaInfoList()[file_index]["Points"] = acq_dims[0]
+                proxy = self.mda_folder_tableview.proxyModel
+                if proxy is not None:
+                    source_model = proxy.sourceModel()
+                    POINTS_COL = 2  # index of "Points" in HEADERS
+                    cell = source_model.index(file_index, POINTS_COL)
+                    source_model.dataChanged.emit(cell, cell)
+        except Exception as exc:
+            logger.warning(f"Live update: failed to reload data: {exc}")
+        self._doLiveUpdate()
+        self._updateLiveTitle()
 
     def _showPositionersSetting(self):
         """Read the show_positioners_in_folder QSetting as a bool (must run on main thread)."""
         from mdaviz.user_settings import settings
 
-        val = settings.getKey("show_positioners_in_folder")
-        if isinstance(val, str):
-            val = val.lower() in ("true", "1", "yes", "on")
-        return bool(val)
+        return settings.getBoolKey("show_positioners_in_folder")
 
-    def _readNewFileInfo(self, file_path):
-        """Read file info for a newly-detected file, using the full reader when the
-        Positioners column is enabled so the new row matches the rest of the table."""
-        from mdaviz.utils import get_file_info_lightweight, get_file_info_full
+    def _checkForNewFiles(self, folder_path):
+        """Look for new .mda files in folder_path without a full rescan.
 
-        if self._showPositionersSetting():
-            return get_file_info_full(file_path)
-        return get_file_info_lightweight(file_path)
+        The folder is listed and the new files are read in the background
+        (see LazyFolderScanner.check_folder_async); their rows are added by
+        _onFolderDelta.
+        """
+        self.mainWindow.lazy_scanner.check_folder_async(
+            Path(folder_path), self.mdaFileList()
+        )
 
-    def _checkForNewFiles(self, folder_path):
-        """Append any new .mda files found in folder_path to the table without a full rescan."""
-        current_names = set(self.mdaFileList())
-        try:
-            all_files = sorted(Path(folder_path).glob("*.mda"), key=lambda p: p.name)
-        except OSError:
-            return
-        new_files = [f for f in all_files if f.name not in current_names]
-        if not new_files:
-            return
+    def _onFolderDelta(self, delta):
+        """Add the rows of new files, update changed ones and drop removed ones.
+
+        Args:
+            delta (FolderDelta): Changes of the folder (only files of the
+                folder itself), with the file info read, by name in
+                mdaFileList()
+        """
+        if Path(delta.folder_path) != Path(self.dataPath()):
+            return  # another folder is shown now
         proxy = self.mda_folder_tableview.proxyModel
         source_model = proxy.sourceModel() if proxy is not None else None
-        for file_path in new_files:
-            file_info = self._readNewFileInfo(file_path)
-            self.mdaFileList().append(file_path.name)
+        names = self.mdaFileList()
+        if delta.removed or delta.changed:
+            gone = set(delta.removed)
+            rows = [row for row, name in enumerate(names) if name in gone]
+            updated = {
+                row: delta.file_infos[name]
+                for row, name in enumerate(names)
+                if name in delta.file_infos and name not in gone
+            }
             if source_model is not None:
-                # appendRow() appends to source_model._data, which IS mdaInfoList()
-                source_model.appendRow(file_info)
+                source_model.updateRows(updated)
+                source_model.removeFileRows(rows)
             else:
-                self.mdaInfoList().append(file_info)
-            if not file_info.get("Scan #"):
+                for row, file_info in updated.items():
+                    self.mdaInfoList()[row] = file_info
+                for row in reversed(rows):
+                    del self.mdaInfoList()[row]
+            for row in reversed(rows):
+                del names[row]
+            for file_path in list(self._tracking_files):
+                if self.fileListName(file_path) in gone:
+                    del self._tracking_files[file_path]
+            self._pending_metadata = [
+                file_path
+                for file_path in self._pending_metadata
+                if self.fileListName(file_path) not in gone
+            ]
+
+        new_names, new_infos = [], []
+        for file_path, file_stat in delta.added:
+            name = self.fileListName(file_path)
+            file_info = delta.file_infos.get(name)
+            if file_info is None:
+                continue  # unreadable
+            new_names.append(name)
+            new_infos.append(file_info)
+            if file_info.get("Scan #") is None:
                 self._pending_metadata.append(file_path)
-            self._tracking_files[file_path] = self._getMtime(file_path)
+            self._tracking_files[file_path] = file_stat.st_mtime
             self.setStatus(f"New file: {file_path.name}")
-
-    def _retryPendingMetadata(self):
-        """Re-read metadata for files that were incomplete when first detected."""
-        proxy = self.mda_folder_tableview.proxyModel
-        source_model = proxy.sourceModel() if proxy is not None else None
-        still_pending = []
-        for file_path in self._pending_metadata:
-            file_info = self._readNewFileInfo(file_path)
-            if not file_info.get("Scan #"):
-                still_pending.append(file_path)
-                continue
-            try:
-                file_index = self.mdaFileList().index(file_path.name)
-            except ValueError:
-                continue
-            self.mdaInfoList()[file_index].update(file_info)
+        if new_infos:
+            names.extend(new_names)
             if source_model is not None:
-                top_left = source_model.index(file_index, 0)
-                bottom_right = source_model.index(
-                    file_index, source_model.columnCount() - 1
-                )
-                source_model.dataChanged.emit(top_left, bottom_right)
-        self._pending_metadata = still_pending
+                # appendRows() extends source_model._data, which IS mdaInfoList()
+                source_model.appendRows(new_infos)
+            else:
+                self.mdaInfoList().extend(new_infos)
+        self._updateWatchedPaths()
 
-    def _updateTrackingFiles(self):
-        """Update the Points column for tracked new files when their mtime changes."""
-        from mdaviz.utils import get_file_info_lightweight
+    def _updateTrackingFiles(self, changed):
+        """Update the rows of tracked new files that changed on disk.
 
-        POINTS_COL = 2
-        proxy = self.mda_folder_tableview.proxyModel
-        source_model = proxy.sourceModel() if proxy is not None else None
+        The tracked files (Points column) and the files whose metadata was
+        incomplete are read again in the background, in one batch (see
+        LazyFolderScanner.refresh_files_async); their rows are updated by
+        _onFilesRefreshed.
+
+        Args:
+            changed (set): Paths (str) reported as changed by the file monitor
+        """
+        names = set(self.mdaFileList())
+        refresh = []
         for file_path in list(self._tracking_files):
-            current_mtime = self._getMtime(file_path)
-            if current_mtime == self._tracking_files[file_path]:
-                continue  # no new data written since last tick
-            self._tracking_files[file_path] = current_mtime
-            try:
-                file_index = self.mdaFileList().index(file_path.name)
-            except ValueError:
+            if str(file_path) not in changed:
+                continue  # no new data written since the last change
+            if self.fileListName(file_path) not in names:
                 del self._tracking_files[file_path]
                 continue
-            file_info = get_file_info_lightweight(file_path)
-            self.mdaInfoList()[file_index]["Points"] = file_info.get("Points", "")
-            if source_model is not None:
-                cell = source_model.index(file_index, POINTS_COL)
-                source_model.dataChanged.emit(cell, cell)
+            self._tracking_files[file_path] = self._getMtime(file_path)
+            refresh.append(file_path)
+        refresh.extend(
+            file_path
+            for file_path in self._pending_metadata
+            if str(file_path) in changed
+        )
+        if refresh:
+            self.mainWindow.lazy_scanner.refresh_files_async(
+                Path(self.dataPath()), refresh
+            )
+
+    def _onFilesRefreshed(self, delta):
+        """Update the rows of the files read again, with one dataChanged.
+
+        Files whose metadata is now complete are no longer pending.
+
+        Args:
+            delta (FolderDelta): The files read again (changed) with their
+                file info
+        """
+        if Path(delta.folder_path) != Path(self.dataPath()):
+            return  # another folder is shown now
+        proxy = self.mda_folder_tableview.proxyModel
+        source_model = proxy.sourceModel() if proxy is not None else None
+        rows = {name: row for row, name in enumerate(self.mdaFileList())}
+        infos = self.mdaInfoList()
+        updated, complete = {}, set()
+        for file_path, _ in delta.changed:
+            name = self.fileListName(file_path)
+            file_info = delta.file_infos.get(name)
+            row = rows.get(name)
+            if file_info is None or row is None:
+                continue  # unreadable, or no longer shown
+            updated[row] = {**infos[row], **file_info}
+            if file_info.get("Scan #") is not None:
+                complete.add(str(file_path))
+        if not updated:
+            return
+        if source_model is not None:
+            source_model.updateRows(updated, coalesce=True)
+        else:
+            for row, file_info in updated.items():
+                infos[row] = file_info
+        if complete:
+            self._pending_metadata = [
+                file_path
+                for file_path in self._pending_metadata
+                if str(file_path) not in complete
+            ]
+            self._updateWatchedPaths()
 
     def _check2DStructure(self):
         """For 2D scans: update X2 controls and rebuild the tableview when the inner scan
@@ -728,7 +879,7 @@ class MDA_MVC(QWidget):
 
         get_global_cache().invalidate_file(self._2d_watch_path)
         try:
-            file_name = Path(self._2d_watch_path).name
+            file_name = self.fileListName(self._2d_watch_path)
             file_index = self.mdaFileList().index(file_name)
             self.mda_file.setData(file_index)
             tableview = self.mda_file.tabPath2Tableview(self._2d_watch_path)
@@ -787,8 +938,9 @@ class MDA_MVC(QWidget):
 
             # Push refreshed data to the viz panel so the 2D plot replots when
             # the user is on the 2D tab. set2DData refreshes _2d_data and calls
-            # update2DPlot() if the 2D tab is currently active.
-            self.mda_file_viz.set2DData(file_data)
+            # update2DPlot() if the 2D tab is currently active; the live heatmap
+            # only draws the rows acquired since the last change.
+            self.mda_file_viz.set2DData(file_data, live=True)
         except Exception as exc:
             logger.warning(f"2D structure check failed: {exc}")
 
@@ -802,7 +954,7 @@ class MDA_MVC(QWidget):
             now = datetime.datetime.now().strftime("%H:%M:%S")
             widget.setPlotTitle(f"● {widget.title()} [LIVE {now}]")
             widget.main_axes.title.set_color("red")
-            widget.canvas.draw()
+            widget.canvas.draw_idle()
 
     def _doLiveUpdate(self):
         """Refresh only the live file's curves, preserving curves from other files."""
@@ -818,15 +970,24 @@ class MDA_MVC(QWidget):
         selection = self._live_selection
         if not live_tableview or not selection or not selection.get("Y"):
             return
-        # Re-plot the live file's curves; addCurve updates them in-place if data changed,
-        # leaving curves from other files untouched.
+        # Append the new points to the live file's curves; curves that cannot
+        # be extended (new curve or label, new scan in the file) are re-plotted:
+        # addCurve updates them in-place if data changed, leaving curves from
+        # other files untouched.
         datasets, plot_options = live_tableview.data2Plot(selection)
         y_index = selection.get("Y", [])
-        for i, (ds, ds_options) in zip(y_index, datasets):
-            options = {"ds_options": ds_options, "plot_options": plot_options}
-            widgetMpl.plot(i, *ds, **options)
-        widgetMpl.refreshAllUnscaledCurves()
-        self.mda_file_viz.setPlot(widgetMpl)
+        replotted = False
+        with widgetMpl.batchUpdate():
+            for i, (ds, ds_options) in zip(y_index, datasets):
+                options = {"ds_options": ds_options, "plot_options": plot_options}
+                if not widgetMpl.extendPlot(i, *ds, **options):
+                    widgetMpl.plot(i, *ds, **options)
+                    replotted = True
+            curves = widgetMpl.curveManager.curves().values()
+            if replotted or any(curve.get("unscale", False) for curve in curves):
+                widgetMpl.refreshAllUnscaledCurves()
+        if replotted:
+            self.mda_file_viz.setPlot(widgetMpl)
 
     # # ------------ Plot methods:
 
@@ -936,16 +1097,18 @@ class MDA_MVC(QWidget):
                 if current_file_path != self._last_plotted_file_path:
                     widgetMpl.curveManager.clearPersistentProperties()
                     self._last_plotted_file_path = current_file_path
-            for i, (ds, ds_options) in zip(y_index, datasets):
-                # ds: [x_data, y_data]
-                # ds_options: {"label":y_label} (for legend)
-                # plot_options: {"x" (label), "x_unit", "y" (label), "y_unit", "title", "folderPath"}
-                options = {"ds_options": ds_options, "plot_options": plot_options}
-                # Add X2 index to options if available
-                if "x2_index" in plot_options:
-                    options["x2_index"] = plot_options["x2_index"]
-                widgetMpl.plot(i, *ds, **options)
-            widgetMpl.refreshAllUnscaledCurves()
+            # One plot update for all the curves:
+            with widgetMpl.batchUpdate():
+                for i, (ds, ds_options) in zip(y_index, datasets):
+                    # ds: [x_data, y_data]
+                    # ds_options: {"label":y_label} (for legend)
+                    # plot_options: {"x" (label), "x_unit", "y" (label), "y_unit", "title", "folderPath"}
+                    options = {"ds_options": ds_options, "plot_options": plot_options}
+                    # Add X2 index to options if available
+                    if "x2_index" in plot_options:
+                        options["x2_index"] = plot_options["x2_index"]
+                    widgetMpl.plot(i, *ds, **options)
+                widgetMpl.refreshAllUnscaledCurves()
             self.mda_file_viz.setPlot(widgetMpl)
             if action == "replace":
                 self._startWatching(current_file_path)
@@ -1027,7 +1190,7 @@ class MDA_MVC(QWidget):
             if file_path:
                 # Find the file index in the current folder
                 try:
-                    file_name = Path(file_path).name
+                    file_name = self.fileListName(file_path)
                     file_index = self.mdaFileList().index(file_name)
                     # Set the data again to get the full structure
                     self.mda_file.setData(file_index)
@@ -1039,7 +1202,7 @@ class MDA_MVC(QWidget):
 
         # Highlight the corresponding file in the folder table view if it belongs to the current folder
         if file_path:
-            file_name = Path(file_path).name
+            file_name = self.fileListName(file_path)
             current_folder_path = str(self.dataPath())
 
             # Check if the file belongs to the currently loaded folder
@@ -1252,14 +1415,15 @@ class MDA_MVC(QWidget):
             if widgetMpl.curveBox.count() > 0:
                 last_selected_curve_index = widgetMpl.curveBox.currentIndex()
             widgetMpl.curveManager.removeAllCurves()
-        for row, (ds, ds_options) in zip(new_y_selection, datasets):
-            # ds_options: label (for legend)
-            # plot_options: xlabel, ylabel, title
-            options = {"ds_options": ds_options, "plot_options": plot_options}
-            # Add X2 index to options if available
-            if "x2_index" in plot_options:
-                options["x2_index"] = plot_options["x2_index"]
-            widgetMpl.plot(row, *ds, **options)
+        with widgetMpl.batchUpdate():
+            for row, (ds, ds_options) in zip(new_y_selection, datasets):
+                # ds_options: label (for legend)
+                # plot_options: xlabel, ylabel, title
+                options = {"ds_options": ds_options, "plot_options": plot_options}
+                # Add X2 index to options if available
+                if "x2_index" in plot_options:
+                    options["x2_index"] = plot_options["x2_index"]
+                widgetMpl.plot(row, *ds, **options)
         self.mda_file_viz.setPlot(widgetMpl)
         # Restore last selected curve in comboBox
         if (
@@ -1,17 +1,68 @@
 """
 QAbstractTableModel of folder content.
 
+Rows hold raw values (numbers, epoch seconds, byte counts); they are
+formatted only when displayed, and sorted on typed column arrays.
+
 .. autosummary::
 
     ~MDAFolderTableModel
+    ~folder_column_labels
 """
 
+from datetime import datetime
+
+import numpy as np
 from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
-from mdaviz.utils import HEADERS
+from mdaviz.folder_search import FolderSearchIndex
+from mdaviz.paged_info_list import PagedInfoList
+from mdaviz.utils import HEADERS, human_readable_size
+
+# Columns holding numbers (sorted numerically; missing values sort first)
+NUMERIC_COLUMNS = ("Scan #", "Points", "Dim", "Date", "Size")
+
+
+def folder_column_labels(show_positioners=False, show_folder=False):
+    """
+    Column labels of the folder table.
+
+    The optional columns come after HEADERS so that the column numbers of
+    HEADERS do not change: Positioners (positioner names) and Folder (the
+    subfolder of each file, in recursive scans).
+    """
+    labels = HEADERS
+    if show_positioners:
+        labels += ("Positioners",)
+    if show_folder:
+        labels += ("Folder",)
+    return labels
+
+
+def format_value(label, value):
+    """Format a raw folder table value for display."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if label == "Date":
+        return datetime.fromtimestamp(value).strftime("%Y-%m-%d %H:%M:%S")
+    if label == "Size":
+        return human_readable_size(value)
+    return str(value)
+
+
+def sort_key(value):
+    """Numeric sort key of a raw value of a NUMERIC_COLUMNS column."""
+    if value is None or value == "":
+        return -np.inf
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return -np.inf
 
 
 class MDAFolderTableModel(QAbstractTableModel):
-    def __init__(self, data, parent, show_positioners=False):
+    def __init__(self, data, parent, show_positioners=False, show_folder=False):
         """
         Create the model and connect with its parent.
 
@@ -19,12 +70,27 @@ class MDAFolderTableModel(QAbstractTableModel):
 
         parent object:
             Instance of mdaviz.mda_folder.MDAMVC
+
+        show_positioners bool:
+            Show the Positioners column
+
+        show_folder bool:
+            Show the Folder column (subfolder of each file, recursive scans)
         """
 
         self.mda_mvc = parent
         super().__init__()
 
-        self.columnLabels = HEADERS + ("Positioners",) if show_positioners else HEADERS
+        self.columnLabels = folder_column_labels(show_positioners, show_folder)
+        self._sort_keys = {}  # column -> array of sort keys, built when sorting
+        self._search_index = None  # FolderSearchIndex, built when filtering
+        for signal in (
+            self.dataChanged,
+            self.rowsInserted,
+            self.rowsRemoved,
+            self.modelReset,
+        ):
+            signal.connect(self._clearSortKeys)
         self.setFileInfoList(data)
 
     # ------------ methods required by Qt's view
@@ -44,8 +110,14 @@ class MDAFolderTableModel(QAbstractTableModel):
         if role == 0:  # Qt.DisplayRole
             label = self.columnLabels[index.column()]
             file_info = self.fileInfoList()[index.row()]
-            value = file_info.get(label, "")
-            return value
+            return format_value(label, file_info.get(label))
+        elif role == Qt.ItemDataRole.UserRole:
+            # sort key of the cell
+            label = self.columnLabels[index.column()]
+            value = self.fileInfoList()[index.row()].get(label)
+            if label in NUMERIC_COLUMNS:
+                return sort_key(value)
+            return "" if value is None else str(value)
         elif role == Qt.ItemDataRole.TextAlignmentRole:
             # Center align specific columns
             label = self.columnLabels[index.column()]
@@ -62,6 +134,76 @@ class MDAFolderTableModel(QAbstractTableModel):
                 return str(section + 1)
         return None
 
+    def sortKeys(self, column):
+        """
+        Sort keys of a column as an array (one per row).
+
+        Numeric columns give a float array, the others a string array. The
+        array is kept until the rows change. For a paged folder (see
+        :class:`~mdaviz.paged_info_list.PagedInfoList`), only the columns known
+        from the folder listing have sort keys; the others give None.
+        """
+        keys = self._sort_keys.get(column)
+        if keys is None and isinstance(self._data, PagedInfoList):
+            keys = self._data.sortKeys(self.columnLabels[column])
+            self._sort_keys[column] = keys
+        elif keys is None:
+            label = self.columnLabels[column]
+            values = [file_info.get(label) for file_info in self._data]
+            if label in NUMERIC_COLUMNS:
+                keys = np.array([sort_key(v) for v in values], dtype=float)
+            else:
+                keys = np.array(
+                    ["" if v is None else str(v) for v in values], dtype=str
+                )
+            self._sort_keys[column] = keys
+        return keys
+
+    def isPaged(self):
+        """Whether the rows are read on demand (a PagedInfoList)."""
+        return isinstance(self._data, PagedInfoList)
+
+    def prefetchRows(self, rows):
+        """Read the file info of rows about to be shown, in one batch (paged folders)."""
+        if isinstance(self._data, PagedInfoList):
+            self._data.load(rows)
+
+    def searchIndex(self):
+        """
+        Metadata search index of the rows (a FolderSearchIndex).
+
+        Rows are indexed by their file name and subfolder, and by the search
+        terms read with them (``Terms``, see :mod:`~mdaviz.folder_search`).
+        The index is kept until the rows change. For a paged folder, only
+        the names of the rows not read yet are indexed.
+        """
+        if self._search_index is None:
+            if isinstance(self._data, PagedInfoList):
+                infos = dict(self._data.loadedRows())
+                rows = (
+                    (row, [name, *infos.get(row, {}).get("Terms", ())])
+                    for row, name in enumerate(self._data.names)
+                )
+            else:
+                rows = (
+                    (
+                        row,
+                        [
+                            file_info.get("Name", ""),
+                            file_info.get("Folder", ""),
+                            *file_info.get("Terms", ()),
+                        ],
+                    )
+                    for row, file_info in enumerate(self._data)
+                )
+            self._search_index = FolderSearchIndex(rows, len(self._data))
+        return self._search_index
+
+    def _clearSortKeys(self, *args):
+        """Drop the sort key arrays and the search index (the rows changed)."""
+        self._sort_keys.clear()
+        self._search_index = None
+
     # # ------------ get & set methods
 
     def fileInfoList(self):
@@ -75,10 +217,60 @@ class MDAFolderTableModel(QAbstractTableModel):
         ie the list of mda files info
         """
         self._data = data
+        self._clearSortKeys()
 
     def appendRow(self, file_info):
         """Append a single row to the model, notifying the view."""
-        row = len(self._data)
-        self.beginInsertRows(QModelIndex(), row, row)
-        self._data.append(file_info)
+        self.appendRows([file_info])
+
+    def appendRows(self, file_infos):
+        """Append rows to the model with a single insertion notification."""
+        if not file_infos:
+            return
+        first = len(self._data)
+        self.beginInsertRows(QModelIndex(), first, first + len(file_infos) - 1)
+        self._data.extend(file_infos)
         self.endInsertRows()
+
+    def updateRows(self, rows, coalesce=False):
+        """
+        Replace the file info of existing rows.
+
+        PARAMETERS
+
+        rows dict:
+            row number -> new file info; one dataChanged is emitted per run of
+            consecutive rows
+        coalesce bool:
+            Emit a single dataChanged, from the first to the last row (rows in
+            between are unchanged but notified too). Cheaper when the rows are
+            scattered: a sorting proxy sorts again once per dataChanged.
+        """
+        if coalesce:
+            runs = [(min(rows), max(rows))] if rows else []
+        else:
+            runs = _consecutive_runs(rows)
+        for row, file_info in rows.items():
+            self._data[row] = file_info
+        for first, last in runs:
+            self.dataChanged.emit(
+                self.index(first, 0), self.index(last, self.columnCount() - 1)
+            )
+
+    def removeFileRows(self, rows):
+        """Remove rows, with one removal notification per run of consecutive rows."""
+        for first, last in reversed(_consecutive_runs(rows)):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._data[first : last + 1]
+            self.endRemoveRows()
+
+
+def _consecutive_runs(rows):
+    """Group row numbers into sorted (first, last) runs of consecutive rows."""
+    runs = []
+    for row in sorted(rows):
+        if runs and row == runs[-1][1] + 1:
+            runs[-1][1] = row
+        else:
+            runs.append([row, row])
+    return [(first, last) for first, last in runs]
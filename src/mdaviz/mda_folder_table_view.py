@@ -2,29 +2,306 @@
 Search for mda files.
 """
 
-from PyQt6.QtCore import Qt, QSortFilterProxyModel
+from dataclasses import dataclass, field
+from typing import Optional
+import numpy as np
+from PyQt6.QtCore import QAbstractProxyModel, QModelIndex, Qt, QTimer, pyqtSignal
 from PyQt6.QtWidgets import QWidget, QHeaderView
 from mdaviz import utils
 from mdaviz.mda_folder_table_model import HEADERS
 
+# Wait for scrolling/resizing to pause before reporting the viewport
+VIEWPORT_REPORT_DELAY_MS = 150
+# Wait for typing to pause before filtering the table
+FILTER_DELAY_MS = 100
 
-class FolderSortProxyModel(QSortFilterProxyModel):
-    """Proxy model with correct numeric sorting for Scan # and Points columns."""
 
-    NUMERIC_COLUMNS = {1, 2}  # Scan #, Points
+@dataclass
+class FolderViewport:
+    """What the folder table currently shows (rows in display order)."""
 
-    def lessThan(self, left, right):
-        if left.column() in self.NUMERIC_COLUMNS:
-            try:
-                return int(left.data() or 0) < int(right.data() or 0)
-            except (ValueError, TypeError):
-                pass
-        return super().lessThan(left, right)
+    first_row: int = -1  # first visible (proxy) row, -1 if none
+    last_row: int = -1  # last visible (proxy) row, -1 if none
+    scroll_position: int = 0  # vertical scroll bar value
+    sort_column: Optional[str] = None  # label of the sort column, None if unsorted
+    descending: bool = False
+    visible_names: list[str] = field(default_factory=list)  # file names, top first
+
+
+class FolderSortProxyModel(QAbstractProxyModel):
+    """
+    Proxy model sorting the folder table on the typed column arrays of
+    MDAFolderTableModel.
+
+    The display order is a permutation of the source rows computed with
+    numpy, so sorting large folders does not call Python for every
+    comparison. Selections (persistent indexes) are kept across sorts and
+    across rows being appended, changed or removed in the source model.
+
+    With a ``page_size``, only the first rows of the display order are
+    shown; the view fetches more (``canFetchMore``/``fetchMore``) as it is
+    scrolled to the end, and the source model reads the file info of each
+    fetched page in one batch (see ``MDAFolderTableModel.prefetchRows``).
+
+    A row filter (a boolean mask of the source rows, e.g. from the
+    metadata search index) hides rows; source rows added while a filter
+    is set are shown until the filter is set again.
+    """
+
+    def __init__(self, parent=None, page_size=0):
+        """
+        Create the proxy.
+
+        PARAMETERS
+
+        page_size int:
+            Number of rows shown at first and added by each fetchMore()
+            (0: all rows are shown)
+        """
+        super().__init__(parent)
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+        self._rows = np.arange(0)  # display row -> source row
+        self._positions = np.arange(0)  # source row -> display row
+        self.page_size = page_size
+        self._fetched = 0  # number of display rows shown (with a page_size)
+        self._filter = None  # boolean mask of the shown source rows, None: all
+
+    # ------------ QAbstractProxyModel interface
+
+    def setSourceModel(self, model):
+        """Set the folder table model and follow its row changes."""
+        self.beginResetModel()
+        super().setSourceModel(model)
+        model.dataChanged.connect(self._onSourceDataChanged)
+        model.headerDataChanged.connect(self.headerDataChanged)
+        model.rowsAboutToBeInserted.connect(self._onSourceRowsAboutToBeInserted)
+        model.rowsInserted.connect(self._onSourceRowsInserted)
+        model.rowsAboutToBeRemoved.connect(self._onSourceRowsAboutToBeRemoved)
+        model.rowsRemoved.connect(self._onSourceRowsRemoved)
+        model.modelAboutToBeReset.connect(self.beginResetModel)
+        model.modelReset.connect(self._onSourceModelReset)
+        self._filter = None
+        self._setRows(self._sortedRows())
+        self._resetFetched()
+        self.endResetModel()
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid() or self.sourceModel() is None:
+            return QModelIndex()
+        row = int(self._rows[proxy_index.row()])
+        return self.sourceModel().index(row, proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        row = int(self._positions[source_index.row()])
+        return self.index(row, source_index.column())  # invalid if not fetched/shown
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not (
+            0 <= row < self.rowCount() and 0 <= column < self.columnCount()
+        ):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=None):
+        if index is None:  # QObject.parent()
+            return super().parent()
+        return QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        if self.page_size > 0:
+            return self._fetched
+        return len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        source = self.sourceModel()
+        return 0 if parent.isValid() or source is None else source.columnCount()
+
+    # ------------ paging
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.rowCount() < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        """Show the next page of rows, reading their file info first."""
+        if not self.canFetchMore(parent):
+            return
+        first = self._fetched
+        last = min(first + self.page_size, len(self._rows)) - 1
+        self.sourceModel().prefetchRows(self._rows[first : last + 1].tolist())
+        self.beginInsertRows(QModelIndex(), first, last)
+        self._fetched = last + 1
+        self.endInsertRows()
+
+    def _resetFetched(self):
+        """Show the first page of rows (after a model reset)."""
+        self._fetched = min(self.page_size, len(self._rows))
+        source = self.sourceModel()
+        if self.page_size > 0 and source is not None:
+            source.prefetchRows(self._rows[: self._fetched].tolist())
+
+    # ------------ filtering
+
+    def setRowFilter(self, mask):
+        """
+        Show only some source rows.
+
+        PARAMETERS
+
+        mask numpy array or None:
+            Boolean mask with one value per source row (None shows all rows)
+        """
+        if mask is not None:
+            mask = np.asarray(mask, dtype=bool)
+        if self._filter is None and mask is None:
+            return
+        if (
+            self._filter is not None
+            and mask is not None
+            and np.array_equal(self._filter, mask)
+        ):
+            return
+        self.beginResetModel()
+        self._filter = mask
+        self._setRows(self._sortedRows())
+        self._resetFetched()
+        self.endResetModel()
+
+    def rowFilter(self):
+        """Boolean mask of the shown source rows (None if all rows are shown)."""
+        return self._filter
+
+    # ------------ sorting
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """Sort by column (-1 restores the source model order)."""
+        self._sort_column = column
+        self._sort_order = order
+        self._applyRows(self._sortedRows())
+
+    def sortColumn(self):
+        return self._sort_column
+
+    def sortOrder(self):
+        return self._sort_order
+
+    def _sortedRows(self):
+        """Source rows in display order for the current sort column and order."""
+        source = self.sourceModel()
+        count = source.rowCount() if source is not None else 0
+        keys = None
+        if 0 <= self._sort_column < self.columnCount():
+            keys = source.sortKeys(self._sort_column)  # None: not sortable (paged)
+        if keys is None:
+            rows = np.arange(count)
+        elif self._sort_order == Qt.SortOrder.DescendingOrder:
+            # Descending keys; equal keys stay in source order
+            rows = np.lexsort((-np.arange(count), keys))[::-1]
+        else:
+            rows = np.argsort(keys, kind="stable")
+        if self._filter is not None:
+            rows = rows[self._filter[rows]]
+        return rows
+
+    def _setRows(self, rows):
+        """Set the display order and its inverse (-1 for hidden source rows)."""
+        self._rows = np.asarray(rows, dtype=np.int64)
+        source = self.sourceModel()
+        count = source.rowCount() if source is not None else len(self._rows)
+        self._positions = np.full(count, -1, dtype=np.int64)
+        self._positions[self._rows] = np.arange(len(self._rows))
+
+    def _applyRows(self, rows):
+        """Change the display order, keeping persistent indexes (selection)."""
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        sources = [self.mapToSource(index) for index in persistent]
+        self._setRows(rows)
+        self.changePersistentIndexList(
+            persistent, [self.mapFromSource(index) for index in sources]
+        )
+        self.layoutChanged.emit()
+
+    # ------------ source model changes
+
+    def _onSourceDataChanged(self, top_left, bottom_right, roles=()):
+        """Forward changed cells; re-sort if the sort column changed."""
+        first, last = top_left.row(), bottom_right.row()
+        if top_left.column() <= self._sort_column <= bottom_right.column():
+            self._applyRows(self._sortedRows())
+        rows = self._positions[first : last + 1]
+        rows = rows[(rows >= 0) & (rows < self.rowCount())]
+        if len(rows):
+            self.dataChanged.emit(
+                self.index(int(rows.min()), top_left.column()),
+                self.index(int(rows.max()), bottom_right.column()),
+            )
+
+    def _onSourceRowsAboutToBeInserted(self, parent, first, last):
+        """New source rows are shown at the end until the next sort."""
+        count = len(self._rows)
+        # Rows added after rows not fetched yet are not shown until fetched
+        self._insert_shown = self.rowCount() == count
+        if self._insert_shown:
+            self.beginInsertRows(QModelIndex(), count, count + last - first)
+
+    def _onSourceRowsInserted(self, parent, first, last):
+        rows = self._rows.copy()
+        rows[rows >= first] += last - first + 1
+        if self._filter is not None:
+            self._filter = np.insert(self._filter, first, [True] * (last - first + 1))
+        self._setRows(np.concatenate([rows, np.arange(first, last + 1)]))
+        if self._insert_shown:
+            self._fetched += last - first + 1
+            self.endInsertRows()
+        if self._sort_column >= 0:
+            self._applyRows(self._sortedRows())
+
+    def _onSourceRowsAboutToBeRemoved(self, parent, first, last):
+        """Remove the display rows of the source rows about to be removed."""
+        positions = self._positions[first : last + 1]
+        positions = sorted(positions[positions >= 0].tolist(), reverse=True)
+        while positions:
+            # One removal per run of consecutive display rows, from the end
+            run_last = run_first = positions.pop(0)
+            while positions and positions[0] == run_first - 1:
+                run_first = positions.pop(0)
+            shown = self.rowCount()
+            if run_last >= shown:  # rows not fetched yet: nothing to notify
+                self._rows = np.delete(
+                    self._rows, np.s_[max(run_first, shown) : run_last + 1]
+                )
+                run_last = shown - 1
+            if run_first <= run_last:
+                self.beginRemoveRows(QModelIndex(), run_first, run_last)
+                self._rows = np.delete(self._rows, np.s_[run_first : run_last + 1])
+                self._fetched -= run_last - run_first + 1
+                self.endRemoveRows()
+
+    def _onSourceRowsRemoved(self, parent, first, last):
+        rows = self._rows.copy()
+        rows[rows > last] -= last - first + 1
+        if self._filter is not None:
+            self._filter = np.delete(self._filter, np.s_[first : last + 1])
+        self._setRows(rows)
+
+    def _onSourceModelReset(self):
+        self._filter = None  # the view sets it again for the new rows
+        self._setRows(self._sortedRows())
+        self._resetFetched()
+        self.endResetModel()
 
 
 class MDAFolderTableView(QWidget):
     ui_file = utils.getUiFileName(__file__)
 
+    # Visible rows, scroll position or sort order changed (debounced)
+    viewportChanged = pyqtSignal()
+
     def __init__(self, parent):
         """
         Create the table view and connect with its parent.
@@ -46,26 +323,125 @@ class MDAFolderTableView(QWidget):
         header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
         self.proxyModel = None
 
-    def displayTable(self):
-        from mdaviz.mda_folder_table_model import MDAFolderTableModel
-        from mdaviz.empty_table_model import EmptyTableModel
+        self._viewport_timer = QTimer(self)
+        self._viewport_timer.setSingleShot(True)
+        self._viewport_timer.setInterval(VIEWPORT_REPORT_DELAY_MS)
+        self._viewport_timer.timeout.connect(self.viewportChanged)
+        scroll_bar = self.tableView.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self._scheduleViewportReport)
+        scroll_bar.rangeChanged.connect(self._scheduleViewportReport)
+        header.sortIndicatorChanged.connect(self._scheduleViewportReport)
+
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DELAY_MS)
+        self._filter_timer.timeout.connect(self.applyFilter)
+        self.filterEdit.textChanged.connect(self._filter_timer.start)
 
+    def _scheduleFilter(self, *args):
+        """Filter the table again after its rows changed (if a filter is set)."""
+        if self.filterEdit.text().strip():
+            self._filter_timer.start()
+
+    def applyFilter(self):
+        """Show only the rows matching the filter box (see mdaviz.folder_search)."""
+        if self.proxyModel is None:
+            return
+        query = self.filterEdit.text().strip()
+        mask = None
+        if query:
+            mask = self.proxyModel.sourceModel().searchIndex().search(query)
+        self.proxyModel.setRowFilter(mask)
+        if mask is not None:
+            self.setStatus(f"{int(mask.sum())} of {len(mask)} files match '{query}'")
+        self._scheduleViewportReport()
+
+    def _scheduleViewportReport(self, *args):
+        """(Re)start the timer that emits viewportChanged."""
+        self._viewport_timer.start()
+
+    def resizeEvent(self, event):
+        """Report the viewport when the number of visible rows may change."""
+        super().resizeEvent(event)
+        self._scheduleViewportReport()
+
+    def viewportState(self) -> FolderViewport:
+        """Describe the visible rows, scroll position and sort order of the table."""
+        state = FolderViewport(
+            scroll_position=self.tableView.verticalScrollBar().value()
+        )
+        if self.proxyModel is None:
+            return state
+        source_model = self.proxyModel.sourceModel()
+        sort_column = self.proxyModel.sortColumn()
+        if 0 <= sort_column < source_model.columnCount():
+            state.sort_column = source_model.columnLabels[sort_column]
+            state.descending = (
+                self.proxyModel.sortOrder() == Qt.SortOrder.DescendingOrder
+            )
+
+        row_count = self.proxyModel.rowCount()
+        first_row = self.tableView.rowAt(0)
+        if row_count == 0 or first_row < 0:
+            return state
+        last_row = self.tableView.rowAt(self.tableView.viewport().height() - 1)
+        if last_row < 0:
+            last_row = row_count - 1
+        state.first_row, state.last_row = first_row, last_row
+        file_list = self.mda_mvc.mdaFileList()
+        for row in range(first_row, last_row + 1):
+            source_row = self.proxyModel.mapToSource(
+                self.proxyModel.index(row, 0)
+            ).row()
+            state.visible_names.append(file_list[source_row])
+        return state
+
+    def columnOptions(self):
+        """(show_positioners, show_folder) from the user settings."""
         from mdaviz.user_settings import settings
 
-        show_pos = settings.getKey("show_positioners_in_folder")
-        if isinstance(show_pos, str):
-            show_pos = show_pos.lower() in ("true", "1", "yes", "on")
+        return (
+            settings.getBoolKey("show_positioners_in_folder"),
+            settings.getBoolKey("scan_subfolders"),
+        )
+
+    def columnsOutdated(self):
+        """Whether the table columns differ from those set in the user settings."""
+        from mdaviz.mda_folder_table_model import folder_column_labels
 
+        if self.proxyModel is None:
+            return False
+        labels = folder_column_labels(*self.columnOptions())
+        return self.proxyModel.sourceModel().columnLabels != labels
+
+    def displayTable(self):
+        from mdaviz.mda_folder_table_model import MDAFolderTableModel
+        from mdaviz.empty_table_model import EmptyTableModel
+
+        show_pos, show_folder = self.columnOptions()
         data = self.mdaInfoList()
         if len(data) > 0:
             data_model = MDAFolderTableModel(
-                data, self.mda_mvc, show_positioners=bool(show_pos)
+                data, self.mda_mvc, show_positioners=show_pos, show_folder=show_folder
             )
-            self.proxyModel = FolderSortProxyModel()
+            page_size = 0
+            if data_model.isPaged():
+                from mdaviz.lazy_loading_config import get_config
+
+                page_size = get_config().virtual_table_page_size
+            self.proxyModel = FolderSortProxyModel(page_size=page_size)
             self.proxyModel.setSourceModel(data_model)
             self.tableView.setModel(self.proxyModel)
             self.tableView.setSortingEnabled(True)
             self.applyDefaultSort()
+            for signal in (
+                data_model.dataChanged,
+                data_model.rowsInserted,
+                data_model.rowsRemoved,
+                data_model.modelReset,
+            ):
+                signal.connect(self._scheduleFilter)
+            self.applyFilter()
         else:
             self.proxyModel = None
             empty_model = EmptyTableModel(HEADERS)
@@ -77,9 +453,7 @@ class MDAFolderTableView(QWidget):
             return
         from mdaviz.user_settings import settings
 
-        sort_newest = settings.getKey("sort_newest_first")
-        if isinstance(sort_newest, str):
-            sort_newest = sort_newest.lower() in ("true", "1", "yes", "on")
+        sort_newest = settings.getBoolKey("sort_newest_first")
         DATE_COLUMN = 4
         if sort_newest:
             self.proxyModel.sort(DATE_COLUMN, Qt.SortOrder.DescendingOrder)
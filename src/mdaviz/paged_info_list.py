@@ -0,0 +1,277 @@
+"""
+Folder table rows of very large folders, read on demand.
+
+For folders with more files than ``folder_scan_max_files``, the folder
+scanner does not read every file. It returns a :class:`PagedInfoList`
+instead of a list of file info dicts: a compact columnar index of the
+folder listing (file names, mtimes and sizes) that reads the file info
+of a row only when it is accessed, keeping the rows read in an LRU cache.
+
+.. autosummary::
+
+    ~PagedInfoList
+"""
+
+from collections import OrderedDict
+from collections.abc import MutableSequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable, Optional
+import numpy as np
+from mdaviz.logger import get_logger
+from mdaviz.utils import HEADERS, get_file_info_header
+
+# Get logger for this module
+logger = get_logger("paged_info_list")
+
+# Folder table columns known from the folder listing (sortable without reading files)
+LISTING_COLUMNS = ("Date", "Size")
+
+
+class PagedInfoList(MutableSequence):
+    """
+    List of folder table rows (file info dicts) that reads rows on demand.
+
+    Only the file names, mtimes and sizes of all files are held in memory;
+    the file info of a row is read from the MDA headers (see
+    :func:`~mdaviz.utils.get_file_info_header`) the first time it is
+    accessed, or in batches with :meth:`load`. At most ``cache_rows`` rows
+    are kept; the least recently used ones are dropped and read again if
+    needed.
+
+    It can be used wherever the folder table uses a list of file info
+    dicts (``mdaInfoList``): rows can be replaced, deleted and appended.
+    Rows are GUI-thread objects, like the folder table model.
+    """
+
+    def __init__(
+        self,
+        folder_path: Path,
+        names: Iterable[str] = (),
+        mtimes: Iterable[float] = (),
+        sizes: Iterable[int] = (),
+        cache_rows: int = 2000,
+        read_workers: int = 1,
+        search_terms: bool = False,
+        environment_pvs: Iterable[str] = (),
+    ):
+        """
+        Initialize the list.
+
+        Parameters:
+            folder_path (Path): Folder of the files
+            names (iterable of str): File names, in row order
+            mtimes (iterable of float): Modification times of the files
+            sizes (iterable of int): Sizes of the files in bytes
+            cache_rows (int): Maximum number of file info dicts kept in memory
+            read_workers (int): Number of threads reading file headers in :meth:`load`
+            search_terms (bool): Read the metadata search terms of each row
+            environment_pvs (iterable of str): Environment PVs whose values
+                are search terms
+        """
+        self.folder_path = Path(folder_path)
+        self._names = list(names)
+        self._mtimes = np.asarray(list(mtimes), dtype=float)
+        self._sizes = np.asarray(list(sizes), dtype=np.int64)
+        self.cache_rows = max(1, cache_rows)
+        self.read_workers = max(1, read_workers)
+        self.search_terms = search_terms
+        self.environment_pvs = tuple(environment_pvs)
+        self._rows: OrderedDict[str, dict[str, Any]] = OrderedDict()  # name -> info
+        self.reads = 0  # number of files read so far
+
+    @classmethod
+    def from_entries(cls, folder_path: Path, entries, **kwargs) -> "PagedInfoList":
+        """
+        Create the list from a folder listing.
+
+        Parameters:
+            folder_path (Path): Folder of the files
+            entries (list): (path, stat result) of the files, in row order
+                (as returned by :func:`~mdaviz.lazy_folder_scanner.list_mda_files`)
+            **kwargs: Other arguments of :class:`PagedInfoList`
+
+        Returns:
+            PagedInfoList: Rows of the listed files, none of them read yet
+        """
+        return cls(
+            folder_path,
+            [path.name for path, _ in entries],
+            [file_stat.st_mtime for _, file_stat in entries],
+            [file_stat.st_size for _, file_stat in entries],
+            **kwargs,
+        )
+
+    # ------------ sequence interface
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self[n] for n in range(*row.indices(len(self)))]
+        name = self._names[row]
+        file_info = self._rows.get(name)
+        if file_info is None:
+            self.load([row % len(self)])
+            file_info = self._rows[name]
+        else:
+            self._rows.move_to_end(name)
+        return file_info
+
+    def __setitem__(self, row, file_info) -> None:
+        if isinstance(row, slice):
+            raise TypeError("PagedInfoList does not support slice assignment")
+        old_name = self._names[row]
+        self._rows.pop(old_name, None)
+        name = file_info.get("Name", old_name)
+        self._names[row] = name
+        self._mtimes[row], self._sizes[row] = self._listingValues(file_info)
+        self._cache(name, file_info)
+
+    def __delitem__(self, row) -> None:
+        rows = range(len(self))[row]
+        for n in [rows] if isinstance(rows, int) else rows:
+            self._rows.pop(self._names[n], None)
+        del self._names[row]
+        self._mtimes = np.delete(self._mtimes, np.arange(len(self._mtimes))[row])
+        self._sizes = np.delete(self._sizes, np.arange(len(self._sizes))[row])
+
+    def insert(self, row: int, file_info: dict[str, Any]) -> None:
+        """Insert the file info of a new file before row."""
+        row = min(max(row if row >= 0 else row + len(self), 0), len(self))
+        mtime, size = self._listingValues(file_info)
+        self._names.insert(row, file_info["Name"])
+        self._mtimes = np.insert(self._mtimes, row, mtime)
+        self._sizes = np.insert(self._sizes, row, size)
+        self._cache(file_info["Name"], file_info)
+
+    def extend(self, file_infos: Iterable[dict[str, Any]]) -> None:
+        """Append the file info of new files."""
+        file_infos = list(file_infos)
+        values = [self._listingValues(file_info) for file_info in file_infos]
+        self._names.extend(file_info["Name"] for file_info in file_infos)
+        self._mtimes = np.concatenate(
+            [self._mtimes, np.asarray([v[0] for v in values], dtype=float)]
+        )
+        self._sizes = np.concatenate(
+            [self._sizes, np.asarray([v[1] for v in values], dtype=np.int64)]
+        )
+        for file_info in file_infos:
+            self._cache(file_info["Name"], file_info)
+
+    # ------------ paging
+
+    @property
+    def names(self) -> list[str]:
+        """File names, in row order (do not modify)."""
+        return self._names
+
+    def isLoaded(self, row: int) -> bool:
+        """Whether the file info of a row is in memory."""
+        return self._names[row] in self._rows
+
+    def load(self, rows: Iterable[int]) -> int:
+        """
+        Read the file info of rows that are not in memory.
+
+        Parameters:
+            rows (iterable of int): Rows to read (e.g. a page about to be shown)
+
+        Returns:
+            int: Number of files read
+        """
+        names = list(dict.fromkeys(self._names[row] for row in rows))
+        missing = [name for name in names if name not in self._rows]
+        if not missing:
+            return 0
+        if self.read_workers > 1 and len(missing) > 1:
+            with ThreadPoolExecutor(
+                max_workers=self.read_workers, thread_name_prefix="mda-page"
+            ) as executor:
+                infos = list(executor.map(self._readFileInfo, missing))
+        else:
+            infos = [self._readFileInfo(name) for name in missing]
+        self.reads += len(missing)
+        for name, file_info in zip(missing, infos):
+            self._cache(name, file_info)
+        return len(missing)
+
+    def loadedRows(self) -> list[tuple[int, dict[str, Any]]]:
+        """(row, file info) of the rows in memory, in row order."""
+        return [
+            (row, self._rows[name])
+            for row, name in enumerate(self._names)
+            if name in self._rows
+        ]
+
+    def sortKeys(self, label: str) -> Optional[np.ndarray]:
+        """
+        Sort keys of a folder table column, if known without reading files.
+
+        Parameters:
+            label (str): Column label
+
+        Returns:
+            numpy array or None: One key per row for the LISTING_COLUMNS, None otherwise
+        """
+        if label == "Date":
+            return self._mtimes.copy()
+        if label == "Size":
+            return self._sizes.astype(float)
+        return None
+
+    def clearCache(self) -> None:
+        """Drop the file info of all rows (they are read again when accessed)."""
+        self._rows.clear()
+
+    # ------------ internals
+
+    def _cache(self, name: str, file_info: dict[str, Any]) -> None:
+        """Keep the file info of a row, dropping the least recently used ones."""
+        self._rows[name] = file_info
+        self._rows.move_to_end(name)
+        while len(self._rows) > self.cache_rows:
+            self._rows.popitem(last=False)
+
+    def _readFileInfo(self, name: str) -> dict[str, Any]:
+        """
+        Read the file info of one file (safe to call from pool threads).
+
+        Names of files in subfolders (recursive scans) are relative paths;
+        their subfolder is set as the Folder column.
+        """
+        file_path = self.folder_path / name
+        folder = Path(name).parent.as_posix()
+        try:
+            file_info = get_file_info_header(
+                file_path,
+                search_terms=self.search_terms,
+                environment_pvs=self.environment_pvs,
+            )
+            if folder != ".":
+                file_info["Folder"] = folder
+            return file_info
+        except OSError as e:
+            # File vanished since the folder was listed
+            logger.error(f"Error reading {file_path}: {e}")
+            row = self._names.index(name)
+            file_info: dict[str, Any] = {
+                "Name": file_path.name,
+                "folderPath": str(file_path.parent),
+            }
+            values = ["", None, None, None, self._mtimes[row], self._sizes[row]]
+            for k, v in zip(HEADERS, values):
+                file_info[k] = v.item() if isinstance(v, np.generic) else v
+            file_info["Positioners"] = ""
+            file_info["Dimensions"] = []
+            return file_info
+
+    @staticmethod
+    def _listingValues(file_info: dict[str, Any]) -> tuple[float, int]:
+        """mtime and size of a file info dict (0 if unknown)."""
+        mtime, size = file_info.get("Date"), file_info.get("Size")
+        return (
+            float(mtime) if isinstance(mtime, (int, float)) else 0.0,
+            int(size) if isinstance(size, (int, float)) else 0,
+        )
@@ -82,6 +82,20 @@ class PreferencesDialog(QDialog):
         # Add spacing
         layout.addStretch()
 
+        # Recursive scan setting
+        self.scan_subfolders_checkbox = QCheckBox("Include subfolders in folder view")
+        layout.addWidget(self.scan_subfolders_checkbox)
+
+        subfolders_caption = QLabel(
+            "Lists the MDA files of all subfolders in one table, with a Folder column."
+        )
+        subfolders_caption.setWordWrap(True)
+        subfolders_caption.setStyleSheet("color: gray; font-size: 10px;")
+        layout.addWidget(subfolders_caption)
+
+        # Add spacing
+        layout.addStretch()
+
         # Buttons
         button_box = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
@@ -124,6 +138,14 @@ class PreferencesDialog(QDialog):
             show_pos = show_pos.lower() in ("true", "1", "yes", "on")
         self.show_positioners_checkbox.setChecked(bool(show_pos))
 
+        # Scan subfolders setting
+        subfolders = settings.getKey("scan_subfolders")
+        if subfolders is None:
+            subfolders = False
+        elif isinstance(subfolders, str):
+            subfolders = subfolders.lower() in ("true", "1", "yes", "on")
+        self.scan_subfolders_checkbox.setChecked(bool(subfolders))
+
     def get_settings(self):
         """Get the current settings from the dialog."""
         return {
@@ -131,4 +153,5 @@ class PreferencesDialog(QDialog):
             "plot_max_height": self.plot_spinbox.value(),
             "sort_newest_first": self.sort_newest_first_checkbox.isChecked(),
             "show_positioners_in_folder": self.show_positioners_checkbox.isChecked(),
+            "scan_subfolders": self.scan_subfolders_checkbox.isChecked(),
         }
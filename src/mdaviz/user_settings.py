@@ -58,6 +58,7 @@ class ApplicationQSettings(QSettings):
         ~_keySplit_
         ~keyExists
         ~getKey
+        ~getBoolKey
         ~setKey
         ~resetDefaults
         ~updateTimeStamp
@@ -128,6 +129,17 @@ class ApplicationQSettings(QSettings):
             key = f"{GLOBAL_GROUP}/{key}"
         return self.value(key)
 
+    def getBoolKey(self, key):
+        """
+        Return the value of key as a bool (False if not found).
+
+        Booleans are read back from the .ini file as strings ("true").
+        """
+        value = self.getKey(key)
+        if isinstance(value, str):
+            return value.lower() in ("true", "1", "yes", "on")
+        return bool(value)
+
     def setKey(self, key, value):
         """
         Set the value of a configuration key, creates the key if it does not exist.
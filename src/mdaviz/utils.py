@@ -7,6 +7,8 @@ data conversion, and general utility operations.
 .. autosummary::
 
     ~get_file_info
+    ~get_file_info_header
+    ~get_file_info_placeholder
     ~get_scan
     ~mda2ftm
     ~ftm2mda
@@ -17,6 +19,8 @@ data conversion, and general utility operations.
     ~iso2dt
     ~iso2ts
     ~myLoadUi
+    ~read_mda_environment
+    ~read_mda_header
     ~removeAllLayoutWidgets
     ~run_in_thread
     ~ts2dt
@@ -24,12 +28,14 @@ data conversion, and general utility operations.
 """
 
 import math
+import os
 import pathlib
 import re
 import threading
 from datetime import datetime
 from typing import Any
 from PyQt6 import uic
+from mdaviz.synApps_mdalib import f_xdrlib as xdr
 from mdaviz.synApps_mdalib.mda import scanPositioner, scanDetector, readMDA, skimMDA
 from mdaviz.logger import get_logger
 
@@ -39,6 +45,11 @@ logger = get_logger("utils")
 
 HEADERS = "Prefix", "Scan #", "Points", "Dim", "Date", "Size"
 
+# Bytes read for the MDA file header (enough for scans of up to 5 dimensions)
+MDA_FILE_HEADER_READ_SIZE = 100
+# Bytes read for a scan header after its lower scan pointers (names and descriptions)
+MDA_SCAN_HEADER_READ_SIZE = 65536
+
 
 def human_readable_size(size: float, decimal_places: int = 2) -> str:
     """Convert size in bytes to human readable format.
@@ -152,7 +163,9 @@ def byte2str(byte_literal):
     )
 
 
-def get_file_info_lightweight(file_path: pathlib.Path) -> dict:
+def get_file_info_lightweight(
+    file_path: pathlib.Path, file_stat: os.stat_result | None = None
+) -> dict:
     """
     Get lightweight file information without loading full MDA data.
 
@@ -161,20 +174,27 @@ def get_file_info_lightweight(file_path: pathlib.Path) -> dict:
 
     Parameters:
         file_path (Path): Path to the MDA file
+        file_stat (os.stat_result, optional): Stat result of the file, e.g. from
+            ``os.scandir``; the file is stat'ed (once) if not given
 
     Returns:
-        dict: Dictionary containing lightweight file information with keys:
+        dict: Dictionary containing lightweight file information with keys
+        (raw values; the folder table formats them for display):
 
         - Name: File name
-        - Prefix: File prefix (if extractable)
-        - Number: Scan number (if available)
-        - Points: Number of data points (if available)
-        - Dimension: Scan dimension (if available)
-        - Date: File date (if available)
-        - Size: Human readable file size
+        - Prefix: File prefix (empty if not extractable)
+        - Scan #: Scan number (int, None if not available)
+        - Points: Number of data points (int)
+        - Dim: Scan dimension (int)
+        - Date: File modification time (epoch seconds)
+        - Size: File size (bytes)
+        - Dimensions: Acquired points per dimension (if available)
     """
     file_name = file_path.name
-    file_size = human_readable_size(file_path.stat().st_size)
+    if file_stat is None:
+        file_stat = file_path.stat()
+    file_size = file_stat.st_size
+    file_date = file_stat.st_mtime
 
     # Try to get basic info from skimMDA first (fastest)
     try:
@@ -194,14 +214,11 @@ def get_file_info_lightweight(file_path: pathlib.Path) -> dict:
             if skim_data.get("rank", 0) > 0:
                 file_pts = skim_data.get("acquired_dimensions", [0])[0]
                 file_dim = skim_data.get("rank", 1)
+                file_dims = list(skim_data.get("acquired_dimensions", []))
             else:
                 file_pts = 0
                 file_dim = 1
-
-            # Try to get date from file modification time as fallback
-            file_date = datetime.fromtimestamp(file_path.stat().st_mtime).strftime(
-                "%Y-%m-%d %H:%M:%S"
-            )
+                file_dims = []
 
         else:
             # Fallback to basic file info only
@@ -209,9 +226,7 @@ def get_file_info_lightweight(file_path: pathlib.Path) -> dict:
             file_prefix = None
             file_pts = 0
             file_dim = 1
-            file_date = datetime.fromtimestamp(file_path.stat().st_mtime).strftime(
-                "%Y-%m-%d %H:%M:%S"
-            )
+            file_dims = []
 
     except Exception as e:
         # If skimMDA fails, provide minimal info
@@ -220,9 +235,7 @@ def get_file_info_lightweight(file_path: pathlib.Path) -> dict:
         file_prefix = None
         file_pts = 0
         file_dim = 1
-        file_date = datetime.fromtimestamp(file_path.stat().st_mtime).strftime(
-            "%Y-%m-%d %H:%M:%S"
-        )
+        file_dims = []
 
     fileInfo: dict[str, Any] = {
         "Name": file_name,
@@ -230,19 +243,50 @@ def get_file_info_lightweight(file_path: pathlib.Path) -> dict:
     }
     values = [
         str(file_prefix) if file_prefix is not None else "",
-        str(file_num) if file_num is not None else "",
-        str(file_pts) if file_pts is not None else "",
-        str(file_dim) if file_dim is not None else "",
-        str(file_date) if file_date is not None else "",
-        str(file_size) if file_size is not None else "",
+        file_num,
+        file_pts,
+        file_dim,
+        file_date,
+        file_size,
     ]
     for k, v in zip(HEADERS, values):
         fileInfo[k] = v
     fileInfo["Positioners"] = ""
+    fileInfo["Dimensions"] = file_dims
+    return fileInfo
+
+
+def get_file_info_placeholder(
+    file_path: pathlib.Path, file_stat: os.stat_result
+) -> dict:
+    """
+    Get the folder table row of a file whose header has not been read yet.
+
+    Only the columns known from the folder listing (Date and Size) are filled;
+    the others are None.
+
+    Parameters:
+        file_path (Path): Path to the MDA file
+        file_stat (os.stat_result): Stat result of the file
+
+    Returns:
+        dict: File information with the keys of :func:`get_file_info_lightweight`
+    """
+    fileInfo: dict[str, Any] = {
+        "Name": file_path.name,
+        "folderPath": str(file_path.parent),
+    }
+    values = ["", None, None, None, file_stat.st_mtime, file_stat.st_size]
+    for k, v in zip(HEADERS, values):
+        fileInfo[k] = v
+    fileInfo["Positioners"] = ""
+    fileInfo["Dimensions"] = []
     return fileInfo
 
 
-def get_file_info_full(file_path: pathlib.Path) -> dict:
+def get_file_info_full(
+    file_path: pathlib.Path, file_stat: os.stat_result | None = None
+) -> dict:
     """
     Get complete file information by loading the full MDA data.
 
@@ -251,50 +295,44 @@ def get_file_info_full(file_path: pathlib.Path) -> dict:
 
     Parameters:
         file_path (Path): Path to the MDA file
+        file_stat (os.stat_result, optional): Stat result of the file, e.g. from
+            ``os.scandir``; the file is stat'ed (once) if not given
 
     Returns:
         dict: Complete file information including all metadata and data
     """
     file_name = file_path.name
+    if file_stat is None:
+        file_stat = file_path.stat()
+    file_size = file_stat.st_size
+    file_date = file_stat.st_mtime
 
     # Check if readMDA returns None
     result = readMDA(str(file_path))
     if result is None:
         # Return minimal info if file cannot be read
         minimal_file_info = {"Name": file_name, "folderPath": str(file_path.parent)}
-        values = [
-            "",
-            "",
-            "0",
-            "1",
-            datetime.fromtimestamp(file_path.stat().st_mtime).strftime(
-                "%Y-%m-%d %H:%M:%S"
-            ),
-            human_readable_size(file_path.stat().st_size),
-        ]
+        values = ["", None, 0, 1, file_date, file_size]
         for k, v in zip(HEADERS, values):
             minimal_file_info[k] = v
         minimal_file_info["Positioners"] = ""
+        minimal_file_info["Dimensions"] = []
         return minimal_file_info
 
     file_metadata, file_data_dim1, *_ = result
     file_num = file_metadata.get("scan_number", None)
     file_prefix = extract_file_prefix(file_name, file_num)
-    file_size = human_readable_size(file_path.stat().st_size)
-    file_date = datetime.fromtimestamp(file_path.stat().st_mtime).strftime(
-        "%Y-%m-%d %H:%M:%S"
-    )
     file_pts = file_data_dim1.curr_pt
     file_dim = file_metadata.get("rank", 1)
 
     fileInfo: dict[str, Any] = {"Name": file_name, "folderPath": str(file_path.parent)}
     values = [
         str(file_prefix) if file_prefix is not None else "",
-        str(file_num) if file_num is not None else "",
-        str(file_pts) if file_pts is not None else "",
-        str(file_dim) if file_dim is not None else "",
-        str(file_date) if file_date is not None else "",
-        str(file_size) if file_size is not None else "",
+        file_num,
+        file_pts,
+        file_dim,
+        file_date,
+        file_size,
     ]
     for k, v in zip(HEADERS, values):
         fileInfo[k] = v
@@ -306,6 +344,254 @@ def get_file_info_full(file_path: pathlib.Path) -> dict:
         if label:
             positioners.append(label)
     fileInfo["Positioners"] = ", ".join(positioners)
+    fileInfo["Dimensions"] = list(file_metadata.get("acquired_dimensions", []))
+    return fileInfo
+
+
+def _unpack_mda_string(unpacker: xdr.Unpacker) -> str:
+    """Unpack an optional MDA header string (a length, then the XDR string if non-zero)."""
+    if unpacker.unpack_int():
+        return byte2str(unpacker.unpack_string()).strip()
+    return ""
+
+
+def read_mda_header(file_path: pathlib.Path) -> dict | None:
+    """
+    Read the file header and the outer scan header of an MDA file.
+
+    Only the headers are decoded: the data blocks, the lower-dimension scans
+    (except for their first three integers, to get the acquired dimensions)
+    and the environment block are never read.
+
+    Parameters:
+        file_path (Path): Path to the MDA file
+
+    Returns:
+        dict or None: None if the file is not a readable MDA file, otherwise:
+
+        - scan_number: Scan number
+        - rank: Scan rank
+        - dimensions: Requested points per dimension
+        - acquired_dimensions: Acquired points per dimension (``curr_pt`` of
+          the outer scan and of the first scan of each inner dimension)
+        - positioners: List of (name, desc) of the outer scan positioners
+        - detectors: List of (name, desc) of the outer scan detectors
+        - environment_offset: File offset of the environment block (0 if none),
+          see :func:`read_mda_environment`
+    """
+    with open(file_path, "rb") as scan_file:
+        unpacker = xdr.Unpacker(scan_file.read(MDA_FILE_HEADER_READ_SIZE))
+        version = unpacker.unpack_float()
+        if abs(version - 1.3) > 0.01 and abs(version - 1.4) > 0.01:
+            return None
+        scan_number = unpacker.unpack_int()
+        rank = unpacker.unpack_int()
+        if not 0 < rank <= 20:
+            return None
+        dimensions = unpacker.unpack_array(unpacker.unpack_int, rank)
+        unpacker.unpack_int()  # isRegular
+        environment_offset = unpacker.unpack_int()  # pExtra
+        main_scan = unpacker.get_position()
+
+        # Outer scan: rank, npts, curr_pt, [lower scan pointers], then names
+        scan_file.seek(main_scan)
+        unpacker.reset(scan_file.read(12))
+        scan_rank, npts, curr_pt = (unpacker.unpack_int() for _ in range(3))
+        pointer_bytes = 4 * npts if scan_rank > 1 else 0
+        unpacker.reset(scan_file.read(pointer_bytes + MDA_SCAN_HEADER_READ_SIZE))
+        lower_scan = unpacker.unpack_int() if pointer_bytes and curr_pt else 0
+        unpacker.set_position(pointer_bytes)
+        unpacker.unpack_int()
+        unpacker.unpack_string()  # scan name
+        unpacker.unpack_int()
+        unpacker.unpack_string()  # scan time
+        n_positioners = unpacker.unpack_int()
+        n_detectors = unpacker.unpack_int()
+        unpacker.unpack_int()  # number of triggers
+
+        positioners = []
+        for _ in range(n_positioners):
+            unpacker.unpack_int()  # positioner number
+            name = _unpack_mda_string(unpacker)
+            desc = _unpack_mda_string(unpacker)
+            for _field in range(5):  # step mode, unit, readback name/desc/unit
+                _unpack_mda_string(unpacker)
+            positioners.append((name, desc))
+        detectors = []
+        for _ in range(n_detectors):
+            unpacker.unpack_int()  # detector number
+            name = _unpack_mda_string(unpacker)
+            desc = _unpack_mda_string(unpacker)
+            _unpack_mda_string(unpacker)  # unit
+            detectors.append((name, desc))
+
+        # Inner dimensions: follow the pointer to the first scan of each one
+        acquired_dimensions = [curr_pt]
+        while lower_scan and len(acquired_dimensions) < rank:
+            scan_file.seek(lower_scan)
+            unpacker.reset(scan_file.read(16))
+            scan_rank, npts, curr_pt = (unpacker.unpack_int() for _ in range(3))
+            acquired_dimensions.append(curr_pt)
+            lower_scan = unpacker.unpack_int() if scan_rank > 1 and curr_pt else 0
+
+    return {
+        "scan_number": scan_number,
+        "rank": rank,
+        "dimensions": dimensions,
+        "acquired_dimensions": acquired_dimensions,
+        "positioners": positioners,
+        "detectors": detectors,
+        "environment_offset": environment_offset,
+    }
+
+
+# Bytes per array element of the environment PV types (DBR_CTRL_CHAR, _SHORT,
+# _FLOAT, _LONG, _DOUBLE); XDR stores chars and shorts as 4-byte integers
+MDA_ENVIRONMENT_ITEM_SIZES = {32: 4, 29: 4, 30: 4, 33: 4, 34: 8}
+
+
+def read_mda_environment(
+    file_path: pathlib.Path, pv_names, environment_offset: int | None = None
+) -> dict[str, str]:
+    """
+    Read the values of selected PVs from the environment block of an MDA file.
+
+    The environment block (``pExtra``) is decoded lazily: names are read
+    for every PV, but the values of PVs that are not selected are skipped,
+    and decoding stops once all selected PVs are found.
+
+    Parameters:
+        file_path (Path): Path to the MDA file
+        pv_names (iterable of str): PV names to read
+        environment_offset (int, optional): Offset of the environment block,
+            as returned by :func:`read_mda_header` (read from the file if not given)
+
+    Returns:
+        dict: PV name -> value as text (arrays as space-separated values),
+        for the selected PVs found in the file
+    """
+    wanted = set(pv_names)
+    if not wanted:
+        return {}
+    if environment_offset is None:
+        header = read_mda_header(file_path)
+        environment_offset = header["environment_offset"] if header else 0
+    if not environment_offset:
+        return {}
+
+    values: dict[str, str] = {}
+    with open(file_path, "rb") as scan_file:
+        scan_file.seek(environment_offset)
+        unpacker = xdr.Unpacker(scan_file.read())
+    for _ in range(unpacker.unpack_int()):
+        name = _unpack_mda_string(unpacker)
+        _unpack_mda_string(unpacker)  # description
+        epics_type = unpacker.unpack_int()
+        if epics_type == 0:  # DBR_STRING
+            value = _unpack_mda_string(unpacker)
+            if name in wanted:
+                values[name] = value
+        else:
+            count = unpacker.unpack_int()
+            _unpack_mda_string(unpacker)  # unit
+            item_size = MDA_ENVIRONMENT_ITEM_SIZES.get(epics_type)
+            if item_size is None:
+                break  # unknown type: the rest of the block cannot be decoded
+            if name not in wanted:
+                unpacker.set_position(unpacker.get_position() + count * item_size)
+                continue
+            if epics_type == 32:  # null-terminated char array
+                chars = unpacker.unpack_array(unpacker.unpack_int, count)
+                value = bytes(c & 0xFF for c in chars).split(b"\0")[0]
+                values[name] = byte2str(value).strip()
+            else:
+                unpack = {30: unpacker.unpack_float, 34: unpacker.unpack_double}
+                items = unpacker.unpack_array(
+                    unpack.get(epics_type, unpacker.unpack_int), count
+                )
+                values[name] = " ".join(f"{item:g}" for item in items)
+        if len(values) == len(wanted):
+            break
+    return values
+
+
+def get_file_info_header(
+    file_path: pathlib.Path,
+    file_stat: os.stat_result | None = None,
+    search_terms: bool = False,
+    environment_pvs=(),
+) -> dict:
+    """
+    Get the folder table information, including positioner names, from the
+    MDA headers only.
+
+    Returns the same information as :func:`get_file_info_full` (with the
+    Positioners column) at about the cost of :func:`get_file_info_lightweight`,
+    since no data block is decoded (see :func:`read_mda_header`).
+
+    Parameters:
+        file_path (Path): Path to the MDA file
+        file_stat (os.stat_result, optional): Stat result of the file, e.g. from
+            ``os.scandir``; the file is stat'ed (once) if not given
+        search_terms (bool): Also return the metadata search terms of the file
+            (``Terms`` key, see :func:`~mdaviz.folder_search.metadata_terms`)
+        environment_pvs (iterable of str): Environment PVs whose values are
+            search terms (read with :func:`read_mda_environment`)
+
+    Returns:
+        dict: File information with the keys of :func:`get_file_info_full`
+        (and ``Terms`` if search_terms)
+    """
+    file_name = file_path.name
+    if file_stat is None:
+        file_stat = file_path.stat()
+    file_size = file_stat.st_size
+    file_date = file_stat.st_mtime
+
+    try:
+        header = read_mda_header(file_path)
+    except Exception as e:
+        logger.error(f"Error reading header of {file_path}: {e}")
+        header = None
+
+    fileInfo: dict[str, Any] = {"Name": file_name, "folderPath": str(file_path.parent)}
+    if header is None:
+        # Same minimal info as get_file_info_full for unreadable files
+        values = ["", None, 0, 1, file_date, file_size]
+        for k, v in zip(HEADERS, values):
+            fileInfo[k] = v
+        fileInfo["Positioners"] = ""
+        fileInfo["Dimensions"] = []
+        if search_terms:
+            fileInfo["Terms"] = []
+        return fileInfo
+
+    file_num = header["scan_number"]
+    file_prefix = extract_file_prefix(file_name, file_num)
+    values = [
+        str(file_prefix) if file_prefix is not None else "",
+        file_num,
+        header["acquired_dimensions"][0],
+        header["rank"],
+        file_date,
+        file_size,
+    ]
+    for k, v in zip(HEADERS, values):
+        fileInfo[k] = v
+    labels = [desc if desc else name for name, desc in header["positioners"]]
+    fileInfo["Positioners"] = ", ".join(label for label in labels if label)
+    fileInfo["Dimensions"] = header["acquired_dimensions"]
+    if search_terms:
+        from mdaviz.folder_search import metadata_terms
+
+        environment = {}
+        try:
+            environment = read_mda_environment(
+                file_path, environment_pvs, header["environment_offset"]
+            )
+        except Exception as e:
+            logger.error(f"Error reading environment of {file_path}: {e}")
+        fileInfo["Terms"] = metadata_terms(header, environment)
     return fileInfo
 
 
@@ -390,7 +676,7 @@ def get_det(mda_file_data):
     p0.readback_name = ""  # name of EPICS PV this positioner read from, if any
     p0.readback_desc = ""  # description of 'readback_name' PV
     p0.readback_unit = ""  # units of 'readback_name' PV
-    p0.data = list(range(npts))  # list of values written to 'Index' PV.
+    p0.data = range(npts)  # values written to 'Index' PV (computed on demand)
 
     # Make the Index scanPositioner the positioner 0 and build d:
     d[0] = p0
@@ -453,7 +739,7 @@ def get_scan(mda_file_data):
     return datasets, first_pos_index, first_det_index
 
 
-def get_scan_2d(mda_file_data_dim1, mda_file_data_dim2):
+def get_scan_2d(mda_file_data_dim1, mda_file_data_dim2, inner_datasets=None):
     """
     Extracts scan positioners and detectors from 2D MDA file data objects and prepares datasets.
 
@@ -463,9 +749,15 @@ def get_scan_2d(mda_file_data_dim1, mda_file_data_dim2):
         - ``dim1`` (outer): X2 positioner + detectors
         - ``dim2`` (inner): X1 positioner + detectors
 
+    Index positioners (``P0`` and default ``X1``/``X2``) hold ``range`` objects, so
+    their values are computed on demand instead of being stored.
+
     Parameters:
         - mda_file_data_dim1: An instance of an ``mda.scanDim`` object for the outer dimension
         - mda_file_data_dim2: An instance of an ``mda.scanDim`` object for the inner dimension
+        - inner_datasets: Optional result of ``get_scan(mda_file_data_dim2)``. Detector
+          entries with the same data are shared with it instead of being rebuilt, so
+          both dictionaries are views of the same detector store.
 
     Returns:
         A tuple containing:
@@ -501,7 +793,7 @@ def get_scan_2d(mda_file_data_dim1, mda_file_data_dim2):
         x2_pos.fieldName, x2_pos.name, x2_pos.desc = "X2", "X2", "X2 Position"
         x2_pos.step_mode, x2_pos.unit = "", ""
         x2_pos.readback_name, x2_pos.readback_desc, x2_pos.readback_unit = "", "", ""
-        x2_pos.data = list(range(npts_dim1))
+        x2_pos.data = range(npts_dim1)
     d[0] = x2_pos
     first_pos_index = 0
 
@@ -515,7 +807,7 @@ def get_scan_2d(mda_file_data_dim1, mda_file_data_dim2):
         x1_pos.fieldName, x1_pos.name, x1_pos.desc = "X1", "X1", "X1 Position"
         x1_pos.step_mode, x1_pos.unit = "", ""
         x1_pos.readback_name, x1_pos.readback_desc, x1_pos.readback_unit = "", "", ""
-        x1_pos.data = list(range(npts_dim2))
+        x1_pos.data = range(npts_dim2)
     d[1] = x1_pos
 
     # Add detectors from inner dimension (these are the Y values)
@@ -534,11 +826,23 @@ def get_scan_2d(mda_file_data_dim1, mda_file_data_dim2):
     p0.readback_name, p0.readback_desc, p0.readback_unit = "", "", ""
     # For 2D data, use the total number of points (X2 * X1)
     total_points = npts_dim1 * npts_dim2
-    p0.data = list(range(total_points))
+    p0.data = range(total_points)
     d[detector_index] = p0
 
+    # Detector entries of the inner-dimension datasets, by detector object
+    shared = {
+        id(entry["object"]): entry
+        for entry in (inner_datasets or {}).values()
+        if entry["type"] == "DET"
+    }
+
     datasets = {}
     for k, v in d.items():
+        entry = shared.get(id(v))
+        if entry is not None and entry["data"] is v.data:
+            datasets[k] = entry
+            continue
+
         data = v.data or []
 
         datasets[k] = {
@@ -7,7 +7,7 @@ Covers utility functions and widget instantiation.
 
 from typing import TYPE_CHECKING
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from mdaviz.chartview import auto_color, auto_symbol, ChartView
 from mdaviz.curve_manager import CurveManager
@@ -112,6 +112,27 @@ def test_curve_manager_add_update_remove(qtbot):
     assert len(manager.curves()) == 0
 
 
+def test_curve_manager_pins_cached_file():
+    """Plotted curves pin their file in the data cache until removed."""
+    from mdaviz.data_cache import get_global_cache
+
+    cache = get_global_cache()
+    manager = CurveManager()
+    file_path = "/tmp/pinned.mda"
+    plot_options = {"filePath": file_path, "fileName": "pinned"}
+    x = np.array([1, 2, 3])
+    y = np.array([4, 5, 6])
+
+    manager.addCurve(0, x, y, plot_options=plot_options, ds_options={"label": "a"})
+    manager.addCurve(1, x, y, plot_options=plot_options, ds_options={"label": "b"})
+    assert cache.is_pinned(file_path)
+
+    manager.removeCurve(manager.generateCurveID("a", file_path, 0))
+    assert cache.is_pinned(file_path)
+    manager.removeAllCurves()
+    assert not cache.is_pinned(file_path)
+
+
 def test_curve_manager_y_data_change_detection():
     """Test that Y data changes are detected and trigger recompute_y (e.g. normalization/unscaling)."""
     manager = CurveManager()
@@ -146,6 +167,78 @@ def test_curve_manager_y_data_change_detection():
     np.testing.assert_array_equal(manager.getCurveData(curve_id)["ds"][1], y2)
 
 
+def test_curve_manager_reference_range():
+    """The reference range of unscaled curves is cached per curve."""
+    manager = CurveManager()
+    x = np.arange(10.0)
+    for row in range(50):
+        options = {
+            "plot_options": {"filePath": "/tmp/scan.mda", "fileName": "scan"},
+            "ds_options": {"label": f"det{row}"},
+        }
+        manager.addCurve(row, x, x + row, **options)
+    ids = list(manager.curves())
+    for curve_id in ids[:2]:
+        manager.updateCurveUnscale(curve_id, True)
+
+    with patch.object(
+        manager,
+        "getTransformedCurveXYData",
+        wraps=manager.getTransformedCurveXYData,
+    ) as transform:
+        for curve_id in ids[:2]:
+            _, y = manager.getTransformedCurveXYData(curve_id)
+            assert (y.min(), y.max()) == (2, 58)
+        assert transform.call_count == 2 + 48  # each reference curve once
+
+        transform.reset_mock()
+        manager.updateCurveOffsetFactor(ids[-1], offset=100)
+        assert manager.referenceRange() == (2, 158)
+        assert transform.call_count == 1  # only the changed curve
+        assert manager.referenceRange(exclude=ids[-1]) == (2, 57)
+
+    options = {
+        "plot_options": {"filePath": "/tmp/scan.mda", "fileName": "scan"},
+        "ds_options": {"label": "det2"},
+    }
+    y = np.append(x + 2, [-5.0, 3.0])
+    assert manager.extendCurve(2, np.arange(12.0), y, **options)
+    assert manager.referenceRange() == (-5, 158)
+    manager.removeCurve(ids[-1])
+    assert manager.referenceRange() == (-5, 57)
+
+
+def test_curve_manager_extend_curve():
+    """Points appended to a curve are copied alone, other changes are refused."""
+    manager = CurveManager()
+    extended = []
+    manager.curveExtended.connect(lambda cid, first: extended.append((cid, first)))
+    options = {
+        "plot_options": {"filePath": "/tmp/live.mda", "fileName": "live"},
+        "ds_options": {"label": "det"},
+    }
+    x, y = np.arange(100.0), np.arange(100.0) ** 2
+    assert not manager.extendCurve(0, x[:10], y[:10], **options)  # not plotted
+    manager.addCurve(0, list(x[:10]), list(y[:10]), **options)
+    curve_id = manager.generateCurveID("det", "/tmp/live.mda", 0)
+
+    for n in (10, 40, 100):
+        assert manager.extendCurve(0, list(x[:n]), list(y[:n]), **options)
+    assert extended == [(curve_id, 10), (curve_id, 40)]
+    ds = manager.getCurveData(curve_id)["ds"]
+    np.testing.assert_array_equal(ds[0], x)
+    np.testing.assert_array_equal(ds[1], y)
+    np.testing.assert_array_equal(manager.getCurveData(curve_id)["original_y"], y)
+
+    assert not manager.extendCurve(0, x[:50], y[:50], **options)  # shorter
+    assert not manager.extendCurve(0, x + 1, y, **options)  # new scan
+    restarted = np.append(-1.0, x[1:])  # same last old point, other first one
+    assert not manager.extendCurve(
+        0, np.append(restarted, 100.0), np.append(y, 0.0), **options
+    )
+    assert len(extended) == 2
+
+
 def test_curve_manager_no_update_when_data_unchanged():
     """Test that addCurve does not update when x, y, and label are identical."""
     manager = CurveManager()
@@ -589,6 +682,37 @@ def test_curve_manager_get_transformed_curve_xy_data():
     curve_data["original_y"] = original_y_backup
 
 
+def test_curve_manager_transformed_data_cached():
+    """Transformed data are computed again only when their inputs change."""
+    manager = CurveManager()
+    x = np.arange(5.0)
+    for row in range(3):
+        options = {
+            "plot_options": {"filePath": "/tmp/scan.mda", "fileName": "scan"},
+            "ds_options": {"label": f"det{row}"},
+        }
+        manager.addCurve(row, x, x * (row + 1), **options)
+    ref, unscaled, other = manager.curves()
+    manager.updateCurveUnscale(unscaled, True)
+    manager.updateCurveUnscale(other, True)
+
+    x_out, y_out = manager.getTransformedCurveXYData(ref)
+    assert manager.getTransformedCurveXYData(ref)[1] is y_out
+    assert not x_out.flags.writeable and not y_out.flags.writeable
+    with pytest.raises(ValueError):
+        y_out[0] = 1.0
+
+    y_unscaled = manager.getTransformedCurveXYData(unscaled)[1]
+    manager.updateCurveOffset(other, 5.0)  # not a reference curve
+    assert manager.getTransformedCurveXYData(unscaled)[1] is y_unscaled
+
+    manager.updateCurveFactor(ref, 2.0)  # new reference range
+    assert manager.getTransformedCurveXYData(ref)[1] is not y_out
+    np.testing.assert_array_equal(manager.getTransformedCurveXYData(ref)[1], 2 * x)
+    y_new = manager.getTransformedCurveXYData(unscaled)[1]
+    assert y_new is not y_unscaled and y_new.max() == 8
+
+
 def test_curve_manager_update_derivative():
     """Test updateCurveDerivative method."""
     manager = CurveManager()
@@ -1369,3 +1493,173 @@ def test_onDetRemoved_removes_curve(qtbot: "QtBot") -> None:
     widget.onDetRemoved(file_path, row)
 
     widget.curveManager.removeCurve.assert_called_once_with("curve_id")
+
+
+def test_chartview_extend_plot(qtbot):
+    """A growing curve is extended in place and the axes limits follow it."""
+    parent = MagicMock()
+    parent.mda_file_viz.curveBox = QComboBox()
+    import mdaviz.user_settings
+
+    mdaviz.user_settings.settings.getKey = lambda key: 800
+    widget = ChartView(parent)
+    qtbot.addWidget(widget)
+    options = {
+        "plot_options": {"filePath": "/tmp/live.mda", "fileName": "live"},
+        "ds_options": {"label": "det"},
+    }
+    x, y = np.arange(1000.0), np.sin(np.arange(1000.0) / 100) * np.arange(1000.0)
+    widget.plot(0, x[:100], y[:100], **options)
+    curve_id = widget.curveManager.generateCurveID("det", "/tmp/live.mda", 0)
+    line = widget.plotObjects[curve_id]
+    widget.curveManager.updateCurveOffsetFactor(curve_id, offset=1, factor=2)
+
+    for n in (500, 1000):
+        assert widget.extendPlot(0, x[:n], y[:n], **options)
+        np.testing.assert_array_equal(line.get_xdata(), x[:n])
+        np.testing.assert_allclose(line.get_ydata(), 1 + 2 * y[:n])
+        assert widget.main_axes.get_xlim()[1] >= n - 1
+        assert widget.main_axes.get_ylim()[0] <= 1 + 2 * y[:n].min()
+    assert widget.plotObjects[curve_id] is line
+
+    # Statistics of the growing curve are kept up to date, not recomputed
+    stats = widget._liveStatistics(curve_id)
+    expected = widget.calculateBasicMath(x, 1 + 2 * y)
+    assert stats[:2] == expected[:2]
+    np.testing.assert_allclose(stats[2:], expected[2:])
+    widget.curveManager.updateCurveOffsetFactor(curve_id, offset=0, factor=1)
+    assert widget._liveStatistics(curve_id) is None
+
+
+def test_chartview_batch_update(qtbot):
+    """Curves added in a batch update the plot and the legend once."""
+    parent = MagicMock()
+    parent.mda_file_viz.curveBox = QComboBox()
+    import mdaviz.user_settings
+
+    mdaviz.user_settings.settings.getKey = lambda key: 800
+    widget = ChartView(parent)
+    qtbot.addWidget(widget)
+    widget.canvas.draw = MagicMock()
+    widget.canvas.draw_idle = MagicMock()
+    widget.updateLegend = MagicMock()
+    x = np.arange(10.0)
+
+    with widget.batchUpdate():
+        for row in range(20):
+            options = {
+                "plot_options": {"filePath": "/tmp/scan.mda", "fileName": "scan"},
+                "ds_options": {"label": f"det{row}"},
+            }
+            widget.plot(row, x, x * row, **options)
+        with widget.batchUpdate():  # nested: no update on exit
+            widget.refreshAllUnscaledCurves()
+        assert widget.updateLegend.call_count == 0
+        assert len(widget.plotObjects) == 20
+
+    assert widget.updateLegend.call_count == 1
+    assert widget.canvas.draw_idle.call_count == 1
+    assert widget.canvas.draw.call_count == 0
+    assert widget.curveBox.currentIndex() == 19
+    assert widget.main_axes.get_ylim()[1] >= 9 * 19
+    assert widget._batch is None
+
+
+def test_chartview_large_curve_decimated(qtbot):
+    """Large curves are drawn decimated to the view, with the full data limits."""
+    parent = MagicMock()
+    parent.mda_file_viz.curveBox = QComboBox()
+    import mdaviz.user_settings
+
+    mdaviz.user_settings.settings.getKey = lambda key: 800
+    widget = ChartView(parent)
+    qtbot.addWidget(widget)
+    x = np.linspace(0, 1000, 200_001)
+    y = np.sin(x)
+    y[123_457] = 10.0  # narrow peak
+    options = {
+        "plot_options": {"filePath": "/tmp/fly.mda", "fileName": "fly"},
+        "ds_options": {"label": "det"},
+    }
+    widget.plot(0, x, y, **options)
+    curve_id = widget.curveManager.generateCurveID("det", "/tmp/fly.mda", 0)
+    line = widget.plotObjects[curve_id]
+    width = widget.main_axes.bbox.width
+    assert len(line.get_xdata()) <= 2 * width + 6
+    assert line.get_ydata().max() == 10.0
+    assert widget.main_axes.get_xlim()[1] >= 1000
+
+    widget.main_axes.set_xlim(600, 610)  # zoom: decimated again
+    visible = (line.get_xdata() >= 600) & (line.get_xdata() <= 610)
+    assert visible.sum() > 1000 and len(line.get_xdata()) < 2 * width + 6
+    widget.main_axes.relim()
+    assert widget.main_axes.dataLim.x1 == 1000 and widget.main_axes.dataLim.y1 == 10
+
+    widget.curveManager.removeCurve(curve_id)
+    assert widget._lodCurves == {}
+
+
+def test_chartview_large_curve_extended(qtbot):
+    """A large curve being acquired is decimated again from its new points
+    only: its DecimatedCurve is kept and extended."""
+    parent = MagicMock()
+    parent.mda_file_viz.curveBox = QComboBox()
+    import mdaviz.user_settings
+
+    mdaviz.user_settings.settings.getKey = lambda key: 800
+    widget = ChartView(parent)
+    qtbot.addWidget(widget)
+    x = np.linspace(0, 1000, 100_001)
+    y = np.sin(x)
+    y[90_000] = 10.0  # narrow peak, acquired last
+    options = {
+        "plot_options": {"filePath": "/tmp/fly.mda", "fileName": "fly"},
+        "ds_options": {"label": "det"},
+    }
+    widget.plot(0, x[:60_000], y[:60_000], **options)
+    curve_id = widget.curveManager.generateCurveID("det", "/tmp/fly.mda", 0)
+    curve = widget._lodCurves[curve_id]
+
+    with patch("mdaviz.curve_decimation.numpy.isfinite", wraps=np.isfinite) as isfinite:
+        assert widget.extendPlot(0, x, y, **options)
+    assert widget._lodCurves[curve_id] is curve and len(curve) == 100_001
+    # Only the 40_001 new points are checked (X and Y)
+    assert max(np.size(call.args[0]) for call in isfinite.call_args_list) <= 80_002
+    line = widget.plotObjects[curve_id]
+    assert line.get_ydata().max() == 10.0
+    assert len(line.get_xdata()) <= 2 * widget.main_axes.bbox.width + 6
+
+
+def test_chartview2d_live_heatmap(qtbot, mock_chartview_parent):
+    """Rows of a 2D scan in progress are written into the same image."""
+    from mdaviz.chartview import ChartView2D
+
+    widget = ChartView2D(mock_chartview_parent)
+    qtbot.addWidget(widget)
+    x, x2 = np.linspace(0, 1, 20), np.linspace(5, 3, 10)  # descending X2
+    data = np.arange(200.0).reshape(10, 20)
+    options = {"title": "live", "x2_points": 10}
+
+    widget.plot2D(data[:1], x, x2[:1], options)  # X2 step not known yet
+    np.testing.assert_allclose(
+        widget._live_heatmap["image"].get_extent(), [0, 1, 5, 14]
+    )
+    assert widget._live_heatmap["image"].get_array().mask[1:].all()
+
+    widget.plot2D(data[:3], x, x2[:3], options)
+    image, colorbar = widget._live_heatmap["image"], widget._current_colorbar
+    assert image.get_array().shape == (10, 20)
+    assert image.get_array().mask[:7].all()  # rows not acquired yet
+    np.testing.assert_allclose(image.get_extent(), [0, 1, 3, 5])
+
+    for n_rows in (6, 10):
+        widget.plot2D(data[:n_rows], x, x2[:n_rows], options)
+        assert widget._live_heatmap["image"] is image
+        assert widget._current_colorbar is colorbar
+        np.testing.assert_array_equal(
+            image.get_array()[10 - n_rows :], data[:n_rows][::-1]
+        )
+        assert image.get_clim() == (0.0, data[:n_rows].max())
+
+    widget.plot2D(data[:4], x, x2[:4], options)  # new scan: plotted again
+    assert widget._live_heatmap["image"] is not image
@@ -0,0 +1,69 @@
+"""Tests for mdaviz.curve_decimation."""
+
+import numpy as np
+
+from mdaviz.curve_decimation import DecimatedCurve, decimation_indices
+
+
+def test_min_max_per_bin_keeps_peaks():
+    """Each bin keeps its lowest and highest points; limits are kept too."""
+    x = np.linspace(0, 100, 100_001)
+    y = np.sin(x)
+    y[12_345], y[67_890] = 50.0, -50.0  # narrow peaks
+    indices = decimation_indices(x, y, (0, 100), 200)
+    assert len(indices) <= 2 * 200 + 6
+    assert {0, 12_345, 67_890, 100_000} <= set(indices)
+    assert (np.diff(indices) > 0).all()
+    bins = np.minimum((x / 0.5).astype(int), 199)
+    for b in (0, 57, 199):
+        in_bin = bins == b
+        assert y[indices][bins[indices] == b].max() == y[in_bin].max()
+        assert y[indices][bins[indices] == b].min() == y[in_bin].min()
+
+
+def test_zoomed_view_keeps_edges_and_limits():
+    """Out of the view, only the edge neighbors and the data limits are kept."""
+    x, y = np.arange(1000.0), np.arange(1000.0) % 7
+    indices = decimation_indices(x, y, (500.5, 509.5), 100)
+    assert list(indices) == [0, 6, *range(500, 511), 999]  # 0, 6: min, max
+
+
+def test_decimated_curve():
+    """Views are cached; curves that cannot be decimated are drawn in full."""
+    x = np.arange(10_000.0)[::-1]  # decreasing X
+    curve = DecimatedCurve(x, np.cos(x))
+    assert curve.decimated and len(curve) == 10_000
+    x_view, y_view = curve.view((0, 10_000), 50)
+    assert len(x_view) <= 106 and (np.diff(x_view) > 0).all()
+    assert curve.view((0, 10_000), 50)[0] is x_view
+    assert curve.view((0, 10_000), 60)[0] is not x_view
+
+    for x_data, y_data in (
+        ([0.0, 2.0, 1.0], [1.0, 2.0, 3.0]),  # not monotonic
+        ([0.0, 1.0, 2.0], [1.0, np.nan, 3.0]),  # not finite
+    ):
+        curve = DecimatedCurve(x_data, y_data)
+        assert not curve.decimated
+        assert curve.view((0, 2), 1)[0] is curve.x
+
+
+def test_decimated_curve_extend():
+    """Extending a curve gives the views of the whole grown curve."""
+    for x in (np.arange(5000.0), np.arange(5000.0)[::-1]):
+        y = np.sin(x / 10)
+        y[4321] = 5.0  # highest point, among the new ones
+        curve = DecimatedCurve(x[:10], y[:10])
+        for n_old, n_new in ((10, 3000), (3000, 3000), (3000, 5000)):
+            curve.extend(x[:n_new], y[:n_new], n_old)
+            grown = DecimatedCurve(x[:n_new], y[:n_new])
+            assert curve.decimated and len(curve) == n_new
+            for view in (((0, 5000), 40), ((1000, 1010), 40)):
+                for actual, expected in zip(curve.view(*view), grown.view(*view)):
+                    np.testing.assert_array_equal(actual, expected)
+
+    x = np.arange(100.0)
+    curve = DecimatedCurve(x[:50], x[:50])
+    curve.extend(np.append(x[:50], [10.0]), x[:51], 50)  # X goes back
+    assert not curve.decimated
+    curve.extend(x, x, 51)  # old points not decimable: stays so
+    assert not curve.decimated
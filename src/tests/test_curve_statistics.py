@@ -0,0 +1,40 @@
+"""Tests for mdaviz.curve_statistics."""
+
+import numpy as np
+
+from mdaviz.curve_statistics import CurveStatistics
+
+
+def _expected(x, y):
+    """Statistics computed from all the points (as ChartView.calculateBasicMath)."""
+    i_min, i_max = np.argmin(y), np.argmax(y)
+    x_com = np.sum(x * y) / np.sum(y) if np.sum(y) != 0 else None
+    return (x[i_min], y[i_min]), (x[i_max], y[i_max]), x_com, np.mean(y)
+
+
+def test_appended_points_match_full_computation():
+    """Statistics updated chunk by chunk equal those of all the points."""
+    rng = np.random.default_rng(3)
+    x, y = np.arange(1000.0), rng.normal(size=1000)
+    y[[10, 700]] = y.max() + 1  # first of equal maxima wins
+    stats = CurveStatistics()
+    assert stats.result() is None
+    for first, last in ((0, 1), (1, 300), (300, 300), (300, 1000)):
+        stats.append(x[first:last], y[first:last])
+        result, expected = stats.result(), _expected(x[:last], y[:last])
+        assert result[:2] == expected[:2]
+        np.testing.assert_allclose(result[2:], expected[2:])
+    assert stats.count == 1000 and stats.max_point[0] == 10
+
+
+def test_zero_sum_and_nan():
+    """No center of mass when the sum is 0; NaN values propagate like numpy."""
+    stats = CurveStatistics()
+    stats.append([0.0, 1.0], [1.0, -1.0])
+    assert stats.result()[2] is None and stats.result()[3] == 0
+
+    stats.append([2.0, 3.0], [np.nan, 5.0])
+    stats.append([4.0], [-7.0])
+    (x_min, y_min), (x_max, y_max), x_com, y_mean = stats.result()
+    assert (x_min, x_max) == (2.0, 2.0) and np.isnan(y_min) and np.isnan(y_max)
+    assert np.isnan(x_com) and np.isnan(y_mean)
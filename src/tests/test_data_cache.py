@@ -6,14 +6,20 @@ This module tests the caching functionality for MDA files including
 memory management, LRU eviction, and performance optimizations.
 """
 
+import json
+import os
+import shutil
 import time
 from pathlib import Path
 from unittest.mock import patch, Mock, MagicMock
 
+import pytest
 
 from mdaviz.data_cache import (
     DataCache,
     CachedFileData,
+    CacheStatistics,
+    file_class_for_rank,
     get_global_cache,
     set_global_cache,
 )
@@ -496,6 +502,349 @@ class TestDataCache:
         assert cache.cache_full is not None
 
 
+class TestCacheStatistics:
+    """Test cache instrumentation (counters, latencies, JSON dump)."""
+
+    def test_file_class_for_rank(self) -> None:
+        """Ranks map to 1D/2D/3D, with rank >= 3 reported as 3D."""
+        assert file_class_for_rank(0) == "1D"
+        assert file_class_for_rank(1) == "1D"
+        assert file_class_for_rank(2) == "2D"
+        assert file_class_for_rank(3) == "3D"
+        assert file_class_for_rank(4) == "3D"
+
+    def test_latency_summary(self) -> None:
+        """Percentiles and max are reported in milliseconds per file class."""
+        stats = CacheStatistics()
+        for ms in range(1, 101):
+            stats.record_decode("1D", ms / 1000.0, 10)
+        stats.record_decode("2D", 0.5, 1000)
+
+        summary = stats.latency_summary()
+        assert set(summary) == {"1D", "2D"}
+        assert summary["1D"]["count"] == 100
+        assert abs(summary["1D"]["p50_ms"] - 50.5) < 1e-6
+        assert abs(summary["1D"]["p95_ms"] - 95.05) < 1e-6
+        assert abs(summary["1D"]["max_ms"] - 100.0) < 1e-6
+        assert abs(summary["2D"]["max_ms"] - 500.0) < 1e-6
+        assert stats.bytes_loaded == 100 * 10 + 1000
+        assert stats.files_loaded == 101
+
+    def test_hit_miss_eviction_counters(self) -> None:
+        """get/put/eviction update the counters reported by get_stats."""
+        cache = DataCache(max_entries=1)
+        data1 = CachedFileData(
+            file_path="/test/file1.mda",
+            metadata={},
+            scan_dict={},
+            first_pos=1,
+            first_det=1,
+            pv_list=[],
+            file_name="file1.mda",
+            folder_path="/test",
+        )
+        data2 = CachedFileData(
+            file_path="/test/file2.mda",
+            metadata={},
+            scan_dict={},
+            first_pos=1,
+            first_det=1,
+            pv_list=[],
+            file_name="file2.mda",
+            folder_path="/test",
+        )
+        cache.put("/test/file1.mda", data1)
+        with patch("pathlib.Path.stat") as mock_stat:
+            mock_stat.return_value.st_mtime = data1.file_mtime
+            cache.get("/test/file1.mda")
+        cache.get("/test/missing.mda")
+        cache.put("/test/file2.mda", data2)  # evicts file1
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["evictions"] == 1
+        assert stats["hit_rate_percent"] == 50.0
+
+        cache.reset_stats()
+        stats = cache.get_stats()
+        assert stats["hits"] == stats["misses"] == stats["evictions"] == 0
+
+    def test_load_records_decode_latency(self, single_mda_file: Path) -> None:
+        """Loading a real file records bytes loaded and a decode latency sample."""
+        cache = DataCache()
+        cached = cache.load_and_cache(str(single_mda_file))
+        assert cached is not None
+
+        stats = cache.get_stats()
+        assert stats["files_loaded"] == 1
+        assert stats["bytes_loaded"] == single_mda_file.stat().st_size
+        latency = stats["decode_latency"][cached.get_file_class()]
+        assert latency["count"] == 1
+        assert latency["max_ms"] >= latency["p95_ms"] >= latency["p50_ms"] >= 0
+
+    def test_dump_stats(self, tmp_path: Path, single_mda_file: Path) -> None:
+        """Statistics can be written to a JSON file."""
+        cache = DataCache()
+        cache.load_and_cache(str(single_mda_file))
+        out_file = tmp_path / "stats.json"
+
+        assert cache.dump_stats(out_file) is True
+        with open(out_file) as f:
+            dumped = json.load(f)
+        assert dumped["files_loaded"] == 1
+        assert "decode_latency" in dumped
+        assert "timestamp" in dumped
+
+        assert cache.dump_stats(tmp_path / "missing" / "stats.json") is False
+
+    def test_cache_stats_panel(self, qapp) -> None:
+        """The statistics panel displays counters and latencies of its cache."""
+        from mdaviz.cache_stats_panel import CacheStatsPanel
+
+        cache = DataCache()
+        cache._stats.hits = 3
+        cache._stats.misses = 1
+        cache._stats.record_decode("2D", 0.020, 2048)
+        panel = CacheStatsPanel(cache=cache)
+
+        panel.refresh()
+        assert "Hits: 3" in panel.summary_label.text()
+        assert "75.0%" in panel.summary_label.text()
+        assert panel.latency_table.rowCount() == 1
+        assert panel.latency_table.item(0, 0).text() == "2D"
+
+        panel.onReset()
+        assert "Hits: 0" in panel.summary_label.text()
+        assert panel.latency_table.rowCount() == 0
+        panel.deleteLater()
+
+
+class TestCacheValidation:
+    """Test notification-driven cache validation."""
+
+    def test_invalid_validation_mode(self) -> None:
+        """Unknown validation modes are rejected."""
+        with pytest.raises(ValueError):
+            DataCache(validation_mode="never")
+
+    def test_notify_get_does_not_stat(
+        self, qapp, tmp_path: Path, single_mda_file: Path
+    ) -> None:
+        """In notify mode a cache hit neither stats the file nor queries psutil."""
+        mda_file = shutil.copy(single_mda_file, tmp_path)
+        cache = DataCache(validation_mode="notify")
+        assert cache.load_and_cache(str(mda_file)) is not None
+
+        with (
+            patch("pathlib.Path.stat") as mock_stat,
+            patch.object(cache, "_check_memory_usage") as mock_memory,
+        ):
+            assert cache.get(str(mda_file)) is not None
+            mock_stat.assert_not_called()
+            mock_memory.assert_not_called()
+        cache.clear()
+
+    def test_validate_entries(self, tmp_path: Path, single_mda_file: Path) -> None:
+        """The batched stat drops modified and deleted files only."""
+        modified = Path(shutil.copy(single_mda_file, tmp_path / "modified.mda"))
+        deleted = Path(shutil.copy(single_mda_file, tmp_path / "deleted.mda"))
+        unchanged = Path(shutil.copy(single_mda_file, tmp_path / "unchanged.mda"))
+        cache = DataCache()
+        for path in (modified, deleted, unchanged):
+            cache.load_and_cache(str(path))
+
+        mtime = modified.stat().st_mtime
+        os.utime(modified, (mtime + 10, mtime + 10))
+        deleted.unlink()
+
+        assert cache.validate_entries() == 2
+        assert cache.get_stats()["entry_count"] == 1
+        assert cache.get(str(unchanged)) is not None
+
+    def test_fallback_stats_unwatched_entries_only(
+        self, qapp, tmp_path: Path, single_mda_file: Path
+    ) -> None:
+        """The periodic stat runs only for entries without notifications."""
+        watched = str(shutil.copy(single_mda_file, tmp_path / "watched.mda"))
+        unwatched = str(shutil.copy(single_mda_file, tmp_path / "unwatched.mda"))
+        cache = DataCache(validation_mode="notify")
+        cache.load_and_cache(watched)
+        assert not cache._validation_timer.isActive()
+
+        with patch.object(
+            cache._watcher, "addPath", side_effect=lambda path: path != unwatched
+        ):
+            cache.load_and_cache(unwatched)
+        assert cache._unwatched == {unwatched}
+        assert cache._validation_timer.isActive()
+
+        with patch.object(cache, "_is_stale", return_value=False) as is_stale:
+            assert cache.validate_entries() == 0
+        assert [call.args[0] for call in is_stale.call_args_list] == [unwatched]
+
+        cache.remove(unwatched)
+        assert not cache._validation_timer.isActive()
+        cache.clear()
+
+    def test_fallback_stats_network_entries(
+        self, qapp, tmp_path: Path, single_mda_file: Path
+    ) -> None:
+        """Entries in folders on network filesystems are checked by the timer."""
+        (tmp_path / "nfs").mkdir()
+        local = str(shutil.copy(single_mda_file, tmp_path / "local.mda"))
+        remote = str(shutil.copy(single_mda_file, tmp_path / "nfs" / "remote.mda"))
+        cache = DataCache(validation_mode="notify")
+        with patch(
+            "mdaviz.data_cache.is_network_path",
+            side_effect=lambda path: Path(path).name == "nfs",
+        ):
+            cache.load_and_cache(local)
+            cache.load_and_cache(remote)
+        assert cache._unwatched == {remote}
+        assert cache._validation_timer.isActive()
+
+        cache.remove(remote)
+        assert not cache._network_folders
+        assert not cache._validation_timer.isActive()
+        cache.clear()
+
+    def test_file_change_notification(
+        self, qapp, tmp_path: Path, single_mda_file: Path
+    ) -> None:
+        """A change notification removes the entry without a lookup."""
+        mda_file = str(shutil.copy(single_mda_file, tmp_path))
+        cache = DataCache(validation_mode="notify")
+        cache.load_and_cache(mda_file)
+        assert mda_file in cache._watcher.files()
+
+        with open(mda_file, "ab") as f:
+            f.write(b"\0")
+        deadline = time.time() + 5
+        while mda_file in cache._cache and time.time() < deadline:
+            qapp.processEvents()
+            time.sleep(0.01)
+
+        assert mda_file not in cache._cache
+        assert mda_file not in cache._watcher.files()
+        assert cache._watcher.directories() == []
+
+
+class TestFolderIndex:
+    """Test folder-indexed invalidation and per-folder statistics."""
+
+    def _fill(self, cache: DataCache, tmp_path: Path, mda_file: Path) -> list[Path]:
+        """Cache two files in each of two sub-folders of tmp_path."""
+        paths = []
+        for folder in ("a", "b"):
+            (tmp_path / folder).mkdir()
+            for name in ("scan_0001.mda", "scan_0002.mda"):
+                path = Path(shutil.copy(mda_file, tmp_path / folder / name))
+                cache.load_and_cache(str(path))
+                paths.append(path)
+        return paths
+
+    def test_invalidate_folder(self, tmp_path: Path, single_mda_file: Path) -> None:
+        """Only the folder's entries are removed, without stat calls."""
+        cache = DataCache()
+        self._fill(cache, tmp_path, single_mda_file)
+        assert cache.get_stats()["folder_count"] == 2
+
+        with patch("pathlib.Path.stat") as mock_stat:
+            assert cache.invalidate_folder(str(tmp_path / "a")) == 2
+            mock_stat.assert_not_called()
+        assert cache.get_stats()["entry_count"] == 2
+        assert cache.get_stats()["folder_count"] == 1
+        assert cache.invalidate_folder(str(tmp_path / "a")) == 0
+
+    def test_invalidate_folder_changed_only(
+        self, tmp_path: Path, single_mda_file: Path
+    ) -> None:
+        """changed_only keeps entries whose size and mtime are unchanged."""
+        cache = DataCache()
+        paths = self._fill(cache, tmp_path, single_mda_file)
+        with open(paths[0], "ab") as f:
+            f.write(b"\0")
+
+        assert cache.invalidate_folder(str(tmp_path / "a"), changed_only=True) == 1
+        assert str(paths[0]) not in cache._cache
+        assert str(paths[1]) in cache._cache
+
+    def test_get_folder_stats(self, tmp_path: Path, single_mda_file: Path) -> None:
+        """Per-folder statistics cover the folder's entries only."""
+        cache = DataCache()
+        self._fill(cache, tmp_path, single_mda_file)
+
+        stats = cache.get_folder_stats(str(tmp_path / "b"))
+        assert stats["entry_count"] == 2
+        assert stats["size_bytes"] == 2 * single_mda_file.stat().st_size
+        assert cache.get_folder_stats(str(tmp_path / "c"))["entry_count"] == 0
+
+        cache.clear()
+        assert cache.get_folder_stats(str(tmp_path / "b"))["entry_count"] == 0
+
+
+class TestPinning:
+    """Test pinned (eviction-protected) cache entries."""
+
+    def _data(self, name: str, size_bytes: int = 0) -> CachedFileData:
+        """Build a small cache entry."""
+        return CachedFileData(
+            file_path=f"/test/{name}",
+            metadata={},
+            scan_dict={},
+            first_pos=1,
+            first_det=1,
+            pv_list=[],
+            file_name=name,
+            folder_path="/test",
+            size_bytes=size_bytes,
+        )
+
+    def test_pinned_entries_not_evicted(self) -> None:
+        """LRU eviction skips pinned entries."""
+        cache = DataCache(max_entries=2)
+        cache.pin("/test/file1.mda", "tab")
+        cache.put("/test/file1.mda", self._data("file1.mda"))
+        cache.put("/test/file2.mda", self._data("file2.mda"))
+        cache.put("/test/file3.mda", self._data("file3.mda"))  # evicts file2
+
+        assert "/test/file1.mda" in cache._cache
+        assert "/test/file2.mda" not in cache._cache
+        assert "/test/file3.mda" in cache._cache
+
+        # Nothing left to evict when every entry is pinned
+        cache.pin("/test/file3.mda", "live")
+        assert cache._evict_lru() is False
+
+    def test_pin_refcount(self) -> None:
+        """A file stays pinned until every owner released it."""
+        cache = DataCache()
+        cache.pin("/test/file1.mda", "tab")
+        cache.pin("/test/file1.mda", "curve:a")
+        cache.pin("/test/file2.mda", "curve:a")
+
+        assert cache.unpin("/test/file1.mda", "tab") is True
+        assert cache.unpin("/test/file1.mda", "tab") is False
+        assert cache.is_pinned("/test/file1.mda")
+        assert cache.unpin_all("curve:a") == 2
+        assert not cache.is_pinned("/test/file1.mda")
+        assert not cache.is_pinned("/test/file2.mda")
+
+    def test_pinned_stats(self) -> None:
+        """Pinned memory is reported separately."""
+        cache = DataCache()
+        cache.put("/test/file1.mda", self._data("file1.mda", 2 * 1024 * 1024))
+        cache.put("/test/file2.mda", self._data("file2.mda", 1024 * 1024))
+        cache.pin("/test/file1.mda", "tab")
+        cache.pin("/test/not_cached.mda", "tab")
+
+        stats = cache.get_stats()
+        assert stats["pinned_count"] == 1
+        assert stats["pinned_size_mb"] == 2.0
+        assert stats["current_size_mb"] == 3.0
+
+
 class TestGlobalCache:
     """Test global cache functionality."""
 
@@ -504,6 +853,18 @@ class TestGlobalCache:
         cache = get_global_cache()
         assert isinstance(cache, DataCache)
 
+    def test_global_cache_unknown_validation_mode(self) -> None:
+        """An unknown validation mode in the configuration falls back to notify."""
+        from mdaviz.lazy_loading_config import LazyLoadingConfig
+
+        config = LazyLoadingConfig(data_cache_validation_mode="poll")
+        with (
+            patch("mdaviz.data_cache._global_cache", None),
+            patch("mdaviz.data_cache.get_config", return_value=config),
+        ):
+            cache = get_global_cache()
+        assert cache.validation_mode == "notify"
+
     def test_set_global_cache(self) -> None:
         """Test setting the global cache instance."""
         new_cache = DataCache(max_entries=200)
@@ -0,0 +1,61 @@
+"""Tests for mdaviz.file_monitor."""
+
+import os
+from pathlib import Path
+
+from mdaviz.file_monitor import FileMonitor, is_network_path
+
+
+def test_burst_of_writes_is_coalesced(tmp_path: Path, qtbot) -> None:
+    """Writes notified within the debounce delay give one change report."""
+    path = tmp_path / "scan_0001.mda"
+    path.write_bytes(b"")
+    monitor = FileMonitor(debounce_ms=50)
+    monitor.watch(path)
+    assert not monitor.isPolled(path) and not is_network_path(tmp_path)
+
+    reports = []
+    monitor.changed.connect(reports.append)
+    with qtbot.waitSignal(monitor.changed, timeout=2000):
+        for n in range(5):
+            with open(path, "ab") as f:
+                f.write(b"x" * n)
+    qtbot.wait(150)
+    assert reports == [[str(path)]]
+
+
+def test_replaced_file_is_watched_again(tmp_path: Path, qtbot) -> None:
+    """A file replaced by a rename keeps being reported."""
+    path = tmp_path / "scan_0001.mda"
+    path.write_bytes(b"a")
+    monitor = FileMonitor(debounce_ms=10)
+    monitor.watch(path)
+
+    for content in (b"bb", b"ccc"):
+        temporary = tmp_path / "scan_0001.tmp"
+        temporary.write_bytes(content)
+        with qtbot.waitSignal(monitor.changed, timeout=2000) as blocker:
+            os.replace(temporary, path)
+        assert blocker.args == [[str(path)]]
+
+
+def test_polled_paths(tmp_path: Path, qtbot) -> None:
+    """Polled paths are stat'ed at an interval that grows while idle."""
+    folder = tmp_path / "data"
+    folder.mkdir()
+    monitor = FileMonitor(poll_min_ms=20, poll_max_ms=80)
+    monitor.setPaths([folder])
+    monitor.unwatch(folder)
+    monitor.watch(folder, poll=True)
+    assert monitor.isPolled(folder) and monitor.paths() == [str(folder)]
+
+    with qtbot.waitSignal(monitor.changed, timeout=2000) as blocker:
+        (folder / "scan_0002.mda").write_bytes(b"")
+    assert blocker.args == [[str(folder)]]
+
+    for interval in (40, 80, 80):
+        monitor._poll()
+        assert monitor._poll_timer.interval() == interval
+
+    monitor.setPaths([])
+    assert monitor.paths() == [] and not monitor._poll_timer.isActive()
@@ -0,0 +1,143 @@
+"""Tests for mdaviz.folder_index."""
+
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+from mdaviz.folder_index import FolderIndex, SCHEMA_VERSION
+from mdaviz.lazy_folder_scanner import FolderScanWorker, FolderScanResult
+
+
+def _file_info(name: str, positioners: str = "") -> dict:
+    """Build a folder-table row like the file info readers do."""
+    return {
+        "Name": name,
+        "folderPath": "/data",
+        "Prefix": "scan",
+        "Scan #": 1,
+        "Points": 21,
+        "Dim": 2,
+        "Date": 1.5,
+        "Size": 1024,
+        "Positioners": positioners,
+        "Dimensions": [21, 11],
+    }
+
+
+def test_round_trip(tmp_path: Path) -> None:
+    """Stored rows are read back with the same fields."""
+    index = FolderIndex(tmp_path / "index.sqlite3")
+    entries = {"/data/scan_0001.mda": (1.5, 1024, _file_info("scan_0001.mda", "m1"))}
+
+    assert index.update_folder("/data", entries, full_read=True) is True
+    loaded = index.load_folder("/data")
+    assert loaded == entries
+    assert index.load_folder("/other") == {}
+
+
+def test_require_positioners_and_present(tmp_path: Path) -> None:
+    """Lightweight rows are skipped when positioners are required, and rows of
+    files no longer present are deleted."""
+    index = FolderIndex(tmp_path / "index.sqlite3")
+    index.update_folder(
+        "/data",
+        {
+            "/data/a.mda": (1.0, 10, _file_info("a.mda")),
+            "/data/b.mda": (1.0, 10, _file_info("b.mda")),
+        },
+    )
+    assert index.load_folder("/data", require_positioners=True) == {}
+
+    index.update_folder("/data", {}, present=["/data/a.mda"])
+    assert list(index.load_folder("/data")) == ["/data/a.mda"]
+
+    assert index.clear() is True
+    assert index.load_folder("/data") == {}
+
+
+def test_search_terms_stored(tmp_path: Path) -> None:
+    """Metadata search terms are stored with the rows; rows without them are
+    skipped when terms are required."""
+    index = FolderIndex(tmp_path / "index.sqlite3")
+    with_terms = dict(_file_info("a.mda"), Terms=["scan=1", "m23"])
+    index.update_folder(
+        "/data",
+        {
+            "/data/a.mda": (1.0, 10, with_terms),
+            "/data/b.mda": (1.0, 10, _file_info("b.mda")),
+        },
+        full_read=True,
+    )
+    loaded = index.load_folder("/data", require_terms=True)
+    assert list(loaded) == ["/data/a.mda"]
+    assert loaded["/data/a.mda"][2]["Terms"] == ["scan=1", "m23"]
+    assert "Terms" not in index.load_folder("/data")["/data/b.mda"][2]
+
+
+def test_schema_version_rebuild(tmp_path: Path) -> None:
+    """An index written with another schema version is discarded."""
+    db_path = tmp_path / "index.sqlite3"
+    connection = sqlite3.connect(db_path)
+    connection.execute("CREATE TABLE files (path TEXT PRIMARY KEY, folder TEXT)")
+    connection.execute("INSERT INTO files VALUES ('/data/a.mda', '/data')")
+    connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+    connection.commit()
+    connection.close()
+
+    index = FolderIndex(db_path)
+    assert index.load_folder("/data") == {}
+    assert index.update_folder("/data", {"/data/a.mda": (1.0, 1, _file_info("a"))})
+
+
+def test_unwritable_index(tmp_path: Path) -> None:
+    """Errors are logged and reported, not raised."""
+    blocker = tmp_path / "blocker"
+    blocker.touch()
+    index = FolderIndex(blocker / "index.sqlite3")
+    assert index.load_folder("/data") == {}
+    assert index.update_folder("/data", {}) is False
+
+
+def test_scan_reuses_index_across_sessions(tmp_path: Path, qapp) -> None:
+    """A new scanner session only reads files that are new or changed."""
+    folder = tmp_path / "data"
+    folder.mkdir()
+    for i in range(5):
+        (folder / f"test_{i}.mda").touch()
+    index = FolderIndex(tmp_path / "index.sqlite3")
+
+    def scan() -> FolderScanResult:
+        worker = FolderScanWorker(
+            folder,
+            batch_size=10,
+            max_files=100,
+            use_lightweight_scan=True,
+            progressive_loading=False,
+            folder_index=index,
+        )
+        results: list[FolderScanResult] = []
+        worker.complete.connect(results.append)
+        worker.scan()
+        return results[0]
+
+    first = scan()
+    assert len(first.file_list) == 5
+    assert len(index.load_folder(str(folder.resolve()))) == 5
+
+    (folder / "test_0.mda").write_bytes(b"changed")
+    (folder / "test_4.mda").unlink()
+    (folder / "test_5.mda").touch()
+    with patch(
+        "mdaviz.lazy_folder_scanner.get_file_info_lightweight",
+        side_effect=lambda path, file_stat: {"Name": path.name},
+    ) as mock_light:
+        second = scan()
+
+    assert sorted(call.args[0].name for call in mock_light.call_args_list) == [
+        "test_0.mda",
+        "test_5.mda",
+    ]
+    assert second.file_list == [f"test_{i}.mda" for i in (0, 1, 2, 3, 5)]
+    assert sorted(Path(p).name for p in index.load_folder(str(folder.resolve()))) == [
+        f"test_{i}.mda" for i in (0, 1, 2, 3, 5)
+    ]
@@ -0,0 +1,127 @@
+"""Tests for mdaviz.folder_search."""
+
+import shutil
+from pathlib import Path
+
+from PyQt6.QtCore import Qt
+
+from mdaviz.folder_search import FolderSearchIndex
+from mdaviz.lazy_folder_scanner import FolderScanResult, FolderScanWorker
+from mdaviz.mda_folder_table_model import MDAFolderTableModel
+from mdaviz.mda_folder_table_view import FolderSortProxyModel, MDAFolderTableView
+from mdaviz.user_settings import settings
+
+DATA_PATH = Path(__file__).parent / "data"
+
+
+def _rows(n_rows: int) -> list[dict]:
+    """Folder table rows; odd scans moved m23, every third one has a sample."""
+    rows = []
+    for i in range(n_rows):
+        terms = [f"scan={i}", "i0", "29idb:m23.val" if i % 2 else "29idb:m1.val"]
+        if i % 3 == 0:
+            terms.append(f"29idb:sample_name={'cu' if i % 2 else 'si'}")
+        rows.append({"Name": f"scan_{i:04d}.mda", "Scan #": i, "Terms": terms})
+    return rows
+
+
+def test_search_index_queries() -> None:
+    """Plain tokens match substrings of terms, key=value tokens exact values."""
+    rows = _rows(12)
+    index = FolderSearchIndex(
+        ((row, [info["Name"], *info["Terms"]]) for row, info in enumerate(rows)),
+        len(rows),
+    )
+
+    def found(query):
+        return [int(row) for row in index.search(query).nonzero()[0]]
+
+    assert index.search("  ") is None
+    assert found("M23") == [1, 3, 5, 7, 9, 11]
+    assert found("m23 sample_name=cu") == [3, 9]
+    assert found("scan=1") == [1]
+    assert found("scan_001") == list(range(10, 12))
+    assert found("i0 nothing") == []
+
+
+def test_proxy_row_filter(qapp) -> None:
+    """Hidden rows are skipped by the sorted proxy; rows added are shown."""
+    rows = _rows(10)
+    model = MDAFolderTableModel(rows, None)
+    proxy = FolderSortProxyModel()
+    proxy.setSourceModel(model)
+    proxy.sort(model.columnLabels.index("Scan #"), Qt.SortOrder.DescendingOrder)
+
+    proxy.setRowFilter(model.searchIndex().search("m23"))
+    shown = [
+        proxy.mapToSource(proxy.index(r, 0)).row() for r in range(proxy.rowCount())
+    ]
+    assert shown == [9, 7, 5, 3, 1]
+    assert not proxy.mapFromSource(model.index(2, 0)).isValid()
+
+    model.removeFileRows([0, 1])
+    model.appendRows([{"Name": "new.mda", "Scan #": 20}])
+    shown = [
+        proxy.mapToSource(proxy.index(r, 0)).row() for r in range(proxy.rowCount())
+    ]
+    assert shown == [8, 7, 5, 3, 1]  # new.mda (row 8) shown until the next filter
+
+    proxy.setRowFilter(model.searchIndex().search("m23"))
+    assert proxy.rowCount() == 4
+    proxy.setRowFilter(None)
+    assert proxy.rowCount() == 9
+
+
+def test_filter_box(qapp, monkeypatch) -> None:
+    """The filter box filters the table once typing pauses."""
+    monkeypatch.setattr(settings, "getKey", lambda key: False)
+
+    class _FolderMVC:
+        def mdaInfoList(self):
+            return rows
+
+        def mdaFileList(self):
+            return [info["Name"] for info in rows]
+
+        def setStatus(self, text):
+            messages.append(text)
+
+    rows, messages = _rows(30), []
+    view = MDAFolderTableView(_FolderMVC())
+    view.displayTable()
+    view.filterEdit.setText("sample_name=si")
+    assert view.proxyModel.rowCount() == 30
+    view._filter_timer.timeout.emit()
+    assert view.proxyModel.rowCount() == 5
+    assert messages[-1] == "5 of 30 files match 'sample_name=si'"
+
+    view.filterEdit.clear()
+    view.applyFilter()
+    assert view.proxyModel.rowCount() == 30
+    view.close()
+
+
+def test_scan_reads_search_terms(tmp_path: Path, qapp) -> None:
+    """The folder scan reads the search terms of every file from its headers."""
+    for path in sorted((DATA_PATH / "test_folder1").glob("*.mda"))[:3]:
+        shutil.copy(path, tmp_path)
+    worker = FolderScanWorker(
+        tmp_path,
+        batch_size=10,
+        max_files=100,
+        use_lightweight_scan=True,
+        search_terms=True,
+    )
+    results: list[FolderScanResult] = []
+    worker.complete.connect(results.append)
+    worker.scan()
+
+    infos = results[0].file_info_list
+    assert [info["Terms"][0] for info in infos] == [
+        f"scan={info['Scan #']}" for info in infos
+    ]
+    model = MDAFolderTableModel(infos, None)
+    position = infos[0]["Terms"][1]  # first positioner name
+    assert list(model.searchIndex().search(position)) == [
+        position in info["Terms"] for info in infos
+    ]
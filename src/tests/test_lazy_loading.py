@@ -12,6 +12,7 @@ it works correctly and handles large folders efficiently.
     ~TestLazyLoadingConfig
 """
 
+import os
 import pytest
 from pathlib import Path
 from typing import TYPE_CHECKING, Dict, Any
@@ -24,6 +25,12 @@ from mdaviz.lazy_folder_scanner import (
     LazyFolderScanner,
     FolderScanWorker,
     FolderScanResult,
+    ScanPriority,
+    FolderDeltaTracker,
+    FolderDeltaWorker,
+    FileRefreshWorker,
+    list_mda_files,
+    list_mda_directory,
 )
 from mdaviz.data_cache import DataCache, CachedFileData, get_global_cache
 from mdaviz.virtual_table_model import (
@@ -125,6 +132,31 @@ class TestLazyFolderScanner:
             progress_calls[-1][0] == progress_calls[-1][1]
         )  # Final call should be complete
 
+    def test_scan_folder_uses_scan_options(
+        self, scanner: LazyFolderScanner, temp_folder: Path
+    ) -> None:
+        """The synchronous scan runs the scan worker, with the preferences
+        (here: subfolders) and the configured readers."""
+        (temp_folder / "sub").mkdir()
+        for name in ("a.mda", "sub/b.mda"):
+            (temp_folder / name).touch()
+        config = LazyLoadingConfig(folder_scan_workers=2, folder_index_enabled=False)
+        with (
+            patch(
+                "mdaviz.user_settings.settings.getKey",
+                side_effect=lambda key: key == "scan_subfolders",
+            ),
+            patch("mdaviz.lazy_folder_scanner.get_config", return_value=config),
+            patch(
+                "mdaviz.lazy_folder_scanner.get_file_info_lightweight",
+                side_effect=lambda path, file_stat: {"Name": path.name},
+            ),
+        ):
+            result = scanner.scan_folder(temp_folder)
+        assert result.is_complete
+        assert result.file_list == ["a.mda", "sub/b.mda"]
+        assert result.file_info_list[1]["Folder"] == "sub"
+
     @pytest.mark.skip(reason="Skip in CI/headless: uses Qt/QThread")
     def test_cancel_scan(self, scanner: LazyFolderScanner, temp_folder: Path) -> None:
         """Test that scan can be cancelled."""
@@ -223,18 +255,20 @@ class TestLazyFolderScanner:
     def test_progressive_scan_respects_show_positioners(
         self, temp_folder: Path, qapp: QApplication
     ) -> None:
-        """Progressive scan must use the full reader when show_positioners=True
-        (regression: progressive paths used to ignore the flag and always do
-        the lightweight read, leaving the Positioners column empty)."""
+        """Progressive scan must read positioner names (from the file headers)
+        when show_positioners=True (regression: progressive paths used to ignore
+        the flag and always do the lightweight read, leaving the Positioners
+        column empty)."""
         n_files = 12
         for i in range(n_files):
             (temp_folder / f"test_{i:03d}.mda").touch()
 
         with (
+            patch("mdaviz.lazy_folder_scanner.get_file_info_header") as mock_header,
             patch("mdaviz.lazy_folder_scanner.get_file_info_full") as mock_full,
             patch("mdaviz.lazy_folder_scanner.get_file_info_lightweight") as mock_light,
         ):
-            mock_full.return_value = {"Name": "x", "Positioners": "p1"}
+            mock_header.return_value = {"Name": "x", "Positioners": "p1"}
             mock_light.return_value = {"Name": "x"}
 
             worker = FolderScanWorker(
@@ -248,9 +282,332 @@ class TestLazyFolderScanner:
             worker.complete.connect(lambda r: None)
             worker.scan()
 
-            assert mock_full.call_count == n_files
+            assert mock_header.call_count == n_files
+            mock_full.assert_not_called()
             mock_light.assert_not_called()
 
+    def test_list_mda_files(self, temp_folder: Path) -> None:
+        """The folder listing returns MDA files only, each with its stat result."""
+        for i in range(3):
+            (temp_folder / f"test_{i}.mda").write_bytes(b"x" * i)
+        (temp_folder / "notes.txt").touch()
+        (temp_folder / "subdir.mda").mkdir()
+
+        entries = list_mda_files(temp_folder)
+        assert sorted(path.name for path, _ in entries) == [
+            f"test_{i}.mda" for i in range(3)
+        ]
+        for path, file_stat in entries:
+            assert path.parent == temp_folder
+            assert file_stat.st_size == path.stat().st_size
+
+    def test_worker_passes_stat_to_reader(
+        self, temp_folder: Path, qapp: QApplication
+    ) -> None:
+        """The worker hands the listing's stat result to the file info reader."""
+        for i in range(3):
+            (temp_folder / f"test_{i}.mda").touch()
+
+        with patch(
+            "mdaviz.lazy_folder_scanner.get_file_info_lightweight"
+        ) as mock_light:
+            mock_light.return_value = {"Name": "x"}
+            worker = FolderScanWorker(
+                temp_folder,
+                batch_size=10,
+                max_files=100,
+                use_lightweight_scan=True,
+                progressive_loading=False,
+            )
+            results: list[FolderScanResult] = []
+            worker.complete.connect(results.append)
+            worker.scan()
+
+        assert len(results[0].file_list) == 3
+        for call in mock_light.call_args_list:
+            file_path, file_stat = call.args
+            assert file_stat.st_mtime == file_path.stat().st_mtime
+        assert set(results[0].file_info_cache) == {
+            str(temp_folder.resolve() / f"test_{i}.mda") for i in range(3)
+        }
+
+    @pytest.mark.parametrize("progressive", [False, True])
+    def test_parallel_scan_sorted_results(
+        self, temp_folder: Path, qapp: QApplication, progressive: bool
+    ) -> None:
+        """A pooled scan returns every file in name order and reports progress."""
+        n_files = 30
+        for i in reversed(range(n_files)):
+            (temp_folder / f"test_{i:03d}.mda").touch()
+
+        worker = FolderScanWorker(
+            temp_folder,
+            batch_size=7,
+            max_files=10 if progressive else 100,
+            use_lightweight_scan=True,
+            progressive_loading=progressive,
+            scan_workers=4,
+        )
+        completes: list[FolderScanResult] = []
+        progress: list[tuple[int, int]] = []
+        worker.complete.connect(completes.append)
+        worker.progress.connect(
+            lambda current, total: progress.append((current, total))
+        )
+        worker.scan()
+
+        expected = [f"test_{i:03d}.mda" for i in range(n_files)]
+        assert completes[0].file_list == expected
+        assert [info["Name"] for info in completes[0].file_info_list] == expected
+        assert progress[-1] == (n_files, n_files)
+
+    def test_parallel_scan_cancel(self, temp_folder: Path, qapp: QApplication) -> None:
+        """Cancelling a pooled scan stops reading files and emits no result."""
+        for i in range(40):
+            (temp_folder / f"test_{i:03d}.mda").touch()
+
+        worker = FolderScanWorker(
+            temp_folder,
+            batch_size=10,
+            max_files=100,
+            use_lightweight_scan=True,
+            progressive_loading=False,
+            scan_workers=2,
+        )
+
+        def read_and_cancel(file_path, file_stat):
+            worker.cancel()
+            return {"Name": file_path.name}
+
+        completes: list[FolderScanResult] = []
+        finished: list[bool] = []
+        worker.complete.connect(completes.append)
+        worker.finished.connect(lambda: finished.append(True))
+        with patch(
+            "mdaviz.lazy_folder_scanner.get_file_info_lightweight",
+            side_effect=read_and_cancel,
+        ) as mock_light:
+            worker.scan()
+
+        assert completes == []
+        assert finished == [True]
+        assert mock_light.call_count <= 2
+
+    def test_scan_reads_visible_rows_first(
+        self, temp_folder: Path, qapp: QApplication
+    ) -> None:
+        """Files shown in the folder view are read first, then the others in
+        the view's sort order; a new priority applies from the next batch."""
+        for i in range(8):
+            path = temp_folder / f"test_{i}.mda"
+            path.touch()
+            os.utime(path, (1000 + i, 1000 + i))
+
+        worker = FolderScanWorker(
+            temp_folder,
+            batch_size=2,
+            max_files=100,
+            use_lightweight_scan=True,
+            progressive_loading=False,
+            priority=ScanPriority(("test_5.mda", "test_2.mda"), "Date", True),
+        )
+        order: list[str] = []
+
+        def read(file_path, file_stat):
+            order.append(file_path.name)
+            if len(order) == 4:
+                worker.set_priority(["test_0.mda"])
+            return {"Name": file_path.name}
+
+        completes: list[FolderScanResult] = []
+        worker.complete.connect(completes.append)
+        with patch(
+            "mdaviz.lazy_folder_scanner.get_file_info_lightweight", side_effect=read
+        ):
+            worker.scan()
+
+        assert order == [
+            f"test_{i}.mda" for i in (5, 2, 7, 6, 0, 1, 3, 4)
+        ]  # visible, newest first, then visible again and name order
+        assert completes[0].file_list == [f"test_{i}.mda" for i in range(8)]
+
+    def test_progressive_updates_have_placeholders(
+        self, temp_folder: Path, qapp: QApplication
+    ) -> None:
+        """Partial results list every file, with placeholder rows for the files
+        not read yet, and report the rows read since the previous update."""
+        for i in range(6):
+            (temp_folder / f"test_{i}.mda").write_bytes(b"x" * 10)
+
+        worker = FolderScanWorker(
+            temp_folder,
+            batch_size=2,
+            max_files=100,
+            use_lightweight_scan=True,
+            progressive_loading=True,
+        )
+        updates: list[FolderScanResult] = []
+        completes: list[FolderScanResult] = []
+        worker.progressive_update.connect(updates.append)
+        worker.complete.connect(completes.append)
+        with (
+            patch("mdaviz.lazy_folder_scanner.PROGRESSIVE_UPDATE_INTERVAL_S", 0),
+            patch(
+                "mdaviz.lazy_folder_scanner.get_file_info_lightweight",
+                side_effect=lambda path, file_stat: {"Name": path.name, "Dim": 1},
+            ),
+        ):
+            worker.scan()
+
+        first = updates[0]
+        assert first.updated_rows is None and first.scanned_files == 0
+        assert first.file_list == [f"test_{i}.mda" for i in range(6)]
+        assert [info["Dim"] for info in first.file_info_list] == [None] * 6
+        assert first.file_info_list[0]["Size"] == 10
+        assert [update.updated_rows for update in updates[1:]] == [[0, 1], [2, 3]]
+        assert updates[-1].file_info_list[3]["Dim"] == 1
+        assert completes[0].is_progressive and len(completes[0].file_list) == 6
+
+    def test_recursive_scan(self, temp_folder: Path, qapp: QApplication) -> None:
+        """A recursive scan lists subfolders (in parallel) and relists only the
+        directories whose mtime changed."""
+        for name in ("a.mda", "user1/2024/b.mda", "user1/2024/c.mda", "user2/d.mda"):
+            (temp_folder / name).parent.mkdir(parents=True, exist_ok=True)
+            (temp_folder / name).touch()
+
+        def scan(previous=None):
+            worker = FolderScanWorker(
+                temp_folder,
+                batch_size=10,
+                max_files=100,
+                use_lightweight_scan=True,
+                progressive_loading=False,
+                scan_workers=4,
+                recursive=True,
+                previous_directories=previous,
+            )
+            results: list[FolderScanResult] = []
+            worker.complete.connect(results.append)
+            worker.scan()
+            return results[0]
+
+        first = scan()
+        assert first.file_list == [
+            "a.mda",
+            "user1/2024/b.mda",
+            "user1/2024/c.mda",
+            "user2/d.mda",
+        ]
+        assert [info["Folder"] for info in first.file_info_list] == [
+            "",
+            "user1/2024",
+            "user1/2024",
+            "user2",
+        ]
+        assert len(first.directory_cache) == 4
+
+        (temp_folder / "user2" / "e.mda").touch()
+        os.utime(temp_folder / "user2", (2e9, 2e9))
+        with patch(
+            "mdaviz.lazy_folder_scanner.list_mda_directory",
+            wraps=list_mda_directory,
+        ) as mock_list:
+            second = scan(first.directory_cache)
+        assert [call.args[0].name for call in mock_list.call_args_list] == ["user2"]
+        assert second.file_list[-2:] == ["user2/d.mda", "user2/e.mda"]
+
+    def test_folder_delta_tracker(self, temp_folder: Path) -> None:
+        """The tracker reports the files added, removed and changed since the
+        previous listing; files known by name are not reported as new."""
+        for i in range(4):
+            (temp_folder / f"scan_{i:04d}.mda").write_bytes(b"x")
+        tracker = FolderDeltaTracker(
+            temp_folder, ["scan_0000.mda", "scan_0001.mda", "sub/scan_0009.mda"]
+        )
+        assert len(tracker) == 2
+
+        delta = tracker.update()
+        assert [path.name for path, _ in delta.added] == [
+            "scan_0002.mda",
+            "scan_0003.mda",
+        ]
+        assert delta.removed == [] and delta.changed == []
+        assert not tracker.update()
+
+        (temp_folder / "scan_0004.mda").touch()
+        (temp_folder / "scan_0000.mda").unlink()
+        (temp_folder / "scan_0001.mda").write_bytes(b"xyz")
+        delta = tracker.update()
+        assert [path.name for path, _ in delta.added] == ["scan_0004.mda"]
+        assert delta.removed == ["scan_0000.mda"]
+        assert [path.name for path, _ in delta.changed] == ["scan_0001.mda"]
+        assert len(tracker) == 4
+
+    def test_folder_delta_worker_reads_new_files(
+        self, temp_folder: Path, qapp: QApplication
+    ) -> None:
+        """The delta worker reads the new files only, with the scan readers."""
+        for i in range(3):
+            (temp_folder / f"scan_{i}.mda").touch()
+        tracker = FolderDeltaTracker(temp_folder, ["scan_0.mda", "scan_1.mda"])
+        with patch(
+            "mdaviz.lazy_folder_scanner.get_file_info_lightweight"
+        ) as mock_light:
+            mock_light.side_effect = lambda path, file_stat: {"Name": path.name}
+            worker = FolderDeltaWorker(tracker, scan_workers=2, recursive=True)
+            deltas = []
+            worker.complete.connect(deltas.append)
+            worker.scan()
+        assert mock_light.call_count == 1
+        assert deltas[0].file_infos == {
+            "scan_2.mda": {"Name": "scan_2.mda", "Folder": ""}
+        }
+
+    def test_refresh_queue_is_bounded_and_batched(
+        self, temp_folder: Path, qapp: QApplication
+    ) -> None:
+        """Files changed while a batch is read make the next (bounded) batch."""
+        scanner = LazyFolderScanner()
+        paths = [temp_folder / f"scan_{i}.mda" for i in range(4)]
+        config = LazyLoadingConfig(live_refresh_queue_size=2)
+        with (
+            patch("mdaviz.lazy_folder_scanner.get_config", return_value=config),
+            patch.object(scanner, "_run_worker", return_value=Mock()) as run,
+        ):
+            scanner.refresh_files_async(temp_folder, paths[:1])
+            scanner.refresh_files_async(temp_folder, paths[1:])
+            scanner.refresh_files_async(temp_folder, paths[2:3])
+            assert run.call_count == 1
+            assert run.call_args.args[0].file_paths == paths[:1]
+
+            scanner._on_refresh_thread_finished()
+            assert run.call_count == 2
+            assert run.call_args.args[0].file_paths == [paths[3], paths[2]]
+            scanner._on_refresh_thread_finished()
+            assert run.call_count == 2
+
+    def test_file_refresh_worker(self, temp_folder: Path, qapp: QApplication) -> None:
+        """The refresh worker reads each existing file once; the file info is
+        keyed by path relative to the folder (as in recursive scans)."""
+        (temp_folder / "sub").mkdir()
+        for name in ("scan_0.mda", "sub/scan_1.mda"):
+            (temp_folder / name).touch()
+        paths = [temp_folder / name for name in ("scan_0.mda", "sub/scan_1.mda")]
+        paths.append(temp_folder / "scan_2.mda")  # deleted meanwhile
+        with patch(
+            "mdaviz.lazy_folder_scanner.get_file_info_lightweight"
+        ) as mock_light:
+            mock_light.side_effect = lambda path, file_stat: {"Points": 3}
+            worker = FileRefreshWorker(
+                temp_folder, paths, use_lightweight_scan=True, recursive=True
+            )
+            deltas = []
+            worker.complete.connect(deltas.append)
+            worker.scan()
+        assert mock_light.call_count == 2
+        assert [path for path, _ in deltas[0].changed] == paths[:2]
+        assert set(deltas[0].file_infos) == {"scan_0.mda", "sub/scan_1.mda"}
+
 
 class TestDataCache:
     """Test cases for the DataCache class."""
@@ -701,6 +1058,14 @@ class TestUtils:
         assert "Size" in file_info
         assert "Date" in file_info
 
+    def test_get_file_info_lightweight_with_stat(self, temp_mda_file: Path) -> None:
+        """A given stat result is used instead of stat'ing the file again."""
+        file_stat = temp_mda_file.stat()
+        with patch.object(Path, "stat", side_effect=AssertionError("stat called")):
+            file_info = get_file_info_lightweight(temp_mda_file, file_stat)
+
+        assert file_info["Size"] == 13
+
     def test_get_file_info_full(self, temp_mda_file: Path) -> None:
         """Test full file info extraction."""
         # This test might fail if the file is not a valid MDA file
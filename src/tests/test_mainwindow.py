@@ -48,6 +48,30 @@ def create_mock_settings():
     return mock_get_key
 
 
+def progressive_scan_updates(folder: Path) -> list:
+    """Partial results of a scan of three MDA files copied to a folder."""
+    import shutil
+
+    from mdaviz.lazy_folder_scanner import FolderScanWorker
+
+    data_folder = Path(__file__).parent / "data" / "test_folder1"
+    for name in ("mda_0001.mda", "mda_0002.mda", "mda_0003.mda"):
+        shutil.copy(data_folder / name, folder / name)
+    worker = FolderScanWorker(
+        folder,
+        batch_size=1,
+        max_files=100,
+        use_lightweight_scan=True,
+        progressive_loading=True,
+    )
+    updates = []
+    worker.progressive_update.connect(updates.append)
+    with patch("mdaviz.lazy_folder_scanner.PROGRESSIVE_UPDATE_INTERVAL_S", 0):
+        worker.scan()
+    assert updates[0].updated_rows is None and len(updates) == 3
+    return updates
+
+
 class TestMainWindow:
     """Test cases for MainWindow functionality without GUI dependencies."""
 
@@ -400,6 +424,76 @@ class TestMainWindow:
 
     # Fit-related methods removed - functionality handled in mda_file_viz.ui and fit_manager.py
 
+    def test_mainwindow_progressive_scan_updates(
+        self, qapp: QApplication, tmp_path: Path
+    ) -> None:
+        """Partial scan results create the folder table with placeholder rows,
+        then replace the rows read without resetting the model."""
+        updates = progressive_scan_updates(tmp_path)
+        mock_get_key = create_mock_settings()
+        with (
+            patch(
+                "mdaviz.mainwindow.settings.getKey",
+                # No saved splitter sizes or table columns
+                side_effect=lambda key: None if "/" in key else mock_get_key(key),
+            ),
+            patch(
+                "mdaviz.mainwindow.settings.fileName",
+                return_value="/tmp/test_settings.ini",
+            ),
+            # Runs after the test, once the settings are no longer patched
+            patch.object(MainWindow, "_auto_load_first_folder"),
+        ):
+            window = MainWindow()
+            window.lazy_scanner.progressive_scan_update.emit(updates[0])
+
+            assert window.mvc_folder is not None
+            model = window.mvc_folder.mda_folder_tableview.tableView.model()
+            model = model.sourceModel()
+            assert model.rowCount() == 3
+            assert not window.mdaInfoList()[1]["Dim"]
+
+            resets = []
+            model.modelReset.connect(lambda: resets.append(True))
+            for update in updates[1:]:
+                window.lazy_scanner.progressive_scan_update.emit(update)
+
+            assert resets == []
+            assert model.rowCount() == 3
+            assert window.mdaInfoList()[1]["Dim"]
+
+    def test_mainwindow_progressive_scan_priority(
+        self, qapp: QApplication, tmp_path: Path
+    ) -> None:
+        """The folder table created by the first partial result reports its
+        visible rows to the running scan."""
+        from PyQt6.QtTest import QTest
+
+        from mdaviz.mda_folder_table_view import VIEWPORT_REPORT_DELAY_MS
+
+        updates = progressive_scan_updates(tmp_path)
+        mock_get_key = create_mock_settings()
+        with (
+            patch(
+                "mdaviz.mainwindow.settings.getKey",
+                side_effect=lambda key: None if "/" in key else mock_get_key(key),
+            ),
+            patch(
+                "mdaviz.mainwindow.settings.fileName",
+                return_value="/tmp/test_settings.ini",
+            ),
+            patch.object(MainWindow, "_auto_load_first_folder"),
+        ):
+            window = MainWindow()
+            with patch.object(window.lazy_scanner, "set_scan_priority") as priority:
+                window.lazy_scanner.progressive_scan_update.emit(updates[0])
+                QTest.qWait(3 * VIEWPORT_REPORT_DELAY_MS)
+
+            assert priority.called
+            folder_path, visible_names = priority.call_args.args[:2]
+            assert Path(folder_path) == tmp_path
+            assert "mda_0001.mda" in visible_names
+
     def test_mainwindow_connect_method(self, qapp: QApplication) -> None:
         """Test connect method."""
         with (
@@ -0,0 +1,150 @@
+"""Tests for mdaviz.mda_folder_table_model."""
+
+import math
+import random
+import time
+from types import SimpleNamespace
+
+from PyQt6.QtCore import QItemSelectionModel, Qt
+
+from mdaviz.mda_folder import MDA_MVC
+from mdaviz.mda_folder_table_model import MDAFolderTableModel
+from mdaviz.mda_folder_table_view import FolderSortProxyModel
+
+
+def _row(name, points=None):
+    return {"Name": name, "Prefix": "scan", "Points": points}
+
+
+def _record(model):
+    """Record the model notifications as (signal, first, last) tuples."""
+    events = []
+    model.rowsInserted.connect(lambda parent, a, b: events.append(("insert", a, b)))
+    model.rowsRemoved.connect(lambda parent, a, b: events.append(("remove", a, b)))
+    model.dataChanged.connect(
+        lambda tl, br, roles: events.append(("changed", tl.row(), br.row()))
+    )
+    model.modelReset.connect(lambda: events.append(("reset",)))
+    return events
+
+
+def test_bulk_row_changes(qapp):
+    """Rows are inserted, changed and removed with one notification per run."""
+    data = [_row(f"f{i}") for i in range(3)]
+    model = MDAFolderTableModel(data, None)
+    events = _record(model)
+
+    model.appendRows([_row("f3"), _row("f4")])
+    model.updateRows({0: _row("f0", 5), 1: _row("f1", 6), 4: _row("f4", 7)})
+    model.removeFileRows([1, 2, 4])
+
+    assert events == [
+        ("insert", 3, 4),
+        ("changed", 0, 1),
+        ("changed", 4, 4),
+        ("remove", 4, 4),
+        ("remove", 1, 2),
+    ]
+    assert [info["Name"] for info in data] == ["f0", "f3"]
+    assert data[0]["Points"] == 5
+
+
+def test_coalesced_row_update(qapp):
+    """Scattered rows can be updated with a single dataChanged."""
+    data = [_row(f"f{i}") for i in range(6)]
+    model = MDAFolderTableModel(data, None)
+    events = _record(model)
+
+    model.updateRows({4: _row("f4", 9), 1: _row("f1", 8)}, coalesce=True)
+    model.updateRows({}, coalesce=True)
+
+    assert events == [("changed", 1, 4)]
+    assert [info["Points"] for info in data] == [None, 8, None, None, 9, None]
+
+
+def test_merge_folder_rows_keeps_selection(qapp):
+    """Merging scan results updates the table in place and keeps the selection."""
+    names = [f"f{i}" for i in range(5)]
+    info_list = [_row(name) for name in names]
+    model = MDAFolderTableModel(info_list, None)
+    proxy = FolderSortProxyModel()
+    proxy.setSourceModel(model)
+    selection = QItemSelectionModel(proxy)
+    selection.setCurrentIndex(
+        proxy.mapFromSource(model.index(3, 0)),
+        QItemSelectionModel.SelectionFlag.ClearAndSelect,
+    )
+    mvc = SimpleNamespace(
+        mda_folder_tableview=SimpleNamespace(proxyModel=proxy),
+        mdaFileList=lambda: names,
+        mdaInfoList=lambda: info_list,
+    )
+    events = _record(model)
+
+    # Progressive update: only the listed positions are merged
+    update = [_row(name, 9) for name in names]
+    assert MDA_MVC.mergeFolderRows(mvc, names, update, updated_rows=[2, 3])
+    assert [info["Points"] for info in info_list] == [None, None, 9, 9, None]
+
+    # Complete result: f1 vanished, f5 is new, f4 changed
+    final = ["f0", "f2", "f3", "f4", "f5"]
+    final_info = [info_list[0], info_list[2], info_list[3], _row("f4", 1), _row("f5")]
+    assert MDA_MVC.mergeFolderRows(mvc, final, final_info)
+
+    assert names == final
+    assert [info["Name"] for info in info_list] == final
+    assert info_list[3]["Points"] == 1
+    assert ("reset",) not in events
+    assert events[-3:] == [("remove", 1, 1), ("changed", 3, 3), ("insert", 4, 4)]
+    current = proxy.mapToSource(selection.currentIndex())
+    assert names[current.row()] == "f3"
+
+
+def test_display_formats_raw_values(qapp):
+    """Raw values are formatted for display and returned as sort keys."""
+    info = {"Name": "a.mda", "Scan #": 12, "Points": None, "Size": 2048}
+    model = MDAFolderTableModel([info], None)
+    labels = list(model.columnLabels)
+
+    def cell(label, role):
+        return model.data(model.index(0, labels.index(label)), role)
+
+    assert cell("Size", Qt.ItemDataRole.DisplayRole) == "2.00 kB"
+    assert cell("Points", Qt.ItemDataRole.DisplayRole) == ""
+    assert cell("Size", Qt.ItemDataRole.UserRole) == 2048.0
+    assert cell("Points", Qt.ItemDataRole.UserRole) == -math.inf
+
+
+def test_proxy_sort_large_folder(qapp):
+    """Sorting 20k rows by a numeric column is correct, fast and keeps selection."""
+    rng = random.Random(0)
+    info_list = [
+        {"Name": f"f{i:05d}.mda", "Size": rng.randrange(10**6), "Date": float(i)}
+        for i in range(20_000)
+    ]
+    model = MDAFolderTableModel(info_list, None)
+    proxy = FolderSortProxyModel()
+    proxy.setSourceModel(model)
+    selection = QItemSelectionModel(proxy)
+    selection.setCurrentIndex(
+        proxy.mapFromSource(model.index(1234, 0)),
+        QItemSelectionModel.SelectionFlag.ClearAndSelect,
+    )
+    size_column = model.columnLabels.index("Size")
+
+    start = time.perf_counter()
+    proxy.sort(size_column, Qt.SortOrder.DescendingOrder)
+    elapsed = time.perf_counter() - start
+
+    sizes = [
+        info_list[proxy.mapToSource(proxy.index(row, 0)).row()]["Size"]
+        for row in range(proxy.rowCount())
+    ]
+    assert sizes == sorted(sizes, reverse=True)
+    assert elapsed < 0.5
+    assert proxy.mapToSource(selection.currentIndex()).row() == 1234
+
+    # Appended rows are placed in sort order
+    model.appendRows([{"Name": "big.mda", "Size": 10**7, "Date": 0.0}])
+    assert proxy.mapToSource(proxy.index(0, 0)).row() == 20_000
+    assert proxy.mapToSource(selection.currentIndex()).row() == 1234
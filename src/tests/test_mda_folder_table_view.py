@@ -0,0 +1,58 @@
+"""Tests for mdaviz.mda_folder_table_view."""
+
+from PyQt6.QtCore import Qt
+
+from mdaviz.mda_folder_table_view import MDAFolderTableView
+from mdaviz.user_settings import settings
+
+
+class _FolderMVC:
+    """Minimal stand-in for MDA_MVC (the view only asks for the folder rows and names)."""
+
+    def __init__(self, info_list):
+        self.info_list = info_list
+
+    def mdaInfoList(self):
+        return self.info_list
+
+    def mdaFileList(self):
+        return [info["Name"] for info in self.info_list]
+
+    def setStatus(self, text):
+        pass
+
+
+def test_viewport_state(qapp, monkeypatch):
+    """The view reports its visible rows (in display order) and sort order."""
+    monkeypatch.setattr(settings, "getKey", lambda key: False)
+    info_list = [
+        {
+            "Name": f"scan_{i:04d}.mda",
+            "Date": 1.7e9 + 60.0 * i,
+        }
+        for i in range(200)
+    ]
+    view = MDAFolderTableView(_FolderMVC(info_list))
+    view.resize(400, 300)
+    view.displayTable()
+    view.show()
+    qapp.processEvents()
+
+    state = view.viewportState()
+    assert state.sort_column is None
+    assert state.first_row == 0 and 0 < state.last_row < 199
+    assert state.visible_names[0] == "scan_0000.mda"
+    assert len(state.visible_names) == state.last_row + 1
+
+    view.proxyModel.sort(4, Qt.SortOrder.DescendingOrder)  # Date
+    state = view.viewportState()
+    assert (state.sort_column, state.descending) == ("Date", True)
+    assert state.visible_names[:2] == ["scan_0199.mda", "scan_0198.mda"]
+
+    reports = []
+    view.viewportChanged.connect(lambda: reports.append(True))
+    view.tableView.verticalScrollBar().setValue(50)
+    view._viewport_timer.timeout.emit()
+    assert reports == [True]
+    assert view.viewportState().scroll_position == 50
+    view.close()
@@ -0,0 +1,105 @@
+"""Tests for mdaviz.paged_info_list."""
+
+import os
+from pathlib import Path
+
+from PyQt6.QtCore import Qt
+
+from mdaviz.lazy_folder_scanner import FolderScanResult, FolderScanWorker
+from mdaviz.mda_folder_table_model import MDAFolderTableModel
+from mdaviz.mda_folder_table_view import FolderSortProxyModel
+from mdaviz.paged_info_list import PagedInfoList
+
+
+def _make_folder(folder: Path, n_files: int) -> None:
+    """Create n_files MDA files, the last ones modified first."""
+    folder.mkdir(exist_ok=True)
+    for i in range(n_files):
+        path = folder / f"scan_{i:04d}.mda"
+        path.write_bytes(b"x" * i)
+        os.utime(path, (1e9 - i, 1e9 - i))
+
+
+def _paged(folder: Path, **kwargs) -> PagedInfoList:
+    paths = sorted(folder.glob("*.mda"))
+    return PagedInfoList.from_entries(
+        folder, [(path, path.stat()) for path in paths], **kwargs
+    )
+
+
+def test_rows_read_on_demand(tmp_path: Path) -> None:
+    """Rows are read when accessed and at most cache_rows are kept."""
+    _make_folder(tmp_path, 50)
+    rows = _paged(tmp_path, cache_rows=10)
+
+    assert len(rows) == 50 and rows.reads == 0
+    assert rows[7]["Name"] == "scan_0007.mda"
+    assert rows[7]["Size"] == 7
+    assert rows.reads == 1
+    assert rows.load(range(20)) == 19  # row 7 is already read
+    assert not rows.isLoaded(0) and rows.isLoaded(19)
+
+    assert list(rows.sortKeys("Size")) == list(range(50))
+    assert rows.sortKeys("Points") is None
+
+
+def test_edits_keep_columns_aligned(tmp_path: Path) -> None:
+    """Rows can be appended, replaced and deleted like a list."""
+    _make_folder(tmp_path, 5)
+    rows = _paged(tmp_path)
+    new = {"Name": "new.mda", "Date": 5.0, "Size": 123, "Points": 3}
+
+    rows.extend([new])
+    del rows[1:3]
+    rows[0] = dict(rows[0], Points=9)
+
+    assert rows.names == ["scan_0000.mda", "scan_0003.mda", "scan_0004.mda", "new.mda"]
+    assert list(rows.sortKeys("Size")) == [0, 3, 4, 123]
+    assert rows[-1] is new and rows[0]["Points"] == 9
+
+
+def test_proxy_fetches_pages(tmp_path: Path, qapp) -> None:
+    """The proxy shows one page at a time and reads only the rows it shows."""
+    _make_folder(tmp_path, 250)
+    rows = _paged(tmp_path)
+    model = MDAFolderTableModel(rows, None)
+    proxy = FolderSortProxyModel(page_size=100)
+    proxy.setSourceModel(model)
+
+    assert proxy.rowCount() == 100 and rows.reads == 100
+    assert proxy.canFetchMore()
+    proxy.fetchMore()
+    proxy.fetchMore()
+    assert proxy.rowCount() == 250 and not proxy.canFetchMore()
+
+    # Sorting on a listing column covers all rows without reading them again
+    rows.clearCache()
+    date_column = model.columnLabels.index("Date")
+    proxy.sort(date_column, Qt.SortOrder.DescendingOrder)
+    assert rows.reads == 250
+    first = proxy.mapToSource(proxy.index(0, 0)).row()
+    assert rows.names[first] == "scan_0000.mda"
+
+    # Columns read from the files are not sortable: natural order
+    proxy.sort(model.columnLabels.index("Points"))
+    assert proxy.mapToSource(proxy.index(3, 0)).row() == 3
+
+
+def test_large_folder_scan_is_paged(tmp_path: Path, qapp) -> None:
+    """A folder of more than max_files files is listed without reading files."""
+    _make_folder(tmp_path, 30)
+    worker = FolderScanWorker(
+        tmp_path,
+        batch_size=10,
+        max_files=10,
+        use_lightweight_scan=True,
+        paged=True,
+    )
+    results: list[FolderScanResult] = []
+    worker.complete.connect(results.append)
+    worker.scan()
+
+    rows = results[0].file_info_list
+    assert isinstance(rows, PagedInfoList)
+    assert results[0].file_list == [f"scan_{i:04d}.mda" for i in range(30)]
+    assert rows.reads == 0
@@ -1,5 +1,9 @@
 """Tests for mdaviz.utils."""
 
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 from PyQt6.QtWidgets import QVBoxLayout, QWidget, QSpacerItem, QSizePolicy
 
 from mdaviz import utils
@@ -23,3 +27,90 @@ def test_removeAllLayoutWidgets_skips_spacer(qtbot):
     # No crash; widget should have been removed (setParent(None))
     assert widget.parent() is None
     assert layout.count() == 1  # spacer item remains (we only remove widgets)
+
+
+def test_get_scan_2d_shares_inner_detectors():
+    """get_scan_2d reuses the inner detector entries and stores no index lists."""
+    from pathlib import Path
+    from mdaviz.synApps_mdalib.mda import readMDA
+
+    mda_file = Path(__file__).parent / "data" / "mda 2D plus" / "Kappa_0005.mda"
+    _, dim1, dim2 = readMDA(str(mda_file))[:3]
+
+    inner, _, _ = utils.get_scan(dim2)
+    scan_2d, _, first_det = utils.get_scan_2d(dim1, dim2, inner)
+    detectors = [v for v in scan_2d.values() if v["type"] == "DET"]
+    assert detectors
+    inner_entries = [id(v) for v in inner.values()]
+    assert all(id(v) in inner_entries for v in detectors)
+
+    # Index positioner is computed on demand
+    index = scan_2d[max(scan_2d)]
+    assert index["name"] == "Index"
+    assert isinstance(index["data"], range)
+    assert len(index["data"]) == dim1.curr_pt * dim2.curr_pt
+    assert isinstance(inner[0]["data"], range)
+
+    # Without inner datasets, entries are built as before
+    scan_2d_alone, _, _ = utils.get_scan_2d(dim1, dim2)
+    assert scan_2d_alone.keys() == scan_2d.keys()
+    for key, value in scan_2d_alone.items():
+        assert value["name"] == scan_2d[key]["name"]
+        assert value["data"] is scan_2d[key]["data"] or value["type"] == "POS"
+
+
+DATA_PATH = Path(__file__).parent / "data"
+
+
+@pytest.mark.parametrize(
+    "folder", ["test_folder1", "test_no_positioner", "mda 2D plus"]
+)
+def test_get_file_info_header_matches_full_reader(folder):
+    """The header-only reader fills the folder table like the full reader."""
+    files = sorted((DATA_PATH / folder).glob("*.mda"))
+    assert files
+    with patch.object(utils, "readMDA", side_effect=AssertionError("data read")):
+        header_rows = [utils.get_file_info_header(path) for path in files]
+    assert header_rows == [utils.get_file_info_full(path) for path in files]
+
+
+def test_read_mda_header_names(tmp_path):
+    """Positioner and detector names come from the outer scan header; files
+    that are not MDA files give the minimal folder table row."""
+    path = sorted((DATA_PATH / "mda 2D plus").glob("*.mda"))[-1]
+    header = utils.read_mda_header(path)
+    _, dim1, *_ = utils.readMDA(str(path))
+    assert header["positioners"] == [
+        (utils.byte2str(p.name).strip(), utils.byte2str(p.desc).strip()) for p in dim1.p
+    ]
+    assert [name for name, _ in header["detectors"]] == [
+        utils.byte2str(d.name).strip() for d in dim1.d
+    ]
+
+    not_mda = tmp_path / "not_mda.mda"
+    not_mda.write_bytes(b"not an MDA file")
+    assert utils.read_mda_header(not_mda) is None
+    file_info = utils.get_file_info_header(not_mda)
+    assert (file_info["Points"], file_info["Positioners"]) == (0, "")
+
+
+def test_read_mda_environment_selected_pvs():
+    """Only the selected environment PVs are decoded, with the values of readMDA."""
+    path = DATA_PATH / "mda 2D plus" / "19971234.mda"
+    metadata = utils.readMDA(str(path))[0]
+    environment = {
+        utils.byte2str(name): value
+        for name, value in metadata.items()
+        if name not in metadata["ourKeys"]
+    }
+    numeric = next(name for name, value in environment.items() if value[3] == 34)
+    values = utils.read_mda_environment(path, [numeric, "not:a:pv"])
+    assert values == {numeric: f"{environment[numeric][2][0]:g}"}
+
+    file_info = utils.get_file_info_header(
+        path, search_terms=True, environment_pvs=[numeric]
+    )
+    header = utils.read_mda_header(path)
+    assert f"scan={header['scan_number']}" in file_info["Terms"]
+    assert header["positioners"][0][0].lower() in file_info["Terms"]
+    assert f"{numeric}={values[numeric]}".lower() in file_info["Terms"]